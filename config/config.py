@@ -4,6 +4,9 @@ SCREEN_HEIGHT = 900
 ASPECT_RATIO = SCREEN_WIDTH / SCREEN_HEIGHT
 FULLSCREEN = False
 
+# Rysowanie na stałym płótnie SCREEN_WIDTH x SCREEN_HEIGHT skalowanym przez SDL (pygame.SCALED) do rozmiaru okna
+LOGICAL_CANVAS = True
+
 # [UI ELEMENTS]
 BACKGROUND_COLOR = ( 43,45,48 )
 BACKGROUND_PAUSE_COLOR = ( 33, 35, 38, 128)
@@ -11,6 +14,7 @@ BUTTON_COLOR = ( 67,69,74 )
 TEXT_COLOR = ( 255,255,255 )
 SLIDER_COLOR = ( 200,200,200 )
 FONT_SIZE = 48
+TEXT_CACHE_SIZE = 256
 LEVEL_LOAD_BUTTON_WIDTH = 240
 LEVEL_LOAD_BUTTON_HEIGHT = 120
 PADDING = 40
@@ -34,6 +38,7 @@ PLAYER_INNER_SIZE = PLAYER_OUTER_SIZE - 15
 # [GAME VARIABLES]
 PLAYER_SPEED = 500
 PLAYER_START_X = 120
+PLAYER_RESET_X = 90
 LEVEL_BEGIN_X = 120
 MIN_LEVEL_LENGTH = 1020
 END_WALL_X = 480
@@ -42,6 +47,41 @@ FLOOR_Y = 720
 
 RENDER_MARGIN = 100
 
+# Statyczna geometria poziomu wypiekana w pasy o szerokości CHUNK_WIDTH (w jednostkach świata)
+CHUNK_WIDTH = 512
+CHUNK_PREFETCH = 3
+CHUNK_CACHE_BUDGET_MB = 64
+
+# Długie poziomy (.gds) wczytywane są segmentami o szerokości SEGMENT_WIDTH wokół gracza
+SEGMENT_WIDTH = 1920
+STREAM_SEGMENTS_AHEAD = 2
+STREAM_SEGMENTS_BEHIND = 1
+
+# [PHYSICS]
+PHYSICS_TICK_RATE = 240
+PHYSICS_TIMESTEP = 1 / PHYSICS_TICK_RATE
+
+# Fizyka liczona jest ze stałym krokiem niezależnie od liczby klatek rysowania
+RENDER_FPS = 60
+# Najdłuższy czas klatki przekazywany do fizyki - po zawieszeniu okna gra nie nadrabia setek kroków
+MAX_FRAME_TIME = 0.25
+
+# [REPLAY]
+# Wejście ostatniej próby zapisywane jest po śmierci lub ukończeniu poziomu (ścieżka względem katalogu projektu)
+RECORD_REPLAYS = True
+REPLAY_PATH = "replays/last_attempt.gdr"
+
+# [LEVEL CACHE]
+# Skompilowane struktury poziomów zapisywane na dysku (ścieżka względem katalogu projektu); najdawniej używane
+# wpisy są usuwane po przekroczeniu rozmiaru albo wieku
+LEVEL_CACHE_PATH = "cache/levels"
+LEVEL_CACHE_BUDGET_MB = 128
+LEVEL_CACHE_MAX_AGE_DAYS = 30
+
+# [PRACTICE]
+# Ile ostatnich sekund gry można przewinąć w trybie ćwiczeń (strzałki w lewo/prawo)
+REWIND_SECONDS = 10
+
 # [GAME OBJECTS COLORS]
 BLOCK_OUTER_COLOR = ( 64,64,64 )
 BLOCK_INNER_COLOR = ( 44,44,44 )
@@ -76,4 +116,10 @@ GRID_COLOR = ( 130,130,130,50 )
 GRID_START_LINE_COLOR = ( 200,200,200 )
 HIGHLIGHT_COLOR = ( 255,255,255 )
 MAX_SLIDER_X = 2520
-SLIDER_MARGIN = 180
\ No newline at end of file
+SLIDER_MARGIN = 180
+
+# Po tylu zmianach zapisanych w dzienniku edytor przepisuje w tle plik poziomu
+JOURNAL_COMPACT_EDITS = 500
+# Budżet sprawdzania w tle, czy zapisany poziom da się ukończyć - po jego przekroczeniu wynik jest nierozstrzygnięty
+SOLVER_TIME_BUDGET = 10
+SOLVER_MAX_STATES = 200000
@@ -0,0 +1,270 @@
+import numpy as np
+
+from config import config
+from game.engine import Engine
+from game.level_compiler import OBJECT_CODES, LevelObjects
+
+from objects.block import Block
+from objects.spike import Spike
+from objects.jump_pad import JumpPad
+from objects.jump_orb import JumpOrb
+
+"""Symulacja wielu graczy naraz na tablicach NumPy, zgodna z fizyką Engine.step."""
+class BatchSimulator:
+    def __init__(self, engine: Engine, count: int, dt: float = config.PHYSICS_TIMESTEP):
+        assert isinstance(engine, Engine), "engine musi być instancją klasy Engine"
+        assert isinstance(count, int) and count > 0, "count musi być dodatnią liczbą całkowitą"
+        assert isinstance(dt, float) and dt > 0, "dt musi być dodatnią liczbą zmiennoprzecinkową"
+
+        self.count = count
+        self.dt = dt
+
+        # Stałe fizyki Engine (skala 1.0, czyli jednostki świata jak w Engine.step)
+        self.gravity_step = (engine.gravity * 1.0) * dt
+        self.jump_velocity = (engine.jump_force * 1) * 1.0
+        self.pad_velocity = (engine.jump_force * engine.jump_pad_multiplier) * 1.0
+        self.orb_velocity = (engine.jump_force * engine.jump_orb_multiplier) * 1.0
+        self.speed_step = config.PLAYER_SPEED * dt
+
+        self.floor_y = engine.get_world_floor_y()
+        self.level_end_x = engine.get_furthest_object_x()
+
+        self.player_half = config.PLAYER_OUTER_SIZE // 2
+        self.object_half = config.BLOCK_OUTER_SIZE // 2
+        self.spike_half_width = config.SPIKE_OUTER_WIDTH // 2
+        self.spike_half_height = config.SPIKE_OUTER_HEIGHT // 2
+
+        # Kolumny obiektów poziomu posortowane po x: typ -> (xs, ys)
+        objects = LevelObjects.from_objects(engine.objects)
+        self.columns = {
+            Block: self._build_columns(objects, Block),
+            Spike: self._build_columns(objects, Spike),
+            JumpPad: self._build_columns(objects, JumpPad),
+            JumpOrb: self._build_columns(objects, JumpOrb)
+        }
+
+        self.start_x = config.PLAYER_RESET_X
+        self.start_y = self.floor_y - self.player_half
+
+        self.tick = 0
+        self.x = np.empty(count)
+        self.y = np.empty(count)
+        self.velocity_y = np.empty(count)
+        self.on_ground = np.empty(count, dtype=bool)
+        self.alive = np.empty(count, dtype=bool)
+        self.finished = np.empty(count, dtype=bool)
+        self.death_tick = np.empty(count, dtype=np.int64)
+        self.death_x = np.empty(count)
+        self.finish_tick = np.empty(count, dtype=np.int64)
+
+        self.reset()
+
+    """Ustawia wszystkich graczy w pozycji startowej."""
+    def reset(self):
+        self.tick = 0
+        self.x.fill(self.start_x)
+        self.y.fill(self.start_y)
+        self.velocity_y.fill(0)
+        self.on_ground.fill(True)
+        self.alive.fill(True)
+        self.finished.fill(False)
+        self.death_tick.fill(-1)
+        self.death_x.fill(np.nan)
+        self.finish_tick.fill(-1)
+
+    """Zwraca maskę graczy, którzy wciąż biorą udział w symulacji."""
+    def active(self) -> np.ndarray:
+        return self.alive & ~self.finished
+
+    """Wykonuje jeden krok symulacji dla wszystkich aktywnych graczy."""
+    def step(self, jump_pressed: np.ndarray) -> np.ndarray:
+        """ Args:
+                jump_pressed: Tablica bool (count,) - czy dany gracz trzyma skok w tym kroku
+            Returns:
+                Maska graczy, którzy zginęli w tym kroku
+        """
+        jump_pressed = np.asarray(jump_pressed, dtype=bool)
+        self._validate_jump_pressed(jump_pressed, self.count)
+
+        active = self.active()
+        jump_pressed = jump_pressed & active
+
+        half = self.player_half
+        x, y = self.x, self.y
+
+        # Skok z ziemi
+        jumping = jump_pressed & self.on_ground
+        velocity_y = np.where(jumping, self.jump_velocity, self.velocity_y)
+        on_ground = self.on_ground & ~jumping
+
+        # Grawitacja
+        velocity_y = np.where(active, velocity_y + self.gravity_step, velocity_y)
+
+        new_x = x + self.speed_step
+
+        # Ruch pionowy: lądowanie na najwyższym bloku lub na podłożu
+        new_y = y + velocity_y * self.dt
+        player_bottom = new_y + half
+
+        block_top = np.full(self.count, np.inf)
+        blocks = self._gather(Block, x - half - self.object_half, new_x + half + self.object_half)
+        if blocks is not None:
+            bx, by, valid = blocks
+            top = by - self.object_half
+            bottom = by + self.object_half
+            hit = (valid &
+                   ((x + half)[:, None] >= bx - self.object_half) &
+                   ((x - half)[:, None] <= bx + self.object_half) &
+                   (velocity_y >= 0)[:, None] &
+                   (top <= player_bottom[:, None]) & (player_bottom[:, None] <= bottom))
+            block_top = np.where(hit, top, np.inf).min(axis=1)
+
+        land_block = np.isfinite(block_top) & (velocity_y >= 0) & (player_bottom >= block_top)
+        land_floor = ~land_block & (player_bottom >= self.floor_y)
+        landed = land_block | land_floor
+
+        new_y = np.where(land_block, block_top - half, np.where(land_floor, self.floor_y - half, new_y))
+        y = np.where(active, new_y, y)
+        velocity_y = np.where(active & landed, 0.0, velocity_y)
+        on_ground = np.where(active, landed, on_ground)
+
+        # Ruch poziomy: kolizja z bokiem bloku lub z kolcem kończy próbę
+        died = self._check_horizontal_collision(new_x, y, blocks) & active
+
+        survivors = active & ~died
+        x = np.where(survivors, new_x, x)
+
+        # Jump pady i jump orby
+        orb_hit = self._overlaps_any(JumpOrb, x, y) & jump_pressed & survivors
+        pad_hit = self._overlaps_any(JumpPad, x, y) & on_ground & survivors & ~orb_hit
+
+        velocity_y = np.where(orb_hit, self.orb_velocity, np.where(pad_hit, self.pad_velocity, velocity_y))
+        on_ground = on_ground & ~(orb_hit | pad_hit)
+
+        self.x, self.y, self.velocity_y, self.on_ground = x, y, velocity_y, on_ground
+
+        self.alive &= ~died
+        self.death_tick[died] = self.tick
+        self.death_x[died] = x[died]
+
+        finished = survivors & (x >= self.level_end_x)
+        self.finished |= finished
+        self.finish_tick[finished] = self.tick
+
+        self.tick += 1
+
+        return died
+
+    """Symuluje wszystkich graczy według planu skoków, aż wszyscy zginą, ukończą poziom lub plan się skończy."""
+    def run(self, schedule: np.ndarray) -> int:
+        """ Args:
+                schedule: Tablica bool (ticks, count) z wejściem skoku w każdym kroku
+            Returns:
+                Liczba wykonanych kroków
+        """
+        schedule = np.asarray(schedule, dtype=bool)
+        self._validate_schedule(schedule, self.count)
+
+        for jump_pressed in schedule:
+            if not self.active().any():
+                break
+            self.step(jump_pressed)
+
+        return self.tick
+
+    """Sprawdza kolizje boczne z blokami i kolizje z kolcami na pozycji new_x."""
+    def _check_horizontal_collision(self, new_x: np.ndarray, y: np.ndarray, blocks) -> np.ndarray:
+        half = self.player_half
+        died = np.zeros(self.count, dtype=bool)
+
+        if blocks is not None:
+            bx, by, valid = blocks
+            hit = (valid &
+                   ((new_x + half)[:, None] > bx - self.object_half) &
+                   ((new_x - half)[:, None] < bx + self.object_half) &
+                   ((y + half)[:, None] > by - self.object_half) &
+                   ((y - half)[:, None] < by + self.object_half))
+            died |= hit.any(axis=1)
+
+        # Wierzchołki gracza są obcinane do liczb całkowitych, stąd dodatkowy 1 px zapasu z lewej
+        spikes = self._gather(Spike, new_x - half - self.spike_half_width - 1, new_x + half + self.spike_half_width)
+        if spikes is not None:
+            sx, sy, valid = spikes
+            player_x = new_x.astype(np.int64)[:, None]
+            player_y = y.astype(np.int64)[:, None]
+
+            for corner_x, corner_y in ((-half, -half), (half, -half), (-half, half), (half, half)):
+                inside = self._point_in_spike(sx, sy, player_x + corner_x, player_y + corner_y)
+                died |= (valid & inside).any(axis=1)
+
+        return died
+
+    """Test punktu w trójkącie kolca funkcjami krawędziowymi (dokładny dla liczb całkowitych)."""
+    def _point_in_spike(self, sx: np.ndarray, sy: np.ndarray, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        x1, y1 = sx, sy - self.spike_half_height
+        x2, y2 = sx - self.spike_half_width, sy + self.spike_half_height
+        x3, y3 = sx + self.spike_half_width, sy + self.spike_half_height
+
+        e1 = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+        e2 = (x3 - x2) * (py - y2) - (y3 - y2) * (px - x2)
+        e3 = (x1 - x3) * (py - y3) - (y1 - y3) * (px - x3)
+
+        return ((e1 >= 0) & (e2 >= 0) & (e3 >= 0)) | ((e1 <= 0) & (e2 <= 0) & (e3 <= 0))
+
+    """Sprawdza, czy gracz nachodzi na jakikolwiek obiekt danego typu."""
+    def _overlaps_any(self, obj_type, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        half = self.object_half
+        found = self._gather(obj_type, x - 2 * half, x + 2 * half)
+        if found is None:
+            return np.zeros(self.count, dtype=bool)
+
+        ox, oy, valid = found
+        hit = (valid &
+               ((x + half)[:, None] > ox - half) & ((x - half)[:, None] < ox + half) &
+               ((y + half)[:, None] > oy - half) & ((y - half)[:, None] < oy + half))
+
+        return hit.any(axis=1)
+
+    """Zwraca kandydatów danego typu o x w przedziale [low, high] dla każdego gracza."""
+    def _gather(self, obj_type, low: np.ndarray, high: np.ndarray):
+        """ Returns:
+                Krotka (xs, ys, valid) o kształcie (count, k) albo None, jeśli nikt nie ma kandydatów
+        """
+        xs, ys = self.columns[obj_type]
+        if len(xs) == 0:
+            return None
+
+        start = np.searchsorted(xs, low, side='left')
+        end = np.searchsorted(xs, high, side='right')
+        counts = end - start
+
+        width = int(counts.max())
+        if width == 0:
+            return None
+
+        offsets = np.arange(width)
+        index = np.minimum(start[:, None] + offsets, len(xs) - 1)
+        valid = offsets < counts[:, None]
+
+        return xs[index], ys[index], valid
+
+    @staticmethod
+    def _build_columns(objects: LevelObjects, obj_type) -> tuple:
+        selected = objects.types == OBJECT_CODES[obj_type]
+        xs, ys = objects.xs[selected], objects.ys[selected]
+
+        # Posortowane po (x, y)
+        order = np.lexsort((ys, xs))
+
+        return xs[order].astype(np.int64), ys[order].astype(np.int64)
+
+    # Funkcje walidacyjne
+    @staticmethod
+    def _validate_jump_pressed(jump_pressed, count):
+        if jump_pressed.shape != (count,):
+            raise ValueError("jump_pressed musi mieć kształt (count,)")
+
+    @staticmethod
+    def _validate_schedule(schedule, count):
+        if schedule.ndim != 2 or schedule.shape[1] != count:
+            raise ValueError("schedule musi mieć kształt (ticks, count)")
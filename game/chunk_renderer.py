@@ -0,0 +1,313 @@
+import math, queue, threading
+import numpy as np
+import pygame
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from config import config
+from game.level_compiler import OBJECT_CLASSES, LevelObjects
+
+from objects.sprite_cache import SpriteCache
+
+# Nazwy klas (klucze wzorców SpriteCache) w kolejności kodów typów
+OBJECT_NAMES = tuple(obj_class.__name__ for obj_class in OBJECT_CLASSES)
+
+"""Rysuje statyczną geometrię poziomu z wypiekanych pasów (chunków) o stałej szerokości."""
+class ChunkRenderer:
+    def __init__(self, sprite_cache: SpriteCache,
+                 chunk_width: int = config.CHUNK_WIDTH,
+                 prefetch: int = config.CHUNK_PREFETCH,
+                 budget_bytes: int = config.CHUNK_CACHE_BUDGET_MB * 1024 * 1024):
+
+        assert isinstance(sprite_cache, SpriteCache), "sprite_cache musi być instancją SpriteCache"
+        assert isinstance(chunk_width, int) and chunk_width > 0, "chunk_width musi być dodatnią liczbą całkowitą"
+        assert isinstance(prefetch, int) and prefetch >= 0, "prefetch musi być nieujemną liczbą całkowitą"
+        assert isinstance(budget_bytes, int) and budget_bytes > 0, "budget_bytes musi być dodatnią liczbą całkowitą"
+
+        self.sprite_cache = sprite_cache
+        self.chunk_width = chunk_width
+        self.prefetch = prefetch
+        self.budget_bytes = budget_bytes
+
+        # Lista obiektów, z której zbudowano wpisy (Engine porównuje ją z engine.objects)
+        self.source: Optional[list] = None
+
+        # Kolumny obiektów posortowane po x: x, kod typu, y, kolejność w poziomie
+        self.entries: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] = self._build_entries([])
+
+        # Indeks chunka -> (powierzchnia albo None dla pustego pasa, y w pikselach okna, rozmiar w bajtach)
+        self.chunks: "OrderedDict[int, Tuple[Optional[pygame.Surface], int, int]]" = OrderedDict()
+        self.cache_bytes = 0
+        self.screen_size: Optional[Tuple[int, int]] = None
+
+        # Zmiana poziomu lub rozmiaru okna zwiększa generation - wyniki starszych zadań są odrzucane
+        self.generation = 0
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.jobs: "queue.Queue[Optional[Tuple[int, int]]]" = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+        self.worker_available = True
+
+    """Ustawia obiekty poziomu i unieważnia wypieczone chunki."""
+    def set_objects(self, objects: list):
+        """ Args:
+                objects: Obiekty poziomu (LevelObjects albo lista Block, Spike, JumpPad, JumpOrb)
+        """
+        entries = self._build_entries(objects)
+
+        with self.lock:
+            self.source = objects
+            self.entries = entries
+            self._invalidate_locked()
+
+    """Buduje posortowane po x kolumny wpisów; z LevelObjects bez tworzenia obiektów gry."""
+    @staticmethod
+    def _build_entries(objects) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        if isinstance(objects, LevelObjects):
+            xs, types, ys = objects.xs, objects.types, objects.ys
+        else:
+            xs = np.fromiter((obj.x for obj in objects), dtype=np.float64, count=len(objects))
+            types = np.fromiter((OBJECT_NAMES.index(obj.__class__.__name__) for obj in objects), dtype=np.uint8, count=len(objects))
+            ys = np.fromiter((obj.y for obj in objects), dtype=np.float64, count=len(objects))
+
+        # Sortowanie stabilne - obiekty w tym samym x zachowują kolejność z układu poziomu
+        order = np.argsort(xs, kind="stable")
+
+        return xs[order], types[order], ys[order], order
+
+    """Usuwa wszystkie wypieczone chunki."""
+    def invalidate(self):
+        with self.lock:
+            self._invalidate_locked()
+
+    """Rysuje widoczne chunki i zleca wypiekanie kolejnych przed kamerą; niewypieczone widoczne chunki są w tej klatce rysowane z wzorców obiektów."""
+    def draw(self, screen: pygame.Surface, camera_offset_x: float):
+        """ Args:
+                screen: Powierzchnia do rysowania
+                camera_offset_x: Przesunięcie kamery w jednostkach świata
+        """
+        self._validate_screen(screen)
+
+        screen_size = screen.get_size()
+        if screen_size != self.screen_size:
+            self.sprite_cache.update(screen)
+            with self.lock:
+                self.screen_size = screen_size
+                self._invalidate_locked()
+
+        scale_x = screen_size[0] / config.SCREEN_WIDTH
+        camera_px = math.floor(camera_offset_x * scale_x)
+
+        first = math.floor(-camera_offset_x / self.chunk_width)
+        last = math.floor((config.SCREEN_WIDTH - camera_offset_x - 1) / self.chunk_width)
+
+        self._start_worker()
+
+        blit_sequence = []
+        missing = []
+        for index in range(first, last + 1):
+            chunk = self._get_chunk(index)
+            if chunk is None:
+                missing.append(index)
+            elif chunk[0] is not None:
+                blit_sequence.append((chunk[0], (self._chunk_left_px(index, scale_x) + camera_px, chunk[1])))
+
+        screen.blits(blit_sequence, False)
+
+        for index in missing:
+            self._draw_direct(screen, index, camera_px)
+
+        self._evict(first, last)
+        self._schedule(missing + list(range(last + 1, last + 1 + self.prefetch)))
+
+    """Zatrzymuje wątek wypiekający chunki."""
+    def close(self):
+        if self.worker is not None:
+            self.jobs.put(None)
+            self.worker.join()
+            self.worker = None
+
+    """Zwraca chunk z pamięci podręcznej; bez wątku wypieka go od razu, a z wątkiem zwraca None - chunk wypieka wątek."""
+    def _get_chunk(self, index: int) -> Optional[Tuple[Optional[pygame.Surface], int]]:
+        with self.lock:
+            chunk = self.chunks.get(index)
+            if chunk is not None:
+                self.chunks.move_to_end(index)
+                return chunk[0], chunk[1]
+
+            if self.worker is not None:
+                return None
+
+            job = self._snapshot_locked()
+
+        chunk = self._bake(index, *job)
+
+        with self.lock:
+            self._store_locked(index, chunk)
+
+        return chunk[0], chunk[1]
+
+    """Rysuje obiekty niewypieczonego chunka prosto z wzorców, przycięte do jego pasa - tak samo jak wypieczony chunk."""
+    def _draw_direct(self, screen: pygame.Surface, index: int, camera_px: int):
+        with self.lock:
+            job = self._snapshot_locked()
+
+        blit_sequence, left_px, width_px = self._chunk_blits(index, *job)
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(pygame.Rect(left_px + camera_px, 0, width_px, screen.get_height()).clip(previous_clip))
+        screen.blits([(surface, (x + left_px + camera_px, y)) for surface, (x, y) in blit_sequence], False)
+        screen.set_clip(previous_clip)
+
+    """Dodaje do kolejki wątku chunki, których jeszcze nie ma w pamięci podręcznej."""
+    def _schedule(self, indices):
+        with self.lock:
+            for index in indices:
+                key = (self.generation, index)
+                if index in self.chunks or key in self.pending:
+                    continue
+
+                self.pending.add(key)
+                self.jobs.put(key)
+
+        self._start_worker()
+
+        # Bez wątków (np. build przeglądarkowy) wypiekany jest jeden chunk na klatkę
+        if not self.worker_available:
+            self._run_next_job()
+
+    def _start_worker(self):
+        if self.worker is not None or not self.worker_available:
+            return
+
+        worker = threading.Thread(target=self._worker_loop, name="ChunkRenderer", daemon=True)
+        try:
+            worker.start()
+        except RuntimeError:
+            self.worker_available = False
+            return
+
+        self.worker = worker
+
+    def _worker_loop(self):
+        while self._run_next_job(block=True):
+            pass
+
+    """Wykonuje jedno zadanie z kolejki; zwraca False, jeśli wątek ma się zakończyć."""
+    def _run_next_job(self, block: bool = False) -> bool:
+        try:
+            key = self.jobs.get(block)
+        except queue.Empty:
+            return False
+
+        if key is None:
+            return False
+
+        generation, index = key
+        with self.lock:
+            if generation != self.generation or index in self.chunks:
+                self.pending.discard(key)
+                return True
+
+            job = self._snapshot_locked()
+
+        chunk = self._bake(index, *job)
+
+        with self.lock:
+            self.pending.discard(key)
+            if generation == self.generation and index not in self.chunks:
+                self._store_locked(index, chunk)
+
+        return True
+
+    """Zwraca dane potrzebne do wypieczenia chunka bez trzymania blokady."""
+    def _snapshot_locked(self) -> tuple:
+        return self.entries, self.sprite_cache.sprites, self.screen_size
+
+    """Rysuje obiekty nachodzące na chunk do powierzchni przyciętej do ich zawartości."""
+    def _bake(self, index: int, entries: tuple, sprites: dict, screen_size: Tuple[int, int]) -> Tuple[Optional[pygame.Surface], int, int]:
+        """ Args:
+                index: Indeks chunka
+                entries: Posortowane po x kolumny (x, kod typu, y, kolejność w poziomie)
+                sprites: Wzorce obiektów z SpriteCache
+                screen_size: Rozmiar okna, dla którego wypiekany jest chunk
+            Returns:
+                (powierzchnia albo None, y w pikselach okna, rozmiar w bajtach)
+        """
+        blit_sequence, _, width_px = self._chunk_blits(index, entries, sprites, screen_size)
+
+        rects = [pygame.Rect(position, surface.get_size()).clip(0, 0, width_px, screen_size[1]) for surface, position in blit_sequence]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        if not rects:
+            return None, 0, 0
+
+        top = min(rect.top for rect in rects)
+        height = max(rect.bottom for rect in rects) - top
+
+        chunk = pygame.Surface((width_px, height), pygame.SRCALPHA)
+        chunk.blits([(surface, (x, y - top)) for surface, (x, y) in blit_sequence], False)
+
+        return chunk, top, width_px * height * chunk.get_bytesize()
+
+    """Zwraca blity obiektów nachodzących na chunk (pozycje względem lewej krawędzi chunka) oraz jego lewą krawędź i szerokość w pikselach okna."""
+    def _chunk_blits(self, index: int, entries: tuple, sprites: dict, screen_size: Tuple[int, int]) -> Tuple[list, int, int]:
+        scale_x = screen_size[0] / config.SCREEN_WIDTH
+
+        left_px = self._chunk_left_px(index, scale_x)
+        width_px = self._chunk_left_px(index + 1, scale_x) - left_px
+
+        # Obiekty przy granicy chunka są rysowane w obu sąsiednich chunkach i przycinane
+        xs, types, ys, orders = entries
+        world_left = index * self.chunk_width
+        start = int(np.searchsorted(xs, world_left - config.RENDER_MARGIN, side="left"))
+        end = int(np.searchsorted(xs, world_left + self.chunk_width + config.RENDER_MARGIN, side="right"))
+
+        # Nachodzące na siebie obiekty rysowane są w kolejności z układu poziomu, jak przy rysowaniu pojedynczo
+        selected = np.argsort(orders[start:end]) + start
+
+        blit_sequence = []
+        for x, code, y in zip(xs[selected].tolist(), types[selected].tolist(), ys[selected].tolist()):
+            surface, (offset_x, offset_y) = sprites[OBJECT_NAMES[code]]
+            # Środek obiektu liczony tak samo jak w SpriteCache.get_blit
+            center_x = int(screen_size[0] * (x / config.SCREEN_WIDTH))
+            center_y = int(screen_size[1] * (y / config.SCREEN_HEIGHT))
+
+            blit_sequence.append((surface, (center_x + offset_x - left_px, center_y + offset_y)))
+
+        return blit_sequence, left_px, width_px
+
+    """Zapisuje chunk w pamięci podręcznej jako ostatnio używany."""
+    def _store_locked(self, index: int, chunk: Tuple[Optional[pygame.Surface], int, int]):
+        # Chunk mógł zostać w międzyczasie wypieczony przez wątek
+        previous = self.chunks.pop(index, None)
+        if previous is not None:
+            self.cache_bytes -= previous[2]
+
+        self.chunks[index] = chunk
+        self.cache_bytes += chunk[2]
+
+    """Usuwa najdawniej używane chunki poza widocznym zakresem, dopóki nie zmieszczą się w budżecie."""
+    def _evict(self, first_visible: int, last_visible: int):
+        with self.lock:
+            for index in list(self.chunks):
+                if self.cache_bytes <= self.budget_bytes:
+                    break
+                if first_visible <= index <= last_visible:
+                    continue
+
+                self.cache_bytes -= self.chunks.pop(index)[2]
+
+    def _invalidate_locked(self):
+        self.generation += 1
+        self.chunks.clear()
+        self.pending.clear()
+        self.cache_bytes = 0
+
+    def _chunk_left_px(self, index: int, scale_x: float) -> int:
+        return math.floor(index * self.chunk_width * scale_x)
+
+    @staticmethod
+    def _validate_screen(screen):
+        if not isinstance(screen, pygame.Surface):
+            raise ValueError("screen musi być instancją pygame.Surface")
@@ -1,6 +1,7 @@
 import pygame
 
 from config import config
+from ui.scale_context import ScaleContext
 
 class EndWall:
     def __init__(self, x: int):
@@ -11,6 +12,10 @@ class EndWall:
         self.outer_rect = pygame.Rect(x, 0, config.END_WALL_OUTER_WIDTH, config.SCREEN_HEIGHT)
         self.inner_rect = pygame.Rect(x, 0, 0, config.SCREEN_HEIGHT)
 
+        # Kontekst skali i szerokość obramowania policzona dla niego
+        self.scale_context = None
+        self.outer_width = config.END_WALL_OUTER_WIDTH
+
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
 
@@ -20,13 +25,22 @@ class EndWall:
         pygame.draw.rect(screen, config.END_WALL_OUTER_COLOR, self.outer_rect)
 
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
-
-        outer_width = int(config.END_WALL_OUTER_WIDTH * (screen_width / config.SCREEN_WIDTH))
-        self.outer_rect = pygame.Rect(self.wall_x, 0, outer_width, screen_height)
-
-        inner_width = screen_width - self.wall_x
-        self.inner_rect = pygame.Rect(self.wall_x, 0, inner_width, screen_height)
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
+
+        # Ściana przesuwa się z kamerą - zmienia się tylko położenie prostokątów
+        self.outer_rect.x = self.wall_x
+        self.inner_rect.x = self.wall_x
+        self.inner_rect.width = context.width - self.wall_x
+
+    """Przelicza szerokość obramowania i wysokość ściany dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
+
+        self.outer_width = int(config.END_WALL_OUTER_WIDTH * context.scale_x)
+        self.outer_rect = pygame.Rect(self.wall_x, 0, self.outer_width, context.height)
+        self.inner_rect = pygame.Rect(self.wall_x, 0, context.width - self.wall_x, context.height)
 
     @staticmethod
     def _validate_draw_params(screen: pygame.Surface):
@@ -1,16 +1,24 @@
-import pygame
+import bisect, pygame
 
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from config import config
 from game.end_wall import EndWall
 from game.player import Player
 from game.floor import Floor
+from game.spatial_grid import CellColumns, SpatialGrid
+from game.chunk_renderer import ChunkRenderer
+from game.level_cache import LevelCache
+from game.level_compiler import CompiledLevel, LevelObjects, compile_level
+from game.simulation_state import SimulationState
+from game.state_hash import StateHashLog
+from ui.scale_context import ScaleContext
 
 from objects.block import Block
 from objects.spike import Spike
 from objects.jump_pad import JumpPad
 from objects.jump_orb import JumpOrb
+from objects.sprite_cache import SpriteCache
 
 """Główny silnik gry odpowiedzialny za fizykę, kolizje i zarządzanie obiektami."""
 class Engine:
@@ -20,16 +28,36 @@ class Engine:
         self.floor = floor
         self.gravity = 4500
         self.jump_force = -1350
+        self.jump_pad_multiplier = 1.3
+        self.jump_orb_multiplier = 0.9
 
         # Oryginalne wymiary ekranu do skalowania
         self.original_screen_height = config.SCREEN_HEIGHT
         self.original_screen_width = config.SCREEN_WIDTH
 
         self.attempts = 1  # Liczba prób
-        self.objects: List[Union[Block, Spike, JumpPad, JumpOrb]] = []
+        self.objects: Union[LevelObjects, List[Union[Block, Spike, JumpPad, JumpOrb]]] = []
+        self.compiled_level = CompiledLevel.empty()
+        self.spatial_grid = SpatialGrid(config.GRID_SIZE)
+        self.trigger_cursor = 0
         self.camera_offset_x = 0
 
+        # Poziom wczytywany strumieniowo (SegmentedLevel): wczytane segmenty -> ich obiekty
+        self.segmented_level = None
+        self.loaded_segments = range(0)
+        self.segment_objects: Dict[int, list] = {}
+
         self.end_wall: Optional[EndWall] = None
+
+        # Jeśli ustawiony, Engine.step dopisuje skrót stanu po każdym kroku (wykrywanie rozbieżności)
+        self.state_hash_log: Optional[StateHashLog] = None
+
+        # Pamięć podręczna skompilowanych poziomów (ustawiana przez GameManager) i x najdalszego obiektu poziomu
+        self.level_cache: Optional[LevelCache] = None
+        self.furthest_object_x: Optional[int] = None
+
+        self.sprite_cache = SpriteCache()
+        self.chunk_renderer = ChunkRenderer(self.sprite_cache)
         self.on_orb = False
 
     """Aktualizuje pozycję gracza na podstawie prędkości, grawitacji i czasu."""
@@ -53,40 +81,122 @@ class Engine:
         game_over = self._update_horizontal_movement(player, delta_time)
         if game_over: return True
 
-        for obj in self.objects:
+        self._apply_triggers(player)
+
+        self._update_camera(player)
+
+        return False
+
+    """Wykonuje jeden krok symulacji w jednostkach świata, bez okna i bez odczytu klawiatury."""
+    def step(self, state: Union[SimulationState, Player], jump_pressed: bool, dt: float = config.PHYSICS_TIMESTEP) -> bool:
+        """ Args:
+                state: Stan gracza (SimulationState lub Player), modyfikowany w miejscu
+                jump_pressed: Czy w tym kroku wciśnięty jest skok (K_UP/lewy przycisk myszy)
+                dt: Stały krok czasowy symulacji
+            Returns:
+                True, jeśli gra się skończyła (kolizja); False w przeciwnym razie
+        """
+        self._validate_step_params(state, jump_pressed, dt)
+
+        if self.segmented_level is not None: self._stream_segments(state.x)
+
+        if jump_pressed: self._jump(state, 1, False, 1.0)
+
+        self._apply_gravity(state, dt, 1.0)
+
+        game_over = self._update_vertical_movement(state, dt, self.get_world_floor_y())
+        if game_over: return True
+
+        game_over = self._update_horizontal_movement(state, dt)
+        if game_over: return True
+
+        self._apply_triggers(state, jump_pressed, 1.0)
+
+        self._update_camera(state)
+
+        if self.state_hash_log is not None: self.state_hash_log.append(self, state)
+
+        return False
+
+    """Ustawia gracza do rysowania między dwoma ostatnimi stanami fizyki i przesuwa za nim kamerę."""
+    def interpolate_player(self, player: Player, previous: SimulationState, current: SimulationState, alpha: float):
+        """ Args:
+                player: Gracz rysowany na ekranie
+                previous: Stan fizyki z poprzedniego kroku
+                current: Stan fizyki z ostatniego kroku
+                alpha: Część kroku, która upłynęła od current (0 - 1)
+        """
+        player.x = previous.x + (current.x - previous.x) * alpha
+        player.y = previous.y + (current.y - previous.y) * alpha
+        player.velocity_y = current.velocity_y
+        player.on_ground = current.on_ground
+
+        # Po przywróceniu stanu (reset, punkt kontrolny, przewijanie) rysowane segmenty muszą pasować do pozycji gracza
+        if self.segmented_level is not None: self._stream_segments(player.x)
+
+        self._update_camera(player)
+
+    """Tworzy stan symulacji gracza w pozycji startowej."""
+    def create_state(self) -> SimulationState:
+        """ Returns:
+                Nowy stan gracza stojącego na podłożu w pozycji startowej
+        """
+        return SimulationState(config.PLAYER_RESET_X, self.get_world_floor_y() - config.PLAYER_OUTER_SIZE // 2)
+
+    """Zwraca pozycję Y podłoża w jednostkach świata, niezależnie od rozmiaru okna."""
+    def get_world_floor_y(self) -> int:
+        return round(config.SCREEN_HEIGHT * self.floor.floor_y_ratio)
+
+    """Obsługuje wybicie z jump padów i jump orbów, na które nachodzi gracz."""
+    def _apply_triggers(self, player, jump_pressed: Optional[bool] = None, scale: Optional[float] = None):
+        """ Args:
+                player: Gracz lub stan symulacji
+                jump_pressed: Czy skok jest wciśnięty; None oznacza odczyt z klawiatury i myszy
+                scale: Skala fizyki; None oznacza skalowanie względem wysokości okna
+        """
+        player_bounds = self._get_block_bounds(player)
+        triggers = self.compiled_level.triggers
+
+        for index in self._get_trigger_window(player_bounds['left'], player_bounds['right']):
+            obj = triggers[index]
             if not (isinstance(obj, JumpOrb) or isinstance(obj, JumpPad)):
                 continue
 
-            player_bounds = self._get_block_bounds(player)
             object_bounds = self._get_block_bounds(obj)
 
             if isinstance(obj, JumpPad):
                 if self._rectangles_overlap(object_bounds, player_bounds):
-                    self.player_jump(player, 1.3)
+                    self._jump(player, self.jump_pad_multiplier, False, scale)
 
             elif isinstance(obj, JumpOrb):
                 if self._rectangles_overlap(object_bounds, player_bounds):
-                    keys = pygame.key.get_pressed()
-                    mouse_buttons = pygame.mouse.get_pressed()
+                    if jump_pressed is None:
+                        jump_pressed = self._is_jump_input_pressed()
 
-                    if keys[pygame.K_UP] or mouse_buttons[0]: self.player_jump(player, 0.9, True)
+                    if jump_pressed: self._jump(player, self.jump_orb_multiplier, True, scale)
 
-        self._update_camera(player)
+    """Sprawdza czy gracz trzyma klawisz skoku (strzałka w górę lub lewy przycisk myszy)."""
+    @staticmethod
+    def _is_jump_input_pressed() -> bool:
+        keys = pygame.key.get_pressed()
+        mouse_buttons = pygame.mouse.get_pressed()
 
-        return False
+        return bool(keys[pygame.K_UP] or mouse_buttons[0])
 
     """Aktualizuje ruch pionowy gracza i sprawdza kolizje z blokami i podłożem."""
-    def _update_vertical_movement(self, player: Player, delta_time: float) -> bool:
+    def _update_vertical_movement(self, player: Player, delta_time: float, floor_y: Optional[float] = None) -> bool:
         """ Args:
                  player: Gracz do aktualizacji
                  delta_time: Czas od ostatniej klatki
+                 floor_y: Pozycja Y podłoża; domyślnie self.floor.floor_y
              Returns:
                  True, jeśli wystąpiła kolizja; False, jeśli ta kolizja nie wystąpiła
         """
         new_y = player.y + player.velocity_y * delta_time
 
         block_top = self._check_block_collision_top(player, new_y)
-        floor_y = self.floor.floor_y
+        if floor_y is None:
+            floor_y = self.floor.floor_y
         player_bottom = new_y + config.PLAYER_OUTER_SIZE // 2
 
         if block_top is not None and player.velocity_y >= 0 and player_bottom >= block_top:
@@ -138,16 +248,31 @@ class Engine:
         """
         self._validate_player(player)
 
+        self._jump(player, multiply, force_jump)
+
+    """Ustawia prędkość skoku gracza, jeśli jest na ziemi lub skok jest wymuszony."""
+    def _jump(self, player, multiply: [int, float], force_jump: bool, scale: Optional[float] = None):
+        """ Args:
+                player: Gracz lub stan symulacji
+                multiply: O ile silniejszy ma być skok
+                force_jump: Czy wymusić skok (jump_orb)
+                scale: Skala fizyki; None oznacza skalowanie względem wysokości okna
+        """
         if not (player.on_ground or force_jump):
             return
 
         # Skalowanie siły skoku na podstawie obecnej wysokości ekranu
-        screen_height = pygame.display.get_surface().get_height()
-        scaled_jump_force = (self.jump_force * multiply) * (screen_height / self.original_screen_height)
+        if scale is None:
+            scale = self._get_screen_scale()
 
-        player.velocity_y = scaled_jump_force
+        player.velocity_y = (self.jump_force * multiply) * scale
         player.on_ground = False
 
+    """Zwraca stosunek wysokości okna do wysokości oryginalnej, używany do skalowania fizyki."""
+    def _get_screen_scale(self) -> float:
+        screen_height = pygame.display.get_surface().get_height()
+        return screen_height / self.original_screen_height
+
     """Sprawdza kolizję gracza z górną częścią bloków."""
     def _check_block_collision_top(self, player: Player, new_y: float) -> Optional[float]:
         """ Args:
@@ -162,11 +287,11 @@ class Engine:
 
         highest_block_top = None
 
-        for obj in self.objects:
-            if not isinstance(obj, Block):
-                continue
+        # Siatka zawiera połączone ciągi bloków (BlockSpan) z Engine.compiled_level
+        candidates = self.spatial_grid.query(player_left, player_bottom, player_right, player_bottom)
 
-            block_bounds = self._get_block_bounds(obj)
+        for span in candidates:
+            block_bounds = span.bounds
 
             # Czy gracz jest w poziomym zasięgu bloku
             if player_right >= block_bounds['left'] and player_left <= block_bounds['right']:
@@ -189,86 +314,108 @@ class Engine:
         """
         player_bounds = self._get_player_bounds_at_x(player, new_x)
 
-        for obj in self.objects:
-            if not (isinstance(obj, Block) or isinstance(obj, Spike)):
-                continue
+        for span in self._query_objects(player_bounds):
+            if self._rectangles_overlap(player_bounds, span.bounds):
+                return True
 
-            if isinstance(obj, Block):
-                block_bounds = self._get_block_bounds(obj)
-                if self._rectangles_overlap(player_bounds, block_bounds):
-                    return True
+        # Wierzchołki gracza przy teście kolców są obcinane do liczb całkowitych
+        half_size = config.PLAYER_OUTER_SIZE // 2
+        triggers = self.compiled_level.triggers
 
+        for index in self._get_trigger_window(int(new_x) - half_size, int(new_x) + half_size):
+            obj = triggers[index]
             if isinstance(obj, Spike):
-                if self._check_spike_collision(player, obj):
+                if self._check_spike_collision(player, obj, new_x):
                     return True
 
         return False
 
-    """Sprawdza czy gracz ma kolizję z kolcem."""
-    def _check_spike_collision(self, player: Player, spike: Spike):
+    """Zwraca połączone bloki z siatki przestrzennej, które mogą nachodzić na podany prostokąt."""
+    def _query_objects(self, bounds: dict) -> list:
         """ Args:
-                player: Gracz
-                spike: Kolec
+                bounds: Słownik z granicami obszaru
             Returns:
-                True, jeśli jakiś wierzchołek gracza jest w trójkącie; False w przeciwnym wypadku
+                Lista BlockSpan-kandydatów
+        """
+        return self.spatial_grid.query(bounds['left'], bounds['top'], bounds['right'], bounds['bottom'])
+
+    """Zwraca zakres indeksów osi czasu obiektów wyzwalanych, których przedział x nachodzi na [left, right]."""
+    def _get_trigger_window(self, left: float, right: float) -> range:
+        """ Args:
+                left: Lewa krawędź gracza
+                right: Prawa krawędź gracza
+            Returns:
+                Zakres indeksów w self.compiled_level.triggers
         """
-        spike.update_size(pygame.display.get_surface())
-        points = spike.outer_points
+        lefts = self.compiled_level.trigger_lefts
+        rights = self.compiled_level.trigger_rights
+        count = len(rights)
+        cursor = self.trigger_cursor
 
-        vertices = [
-            self.screen_to_world(player.outer_rect.topleft),
-            self.screen_to_world(player.outer_rect.topright),
-            self.screen_to_world(player.outer_rect.bottomleft),
-            self.screen_to_world(player.outer_rect.bottomright)
-        ]
+        # Gracz cofnął się (reset, przywrócenie stanu) - kursor ustawiany od nowa wyszukiwaniem binarnym
+        if cursor > count or (cursor > 0 and rights[cursor - 1] >= left):
+            cursor = bisect.bisect_left(rights, left)
 
-        for vertex in vertices:
-            if self._is_point_inside_triangle(points, vertex):
-                return True
+        # Gracz porusza się tylko w prawo, więc kursor przesuwa się średnio o O(1) na krok
+        while cursor < count and rights[cursor] < left:
+            cursor += 1
 
-        return False
+        self.trigger_cursor = cursor
 
-    """Sprawdza czy punkt jest w trójkącie."""
-    @staticmethod
-    def _is_point_inside_triangle(points: list[tuple[int, int]], point: tuple[int, int]) -> bool:
+        end = cursor
+        while end < count and lefts[end] <= right:
+            end += 1
+
+        return range(cursor, end)
+
+    """Sprawdza czy gracz ma kolizję z kolcem."""
+    def _check_spike_collision(self, player: Player, spike: Spike, x: float):
         """ Args:
-                points: Wierzchołki trójkąta
-                point: Punkt
+                player: Gracz
+                spike: Kolec
+                x: Pozycja X gracza
             Returns:
-                True, jeśli punkt jest w trójkącie; False w przeciwnym wypadku
+                True, jeśli jakiś wierzchołek gracza jest w trójkącie; False w przeciwnym wypadku
         """
-        Engine._validate_triangle_points(points)
-
-        x, y = point
-        x1, y1 = points[0]
-        x2, y2 = points[1]
-        x3, y3 = points[2]
+        if spike.collider_edges is None:
+            spike.build_collider()
 
-        A = Engine._get_triangle_area([(x1, y1), (x2, y2), (x3, y3)])
+        # Wierzchołki gracza w jednostkach świata, zaokrąglone jak w Player._update_size
+        half_size = config.PLAYER_OUTER_SIZE // 2
+        player_x, player_y = int(x), int(player.y)
 
-        A1 = Engine._get_triangle_area([(x, y), (x2, y2), (x3, y3)])
+        left = player_x - half_size
+        right = player_x + half_size
+        top = player_y - half_size
+        bottom = player_y + half_size
 
-        A2 = Engine._get_triangle_area([(x1, y1), (x, y), (x3, y3)])
+        # Odrzucenie po prostokątach ograniczających
+        spike_left, spike_top, spike_right, spike_bottom = spike.collider_bounds
+        if right < spike_left or left > spike_right or bottom < spike_top or top > spike_bottom:
+            return False
 
-        A3 = Engine._get_triangle_area([(x1, y1), (x2, y2), (x, y)])
+        edges = spike.collider_edges
 
-        return A == A1 + A2 + A3
+        return (self._is_point_inside_edges(edges, left, top) or
+                self._is_point_inside_edges(edges, right, top) or
+                self._is_point_inside_edges(edges, left, bottom) or
+                self._is_point_inside_edges(edges, right, bottom))
 
-    """Zwraca pole trójkąta."""
+    """Sprawdza czy punkt leży w trójkącie (lub na jego krawędzi) na podstawie funkcji krawędziowych."""
     @staticmethod
-    def _get_triangle_area(points: list[tuple[int, int]]):
+    def _is_point_inside_edges(edges: tuple, x: int, y: int) -> bool:
         """ Args:
-                points: Wierzchołki trójkąta
+                edges: Współczynniki (a, b, c) trzech krawędzi, dodatnie po wewnętrznej stronie
+                x: Pozycja X punktu
+                y: Pozycja Y punktu
             Returns:
-                Pole trójkąta
+                True, jeśli punkt jest w trójkącie; False w przeciwnym wypadku
         """
-        Engine._validate_triangle_points(points)
-
-        x1, y1 = points[0]
-        x2, y2 = points[1]
-        x3, y3 = points[2]
+        (a1, b1, c1), (a2, b2, c2), (a3, b3, c3) = edges
 
-        return abs((x1 * (y2 - y3) + x2 * (y3 - y1) + x3 * (y1 - y2)) / 2.0)
+        return (a1 * x + b1 * y + c1 >= 0 and
+                a2 * x + b2 * y + c2 >= 0 and
+                a3 * x + b3 * y + c3 >= 0)
 
     """Zwraca granice gracza dla danej pozycji X."""
     @staticmethod
@@ -324,29 +471,85 @@ class Engine:
         """
         self._validate_player(player)
 
-        player.x = 90
+        player.x = config.PLAYER_RESET_X
         player.y = self.floor.floor_y - player.outer_size // 2
         player.velocity_y = 0
         player.on_ground = True
         self.camera_offset_x = 0
 
     """Stosuje grawitację do gracza."""
-    def _apply_gravity(self, player: Player, delta_time: float):
+    def _apply_gravity(self, player: Player, delta_time: float, scale: Optional[float] = None):
         """ Args:
                 player: Gracz, na którego działa grawitacja
                 delta_time: Czas od ostatniej klatki
+                scale: Skala fizyki; None oznacza skalowanie względem wysokości okna
         """
-        screen_height = pygame.display.get_surface().get_height()
-        scaled_gravity = self.gravity * (screen_height / self.original_screen_height)
+        if scale is None:
+            scale = self._get_screen_scale()
+
+        scaled_gravity = self.gravity * scale
         player.velocity_y += scaled_gravity * delta_time
 
-    """Tworzy obiekty gry na podstawie układu poziomu."""
-    def set_objects_from_layout(self, layout: List[dict]):
+    """Ustawia obiekty poziomu na podstawie układu; obiekty gry tworzone są dopiero przy rysowaniu lub kolizji."""
+    def set_objects_from_layout(self, layout: List[dict], level_hash: Optional[bytes] = None):
         """ Args:
                 layout: Lista słowników opisujących obiekty
+                level_hash: Hash układu (layout_hash) - klucz pamięci podręcznej skompilowanych poziomów
         """
         self._validate_layout(layout)
 
+        self._close_segmented_level()
+        self.objects = LevelObjects.from_layout(layout)
+        self._compile_objects(level_hash)
+
+    """Ustawia obiekty poziomu z kolumn binarnego pliku poziomu, bez tworzenia słowników układu ani obiektów gry."""
+    def set_objects_from_binary(self, level):
+        """ Args:
+                level: BinaryLevel z kolumnami typów i pozycji; kolumny są kopiowane, więc można go potem zamknąć
+        """
+        self._close_segmented_level()
+        self.objects = LevelObjects.from_columns(level.types, level.xs, level.ys)
+        self._compile_objects(level.level_hash)
+
+    """Ustawia poziom wczytywany segmentami - w pamięci są tylko segmenty wokół gracza."""
+    def set_objects_from_segments(self, level):
+        """ Args:
+                level: SegmentedLevel; Engine zamyka go przy zmianie poziomu
+        """
+        self._close_segmented_level()
+
+        self.segmented_level = level
+        self._stream_segments(config.PLAYER_RESET_X)
+
+    """Wczytuje segmenty przed graczem i usuwa te za kamerą, jeśli gracz przeszedł do innego segmentu."""
+    def _stream_segments(self, x: float):
+        level = self.segmented_level
+        segment = level.segment_at(x)
+
+        wanted = range(max(segment - config.STREAM_SEGMENTS_BEHIND, 0),
+                       min(segment + config.STREAM_SEGMENTS_AHEAD + 1, level.segment_count))
+        if wanted == self.loaded_segments:
+            return
+
+        # Segmenty, które zostają, zachowują swoje obiekty - tworzone są tylko nowe
+        self.segment_objects = {index: self.segment_objects.get(index) or self._create_objects(level.iter_segment(index))
+                                for index in wanted}
+        self.loaded_segments = wanted
+
+        self.objects = [obj for index in wanted for obj in self.segment_objects[index]]
+        self._compile_objects()
+
+    def _close_segmented_level(self):
+        if self.segmented_level is not None:
+            self.segmented_level.close()
+
+        self.segmented_level = None
+        self.loaded_segments = range(0)
+        self.segment_objects = {}
+
+    """Tworzy obiekty poziomu z krotek (typ, x, y); nieznane typy są pomijane."""
+    @staticmethod
+    def _create_objects(entries) -> list:
         type_map = {
             "block": Block,
             "spike": Spike,
@@ -354,13 +557,42 @@ class Engine:
             "jump_orb": JumpOrb
         }
 
-        self.objects = []
-        for obj_data in layout:
-            obj_type = obj_data.get("type")
+        objects = []
+        for obj_type, x, y in entries:
             if obj_type in type_map:
                 obj_class = type_map[obj_type]
-                obj = obj_class(obj_data["x"], obj_data["y"])
-                self.objects.append(obj)
+                obj = obj_class(x, y)
+                objects.append(obj)
+
+                # Trójkąt kolca w jednostkach świata liczony raz, a nie przy każdym sprawdzeniu kolizji
+                if obj_type == "spike":
+                    obj.build_collider()
+
+        return objects
+
+    """Buduje struktury kolizji (połączone bloki, oś czasu obiektów wyzwalanych, siatka) dla self.objects albo wczytuje je z pamięci podręcznej."""
+    def _compile_objects(self, level_hash: Optional[bytes] = None):
+        """ Args:
+                level_hash: Hash układu, z którego powstały obiekty; None - bez pamięci podręcznej
+        """
+        self.trigger_cursor = 0
+
+        use_cache = self.level_cache is not None and level_hash is not None
+
+        compiled_level = self.level_cache.load(level_hash, self.objects) if use_cache else None
+        if compiled_level is None:
+            compiled_level = compile_level(self.objects)
+
+            if use_cache:
+                try:
+                    self.level_cache.save(level_hash, compiled_level)
+                except OSError as error:
+                    print(f"Ostrzeżenie: Nie udało się zapisać skompilowanego poziomu: {error}")
+
+        # Siatka przestrzenna (komórki o boku config.GRID_SIZE) dla połączonych ciągów bloków
+        self.compiled_level = compiled_level
+        self.spatial_grid.set_cells(compiled_level.block_spans, CellColumns(*compiled_level.cells))
+        self.furthest_object_x = compiled_level.furthest_x
 
     """Rysuje wszystkie obiekty na ekranie z uwzględnieniem przesunięcia kamery."""
     def draw_objects(self, screen: pygame.Surface):
@@ -370,46 +602,27 @@ class Engine:
         """
         self._validate_screen(screen)
 
-        # Rysowanie tylko obiektów widocznych na ekranie
-        for obj in self.objects:
-            screen_x = obj.x + self.camera_offset_x
+        # Geometria poziomu jest statyczna - rysowana z wypiekanych chunków, po kilka blitów na klatkę
+        if self.chunk_renderer.source is not self.objects:
+            self.chunk_renderer.set_objects(self.objects)
 
-            if not self._is_object_visible(screen_x):
-                continue
-
-            self._draw_single_object(obj, screen, screen_x)
+        self.chunk_renderer.draw(screen, self.camera_offset_x)
 
         if self.end_wall:
             self.end_wall.draw(screen)
 
-    """Sprawdza czy obiekt jest widoczny na ekranie."""
-    @staticmethod
-    def _is_object_visible(screen_x: float) -> bool:
-        """ Args:
-                screen_x: Pozycja X obiektu na ekranie
-            Returns:
-                True, jeśli obiekt jest widoczny; False w przeciwnym wypadku
-        """
-        return -config.RENDER_MARGIN < screen_x < config.SCREEN_WIDTH + config.RENDER_MARGIN
-
-    """Rysuje pojedynczy obiekt na ekranie."""
-    @staticmethod
-    def _draw_single_object(obj, screen: pygame.Surface, screen_x: float):
+    """Przekazuje kontekst skali obiektom rysowanym przez silnik."""
+    def apply_scale(self, context: ScaleContext):
         """ Args:
-                obj: Obiekt do narysowania
-                screen: Powierzchnia do rysowania
-                screen_x: Pozycja X obiektu na ekranie
+                context: Kontekst skali dla nowego rozmiaru okna
         """
-        obj_type = obj.__class__.__name__
-
-        types = {
-            "Block": Block(screen_x, obj.y),
-            "Spike": Spike(screen_x, obj.y),
-            "JumpOrb": JumpOrb(screen_x, obj.y),
-            "JumpPad": JumpPad(screen_x, obj.y)
-        }
+        # Wzorce obiektów i chunki są związane z rozmiarem okna - zostaną zbudowane przy następnym rysowaniu
+        if context.size != self.sprite_cache.screen_size:
+            self.sprite_cache.invalidate()
+            self.chunk_renderer.invalidate()
 
-        types[obj_type].draw(screen)
+        if self.end_wall:
+            self.end_wall.apply_scale(context)
 
     """Konwertuje współrzędne świata na współrzędne ekranu."""
     def world_to_screen(self, world_pos: Tuple[int, int]) -> Tuple[int, int]:
@@ -438,11 +651,19 @@ class Engine:
         """ Returns:
                 Pozycja X najdalszego obiektu
         """
+        # Przy wczytywaniu strumieniowym w pamięci nie ma całego poziomu - koniec zapisany jest w pliku
+        if self.segmented_level is not None:
+            return (self.segmented_level.end_x or config.MIN_LEVEL_LENGTH) + config.END_WALL_X
+
         furthest_x = 0
 
-        for obj in self.objects:
-            if obj.x > furthest_x:
-                furthest_x = obj.x
+        # Wartość z kompilacji poziomu (albo z pamięci podręcznej) - bez przeglądania obiektów
+        if self.furthest_object_x is not None:
+            furthest_x = max(self.furthest_object_x, 0)
+        else:
+            for obj in self.objects:
+                if obj.x > furthest_x:
+                    furthest_x = obj.x
 
         # Jeśli nie ma żadnych obiektów, minimalna długość poziomu
         if furthest_x == 0:
@@ -493,6 +714,15 @@ class Engine:
         if not isinstance(screen, pygame.Surface):
             raise ValueError("screen musi być instancją pygame.Surface")
 
+    @staticmethod
+    def _validate_step_params(state, jump_pressed, dt):
+        if not isinstance(state, (SimulationState, Player)):
+            raise ValueError("state musi być instancją klasy SimulationState lub Player")
+        if not isinstance(jump_pressed, bool):
+            raise ValueError("jump_pressed musi być wartością boolowską")
+        if not isinstance(dt, float) or dt <= 0:
+            raise ValueError("dt musi być dodatnią liczbą zmiennoprzecinkową")
+
     @staticmethod
     def _validate_layout(layout):
         if not isinstance(layout, list):
@@ -513,11 +743,6 @@ class Engine:
         if not isinstance(obstacle_rect, pygame.Rect):
             raise ValueError("obstacle_rect musi być instancją pygame.Rect")
 
-    @staticmethod
-    def _validate_triangle_points(points):
-        if not isinstance(points, list) and not all(isinstance(x, tuple) for x in points) and not length(points) == 3:
-            raise ValueError("points musi być listą krotek")
-
     @staticmethod
     def _validate_player_screen(player, screen):
         Engine._validate_player(player)
@@ -0,0 +1,41 @@
+"""Zrzut stanu gracza i kamery, który można przywrócić bez tworzenia nowych obiektów."""
+class EngineSnapshot:
+    __slots__ = ("x", "y", "velocity_y", "on_ground", "camera_offset_x", "trigger_cursor")
+
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.velocity_y = 0.0
+        self.on_ground = True
+        self.camera_offset_x = 0
+        self.trigger_cursor = 0
+
+    """Zapisuje w tym zrzucie stan gracza i silnika."""
+    def capture(self, engine, state):
+        """ Args:
+                engine: Silnik (kamera i kursor obiektów wyzwalanych)
+                state: Stan gracza (SimulationState lub Player)
+        """
+        self.x = state.x
+        self.y = state.y
+        self.velocity_y = state.velocity_y
+        self.on_ground = state.on_ground
+        self.camera_offset_x = engine.camera_offset_x
+        self.trigger_cursor = engine.trigger_cursor
+
+    """Przywraca zapisany stan do istniejących obiektów gracza i silnika."""
+    def restore(self, engine, state):
+        """ Args:
+                engine: Silnik do przywrócenia
+                state: Stan gracza nadpisywany w miejscu
+        """
+        state.x = self.x
+        state.y = self.y
+        state.velocity_y = self.velocity_y
+        state.on_ground = self.on_ground
+        engine.camera_offset_x = self.camera_offset_x
+        engine.trigger_cursor = self.trigger_cursor
+
+    def __repr__(self):
+        return (f"EngineSnapshot(x={self.x}, y={self.y}, velocity_y={self.velocity_y}, on_ground={self.on_ground}, "
+                f"camera_offset_x={self.camera_offset_x})")
@@ -1,6 +1,7 @@
 import pygame
 
 from config import config
+from ui.scale_context import ScaleContext
 
 class Floor:
     def __init__(self, y: int):
@@ -15,6 +16,9 @@ class Floor:
         self.inner_rect = pygame.Rect(0, self.floor_y, config.SCREEN_WIDTH, config.SCREEN_HEIGHT - self.floor_y)
         self.inner_rect.centerx = config.SCREEN_WIDTH // 2
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
     def draw(self, screen: pygame.Surface):
         assert isinstance(screen, pygame.Surface), "screen musi być instancją pygame.Surface"
 
@@ -24,7 +28,14 @@ class Floor:
         pygame.draw.rect(screen, config.FLOOR_OUTER_COLOR, self.outer_rect)
 
     def update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
+
+    """Przelicza wysokość i prostokąty podłogi dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
+        screen_width, screen_height = context.size
 
         self.floor_y = int(screen_height * self.floor_y_ratio)
 
@@ -1,6 +1,6 @@
 import json, os, pygame, pygame.event
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from pygame import VIDEORESIZE
 
@@ -8,12 +8,21 @@ from config import config
 from config.enums import WindowState
 
 from ui.ui_manager import UIManager
+from ui.scale_context import ScaleContext
 
 from game.level_editor import LevelEditor
+from game.level_store import LevelStore
+from game.level_binary import open_binary_level
+from game.level_cache import LevelCache
+from game.level_segments import open_segmented_level
 from game.player import Player
 from game.engine import Engine
 from game.floor import Floor
 from game.end_wall import EndWall
+from game.simulation_state import SimulationState
+from game.replay import ReplayRecorder
+from game.engine_snapshot import EngineSnapshot
+from game.rewind_buffer import RewindBuffer
 
 """Zarządza ogólnym stanem, zdarzeniami, oraz koordynacją pomiędzy wszystkimi komponentami gry."""
 class GameManager:
@@ -24,9 +33,32 @@ class GameManager:
         # [Game objects]
         self.floor: Optional[Floor] = None
         self.player: Optional[Player] = None
-        self.levels: Dict[str, Any] = {}
+        # Wpisy manifestu (bez układów) - układ wczytywany jest dopiero przy starcie poziomu
+        self.levels: List[Dict[str, Any]] = []
+        self.level_store: Optional[LevelStore] = None
         self.current_level: Optional[Dict[str, Any]] = None
 
+        # [Physics]
+        # Stan fizyki po ostatnim i przedostatnim kroku; gracz rysowany jest pomiędzy nimi
+        self.physics_state = SimulationState()
+        self.previous_physics_state = SimulationState()
+        self.physics_accumulator = 0.0
+
+        # [Replay]
+        # Wejście bieżącej próby; nagrywane tylko po wczytaniu poziomu
+        self.level_hash: Optional[bytes] = None
+        self.replay_recorder: Optional[ReplayRecorder] = None
+
+        # [Practice]
+        # Po śmierci w trybie ćwiczeń gra wraca do punktu kontrolnego zamiast na początek poziomu
+        self.practice_mode = False
+        self.checkpoint = EngineSnapshot()
+        self.checkpoint_set = False
+
+        # Ostatnie kroki fizyki do przewijania; rewind_offset to liczba kroków wstecz od najnowszego
+        self.rewind_buffer = RewindBuffer()
+        self.rewind_offset = 0
+
         # [Managers]
         self.ui_manager: Optional[UIManager] = None
         self.engine: Optional[Engine] = None
@@ -55,11 +87,16 @@ class GameManager:
         self.floor = Floor(config.FLOOR_Y)
         self.engine = Engine(self.floor)
 
-        self.level_editor = LevelEditor(self.ui_manager.window, self.levels, self.floor)
+        project_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+        self.engine.level_cache = LevelCache(os.path.join(project_dir, config.LEVEL_CACHE_PATH))
+
+        self.level_editor = LevelEditor(self.ui_manager.window, self.levels, self.floor, self.level_store)
 
         self.player = Player()
         self.engine.reset_player(self.player)
 
+        self.apply_scale(ScaleContext.get(self.ui_manager.window.get_size()))
+
         self.window_state = WindowState.MENU
         self.running = True
 
@@ -72,27 +109,136 @@ class GameManager:
         self.poll_events()
 
     def _update_game_state(self, delta_time: float):
-        self._handle_player_input()
+        rewind_direction = self._get_rewind_direction() if self.practice_mode else 0
+
+        # Przewijanie do przodu ma sens tylko po cofnięciu - na bieżącym kroku gra toczy się dalej
+        if rewind_direction > 0 or (rewind_direction < 0 and self.rewind_offset > 0):
+            self._update_rewind(delta_time, rewind_direction)
+        else:
+            if self.rewind_offset: self._resume_from_rewind()
+            self._update_physics(delta_time, self._is_jump_pressed())
+
         self._update_ui_elements()
         self._check_level_completion()
 
-        game_over = self.engine.update_player(self.player, delta_time, self.ui_manager.window)
+    """Wykonuje tyle stałych kroków fizyki, ile zmieściło się w czasie klatki, i ustawia gracza do rysowania."""
+    def _update_physics(self, delta_time: float, jump_pressed: bool):
+        self.physics_accumulator += min(delta_time, config.MAX_FRAME_TIME)
+
+        while self.physics_accumulator >= config.PHYSICS_TIMESTEP:
+            self.physics_accumulator -= config.PHYSICS_TIMESTEP
+            self.previous_physics_state.copy_from(self.physics_state)
+
+            if self.replay_recorder is not None: self.replay_recorder.record(jump_pressed)
+
+            if self.engine.step(self.physics_state, jump_pressed):
+                self.engine.attempts += 1
+
+                if self.practice_mode and self.checkpoint_set:
+                    self.restore_checkpoint()
+                else:
+                    self.save_replay()
+                    self.reset_physics()
+                return
+
+            self.rewind_buffer.push(self.engine, self.physics_state)
+
+        alpha = self.physics_accumulator / config.PHYSICS_TIMESTEP
+        self.engine.interpolate_player(self.player, self.previous_physics_state, self.physics_state, alpha)
+
+    """Ustawia gracza i stan fizyki w pozycji startowej."""
+    def reset_physics(self):
+        self.engine.reset_player(self.player)
+
+        self.physics_state = self.engine.create_state()
+        self.previous_physics_state.copy_from(self.physics_state)
+        self.physics_accumulator = 0.0
+
+        self.replay_recorder = ReplayRecorder(self.level_hash) if self.level_hash is not None else None
+
+        self.rewind_buffer.clear()
+        self.rewind_buffer.push(self.engine, self.physics_state)
+        self.rewind_offset = 0
+
+    """Przewija stan fizyki wstecz (direction = 1) lub do przodu (direction = -1) o czas klatki."""
+    def _update_rewind(self, delta_time: float, direction: int):
+        if not self.rewind_buffer: return
+
+        ticks = max(1, round(min(delta_time, config.MAX_FRAME_TIME) / config.PHYSICS_TIMESTEP))
+        self.rewind_offset = min(max(self.rewind_offset + direction * ticks, 0), len(self.rewind_buffer) - 1)
+
+        self.rewind_buffer.restore(self.engine, self.physics_state, self.rewind_offset)
+        self.previous_physics_state.copy_from(self.physics_state)
+        self.physics_accumulator = 0.0
+
+        # Przewinięta próba nie odpowiada już wejściu od początku poziomu
+        self.replay_recorder = None
+
+        self.engine.interpolate_player(self.player, self.previous_physics_state, self.physics_state, 0.0)
 
-        if game_over:
-            self.engine.attempts += 1
-            self.engine.reset_player(self.player)
+    """Wznawia grę od przewiniętego stanu i usuwa nowsze kroki z bufora."""
+    def _resume_from_rewind(self):
+        self.rewind_buffer.truncate(self.rewind_offset)
+        self.rewind_offset = 0
 
-    def _handle_player_input(self):
+    """Włącza lub wyłącza tryb ćwiczeń; wyłączenie usuwa punkt kontrolny."""
+    def toggle_practice_mode(self):
+        self.practice_mode = not self.practice_mode
+        self.checkpoint_set = False
+
+    """Zapisuje bieżący stan fizyki jako punkt kontrolny trybu ćwiczeń."""
+    def place_checkpoint(self):
+        if not self.practice_mode: return
+
+        self.checkpoint.capture(self.engine, self.physics_state)
+        self.checkpoint_set = True
+
+    """Przywraca stan z punktu kontrolnego bez tworzenia nowych obiektów."""
+    def restore_checkpoint(self):
+        self.checkpoint.restore(self.engine, self.physics_state)
+        self.previous_physics_state.copy_from(self.physics_state)
+        self.physics_accumulator = 0.0
+
+        # Próba nie zaczyna się od początku poziomu, więc nie da się jej zapisać jako powtórki
+        self.replay_recorder = None
+
+        self.rewind_buffer.clear()
+        self.rewind_buffer.push(self.engine, self.physics_state)
+        self.rewind_offset = 0
+
+        self.engine.interpolate_player(self.player, self.previous_physics_state, self.physics_state, 0.0)
+
+    """Zapisuje wejście bieżącej próby do pliku powtórki."""
+    def save_replay(self):
+        if not config.RECORD_REPLAYS or self.replay_recorder is None: return
+
+        project_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+        replay_path = os.path.join(project_dir, config.REPLAY_PATH)
+
+        try:
+            self.replay_recorder.replay.save(replay_path)
+        except OSError as error:
+            print(f"Ostrzeżenie: Nie udało się zapisać powtórki {replay_path}: {error}")
+
+    @staticmethod
+    def _get_rewind_direction() -> int:
+        keys = pygame.key.get_pressed()
+
+        return int(keys[pygame.K_LEFT]) - int(keys[pygame.K_RIGHT])
+
+    @staticmethod
+    def _is_jump_pressed() -> bool:
         keys = pygame.key.get_pressed()
         mouse_buttons = pygame.mouse.get_pressed()
 
-        if keys[pygame.K_UP] or mouse_buttons[0]: self.engine.player_jump(self.player)
+        return bool(keys[pygame.K_UP] or mouse_buttons[0])
 
     def _update_ui_elements(self):
         self.ui_manager.progress_bar.value = self.player.x
 
-        self.ui_manager.attempt_counter_label.x = self.engine.camera_offset_x + config.ATTEMPT_LABEL_X_OFFSET
-        self.ui_manager.attempt_counter_label.set_text(f"Attempt {self.engine.attempts}")
+        self.ui_manager.attempt_counter_label.set_position(self.engine.camera_offset_x + config.ATTEMPT_LABEL_X_OFFSET, self.ui_manager.attempt_counter_label.y)
+        practice_text = " (Practice)" if self.practice_mode else ""
+        self.ui_manager.attempt_counter_label.set_text(f"Attempt {self.engine.attempts}{practice_text}")
         self.ui_manager.coordinate_x_label.set_text(f"x={self.player.x:.2f}")
         self.ui_manager.coordinate_y_label.set_text(f"y={self.player.y:.2f}")
         self.ui_manager.floor_y_label.set_text(f"x={self.floor.floor_y}")
@@ -105,15 +251,31 @@ class GameManager:
 
         self.engine.end_wall.wall_x = ( self.engine.end_wall.initial_wall_x + self.engine.camera_offset_x)
 
-        if self.player.x >= self.engine.end_wall.initial_wall_x:
+        if self.physics_state.x >= self.engine.end_wall.initial_wall_x:
             self.ui_manager.progress_bar.value = 0
+            self.save_replay()
             self.set_window_state(WindowState.LEVEL_COMPLETE)
 
     def level_start(self):
-        self.current_level = self.ui_manager.current_level
-        self.engine.reset_player(self.player)
-        self.engine.set_objects_from_layout(self.current_level["layout"])
+        # Zmiany z dziennika edytora trafiają najpierw do pliku poziomu - hash z manifestu musi odpowiadać układowi
+        self.current_level = self.level_editor.commit_level(self.ui_manager.current_level["index"]) or self.ui_manager.current_level
+        self.level_hash = bytes.fromhex(self.current_level["hash"])
+
+        # Bardzo długie poziomy (python -m game.level_segments) wczytywane są segmentami wokół gracza;
+        # binarna wersja poziomu (python -m game.level_binary) wczytuje się bez parsowania JSON
+        segmented_level = open_segmented_level(self.level_store, self.current_level)
+        binary_level = open_binary_level(self.level_store, self.current_level) if segmented_level is None else None
+        if segmented_level is not None:
+            self.engine.set_objects_from_segments(segmented_level)
+        elif binary_level is not None:
+            with binary_level:
+                self.engine.set_objects_from_binary(binary_level)
+        else:
+            # Skompilowane struktury poziomu wczytywane są z pamięci podręcznej po hashu układu
+            self.engine.set_objects_from_layout(self.level_store.get_layout(self.current_level), self.level_hash)
+        self.reset_physics()
         self.engine.attempts = 1
+        self.checkpoint_set = False
 
         furthest_object_x = self.engine.get_furthest_object_x()
         self.ui_manager.progress_bar.max_value = furthest_object_x
@@ -149,8 +311,15 @@ class GameManager:
             self.game_quit()
 
     def _handle_game_events(self, event):
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.set_window_state(WindowState.PAUSE)
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.set_window_state(WindowState.PAUSE)
+            elif event.key == pygame.K_p:
+                self.toggle_practice_mode()
+            elif event.key == pygame.K_z:
+                self.place_checkpoint()
+            elif event.key == pygame.K_x:
+                self.checkpoint_set = False
 
     def _handle_pause_events(self, event):
         self.ui_manager.resume_button.handle_event(event, lambda: self.set_window_state(WindowState.GAME))
@@ -260,8 +429,9 @@ class GameManager:
     def game_quit(self):
         self.running = False
 
-    def render(self):
-        self.ui_manager.render(
+    """Rysuje aktualny stan okna i zwraca zmienione prostokąty dla present."""
+    def render(self) -> list:
+        return self.ui_manager.render(
             self.window_state,
             self.player,
             self.floor,
@@ -269,6 +439,18 @@ class GameManager:
             self.engine
         )
 
+    """Pokazuje narysowaną klatkę w oknie."""
+    def present(self, dirty_rects: list):
+        """ Args:
+                dirty_rects: Prostokąty zwrócone przez render
+        """
+        # Przy logicznym płótnie (pygame.SCALED) SDL przesyła i skaluje zawsze całą klatkę - update z prostokątami
+        # i tak wykonuje pełne flip; brudne prostokąty oszczędzają wtedy tylko rysowanie widżetów na płótnie
+        if config.LOGICAL_CANVAS:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
     def set_window_state(self, window_state: WindowState):
         self._validate_window_state(window_state)
         self.window_state = window_state
@@ -277,25 +459,40 @@ class GameManager:
     def handle_resize(self, width: int, height: int):
         self._validate_resize_params(width, height)
 
+        # Przy logicznym płótnie SDL sam dopasowuje obraz do okna - powierzchnia rysowania się nie zmienia
+        if config.LOGICAL_CANVAS:
+            return
+
         new_width, new_height = self._calculate_new_dimensions(width, height)
 
         self.ui_manager.window = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
 
-    """Wczytywanie poziomów z pliku levels.json."""
+        self.apply_scale(ScaleContext.get(self.ui_manager.window.get_size()))
+
+    """Przelicza geometrię wszystkich widżetów i obiektów raz dla nowego rozmiaru okna."""
+    def apply_scale(self, context: ScaleContext):
+        self.ui_manager.apply_scale(context)
+        self.level_editor.apply_scale(context)
+        self.engine.apply_scale(context)
+        self.floor.apply_scale(context)
+        self.player.apply_scale(context)
+
+    """Wczytywanie manifestu poziomów z katalogu levels."""
     def load_levels(self):
         base_dir = os.path.dirname(os.path.abspath(__file__))
         project_dir = os.path.abspath(os.path.join(base_dir, ".."))
-        levels_path = os.path.join(project_dir, "levels", "levels.json")
+        levels_dir = os.path.join(project_dir, "levels")
+
+        self.level_store = LevelStore(levels_dir)
 
         try:
-            with open(levels_path, "r") as level_file:
-                self.levels = json.load(level_file)
+            self.levels = self.level_store.load()
         except FileNotFoundError:
-            print(f"Ostrzeżenie: Nie znaleziono żadnych poziomów: {levels_path}")
-            self.levels = {}
+            print(f"Ostrzeżenie: Nie znaleziono żadnych poziomów: {levels_dir}")
+            self.levels = []
         except json.JSONDecodeError:
-            print(f"BŁĄD: Nieprawidłowy json: {levels_path}")
-            self.levels = {}
+            print(f"BŁĄD: Nieprawidłowy json: {self.level_store.manifest_path}")
+            self.levels = []
 
     """Oblicza nowe wymiary okna zachowując współczynnik proporcji."""
     @staticmethod
@@ -0,0 +1,162 @@
+import argparse, mmap, os, struct
+
+import numpy as np
+
+from typing import Iterator, List, Optional, Tuple
+
+from game.level_store import LevelStore, layout_hash
+
+# Kody typów w kolumnie types; indeks w krotce to kod zapisany w pliku
+TYPE_NAMES = ("block", "spike", "jump_pad", "jump_orb")
+TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+# Nagłówek: znacznik, wersja, liczba obiektów, hash układu JSON, z którego powstał plik
+LEVEL_MAGIC = b"GDLV"
+LEVEL_VERSION = 1
+HEADER_FORMAT = "<4sBxxxI32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+BINARY_EXTENSION = ".gdl"
+
+"""Koduje układ poziomu do formatu kolumnowego: kolumna kodów typu (uint8) oraz kolumny x i y (int32)."""
+def encode_layout(layout: List[dict]) -> bytes:
+    """ Args:
+            layout: Układ poziomu (lista obiektów z type, x, y)
+        Returns:
+            Zawartość pliku .gdl
+    """
+    objects = [obj for obj in layout if obj.get("type") in TYPE_CODES]
+    count = len(objects)
+
+    types = np.fromiter((TYPE_CODES[obj["type"]] for obj in objects), dtype=np.uint8, count=count)
+    xs = np.fromiter((obj["x"] for obj in objects), dtype="<i4", count=count)
+    ys = np.fromiter((obj["y"] for obj in objects), dtype="<i4", count=count)
+
+    header = struct.pack(HEADER_FORMAT, LEVEL_MAGIC, LEVEL_VERSION, count, layout_hash(layout))
+
+    return header + types.tobytes() + bytes(column_padding(count)) + xs.tobytes() + ys.tobytes()
+
+"""Zapisuje układ poziomu do pliku binarnego (przez plik tymczasowy i zamianę nazwy)."""
+def write_level(path: str, layout: List[dict]):
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as level_file:
+        level_file.write(encode_layout(layout))
+
+    os.replace(temporary_path, path)
+
+"""Poziom w formacie kolumnowym zmapowany do pamięci - kolumny są widokami na plik, bez kopiowania."""
+class BinaryLevel:
+    def __init__(self, path: str):
+        assert isinstance(path, str), "path musi być stringiem"
+
+        self.path = path
+
+        with open(path, "rb") as level_file:
+            self.map = mmap.mmap(level_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._validate_header(self.map)
+            _, _, count, level_hash = struct.unpack_from(HEADER_FORMAT, self.map)
+            self._validate_size(len(self.map), count)
+        except ValueError:
+            self.map.close()
+            raise
+
+        self.count = count
+        self.level_hash = level_hash
+
+        xs_offset = HEADER_SIZE + count + column_padding(count)
+        self.types = np.frombuffer(self.map, dtype=np.uint8, count=count, offset=HEADER_SIZE)
+        self.xs = np.frombuffer(self.map, dtype="<i4", count=count, offset=xs_offset)
+        self.ys = np.frombuffer(self.map, dtype="<i4", count=count, offset=xs_offset + 4 * count)
+
+    """Zwraca kolejno obiekty jako krotki (typ, x, y)."""
+    def iter_objects(self) -> Iterator[Tuple[str, int, int]]:
+        for code, x, y in zip(self.types.tolist(), self.xs.tolist(), self.ys.tolist()):
+            yield TYPE_NAMES[code], x, y
+
+    """Odtwarza układ w formacie JSON (lista słowników)."""
+    def to_layout(self) -> List[dict]:
+        return [{"type": type_name, "x": x, "y": y} for type_name, x, y in self.iter_objects()]
+
+    """Zamyka mapowanie pliku; kolumny przestają być dostępne."""
+    def close(self):
+        # Widoki NumPy trzymają bufor mapowania - muszą zniknąć przed jego zamknięciem
+        self.types = self.xs = self.ys = None
+        self.map.close()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _validate_header(data):
+        if len(data) < HEADER_SIZE or data[:4] != LEVEL_MAGIC:
+            raise ValueError("To nie jest binarny plik poziomu")
+        if data[4] != LEVEL_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja binarnego pliku poziomu: {data[4]}")
+
+    @staticmethod
+    def _validate_size(size, count):
+        if size != HEADER_SIZE + count + column_padding(count) + 8 * count:
+            raise ValueError("Uszkodzony binarny plik poziomu")
+
+"""Zwraca ścieżkę pliku binarnego obok pliku JSON poziomu z manifestu."""
+def binary_path(store: LevelStore, entry: dict) -> str:
+    return os.path.join(store.directory, os.path.splitext(entry["file"])[0] + BINARY_EXTENSION)
+
+"""Otwiera binarną wersję poziomu, jeśli istnieje i powstała z aktualnego układu."""
+def open_binary_level(store: LevelStore, entry: dict) -> Optional[BinaryLevel]:
+    """ Args:
+            store: Magazyn poziomów
+            entry: Wpis manifestu poziomu
+        Returns:
+            BinaryLevel albo None, jeśli pliku nie ma lub jest nieaktualny
+    """
+    path = binary_path(store, entry)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        level = BinaryLevel(path)
+    except ValueError as error:
+        print(f"Ostrzeżenie: Pominięto plik {path}: {error}")
+        return None
+
+    if level.level_hash.hex() != entry["hash"]:
+        level.close()
+        return None
+
+    return level
+
+"""Zapisuje binarną wersję każdego poziomu z magazynu."""
+def convert_store(store: LevelStore) -> List[str]:
+    """ Returns:
+            Ścieżki zapisanych plików
+    """
+    paths = []
+    for entry in store.load():
+        path = binary_path(store, entry)
+        write_level(path, store.get_layout(entry))
+        paths.append(path)
+
+    return paths
+
+"""Zwraca liczbę bajtów dopełnienia po kolumnie typów - kolumny int32 zaczynają się od adresu podzielnego przez 4."""
+def column_padding(count: int) -> int:
+    return -count % 4
+
+def main():
+    parser = argparse.ArgumentParser(description="Konwertuje poziomy z JSON do binarnego formatu kolumnowego (.gdl).")
+    parser.add_argument("levels", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
+    args = parser.parse_args()
+
+    for path in convert_store(LevelStore(args.levels)):
+        print(f"Zapisano {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import os, struct, time
+
+import numpy as np
+
+from typing import Optional
+
+from config import config
+from game.level_compiler import SPAN_FIELDS, TRIGGER_FIELDS, CompiledLevel, LevelObjects
+
+# Nagłówek: znacznik, wersja, BLOCK_OUTER_SIZE, GRID_SIZE i rozmiar kolca, z którymi skompilowano poziom, liczby elementów kolumn
+# i koniec poziomu; dopełniony do 56 bajtów, żeby kolumny int64 były wyrównane (memoryview nie odczyta niewyrównanych wartości)
+CACHE_MAGIC = b"GDCC"
+CACHE_VERSION = 3
+HEADER_FORMAT = "<4sBxxxIIIIIIIIIxxxxq"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+CACHE_EXTENSION = ".gdc"
+
+"""Pamięć podręczna na dysku ze skompilowanymi strukturami poziomów (kolumny osi czasu obiektów wyzwalanych z krawędziami kolców, kolumny połączonych bloków, kolumny siatki przestrzennej, koniec poziomu), kluczowana hashem układu."""
+class LevelCache:
+    def __init__(self, directory: str,
+                 max_bytes: int = config.LEVEL_CACHE_BUDGET_MB * 1024 * 1024,
+                 max_age: float = config.LEVEL_CACHE_MAX_AGE_DAYS * 24 * 60 * 60):
+
+        assert isinstance(directory, str), "directory musi być stringiem"
+        assert isinstance(max_bytes, int) and max_bytes > 0, "max_bytes musi być dodatnią liczbą całkowitą"
+        assert isinstance(max_age, (int, float)) and max_age > 0, "max_age musi być liczbą dodatnią"
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    """Wczytuje skompilowane struktury poziomu dla istniejących obiektów; None, jeśli nie ma ich w pamięci podręcznej."""
+    def load(self, level_hash: bytes, objects: LevelObjects) -> Optional[CompiledLevel]:
+        """ Args:
+                level_hash: Hash układu poziomu (layout_hash)
+                objects: Obiekty poziomu w kolejności z układu
+            Returns:
+                CompiledLevel z kolumnami będącymi widokami na dane pliku albo None
+        """
+        path = self.get_path(level_hash)
+
+        try:
+            with open(path, "rb") as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return None
+
+        try:
+            self._validate_header(data)
+            header = struct.unpack_from(HEADER_FORMAT, data)
+            object_count, trigger_count, span_count, cell_count, cell_item_count, furthest_x = header[6:]
+            self._validate_size(len(data), trigger_count, span_count, cell_count, cell_item_count)
+        except ValueError as error:
+            print(f"Ostrzeżenie: Pominięto plik {path}: {error}")
+            return None
+
+        # Dane zależą od rozmiarów obiektów, kolców i siatki - po zmianie konfiguracji są kompilowane od nowa
+        if header[2:6] != self._config_key() or object_count != len(objects):
+            return None
+
+        compiled_level = self._read_structures(data, LevelObjects.from_objects(objects), trigger_count, span_count, cell_count, cell_item_count, furthest_x)
+
+        # Wiek liczony od ostatniego użycia - często wybierane poziomy nie są usuwane
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return compiled_level
+
+    @staticmethod
+    def _read_structures(data: bytes, objects: LevelObjects, trigger_count: int, span_count: int, cell_count: int, cell_item_count: int, furthest_x: int) -> CompiledLevel:
+        columns = []
+        offset = HEADER_SIZE
+        for count in (trigger_count * TRIGGER_FIELDS, span_count * SPAN_FIELDS, cell_count, cell_count + 1, cell_item_count):
+            columns.append(np.frombuffer(data, dtype="<i8", count=count, offset=offset))
+            offset += 8 * count
+
+        triggers, spans, cell_keys, cell_offsets, cell_items = columns
+
+        # Kolumny są widokami na dane pliku - bez przeliczania osi czasu, krawędzi kolców i komórek siatki
+        return CompiledLevel(objects, spans.reshape(SPAN_FIELDS, span_count), triggers.reshape(TRIGGER_FIELDS, trigger_count),
+                             (cell_keys, cell_offsets, cell_items), furthest_x)
+
+    """Zapisuje skompilowane struktury poziomu i usuwa najstarsze wpisy ponad limit rozmiaru lub wieku."""
+    def save(self, level_hash: bytes, compiled_level: CompiledLevel):
+        """ Args:
+                level_hash: Hash układu poziomu (layout_hash)
+                compiled_level: Wynik compile_level dla obiektów poziomu
+        """
+        triggers = compiled_level.trigger_columns
+        cell_keys, cell_offsets, cell_items = compiled_level.cells
+
+        header = struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, *self._config_key(), len(compiled_level.objects),
+                             triggers.shape[1], len(compiled_level.block_spans), len(cell_keys), len(cell_items), compiled_level.furthest_x)
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        path = self.get_path(level_hash)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as cache_file:
+            cache_file.write(header)
+            for column in (triggers, compiled_level.span_columns, cell_keys, cell_offsets, cell_items):
+                cache_file.write(column.astype("<i8").tobytes())
+
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    """Usuwa wpisy nieużywane dłużej niż max_age, a potem najdawniej używane, dopóki rozmiar przekracza max_bytes."""
+    def evict(self):
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(CACHE_EXTENSION)]
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        # Od najdawniej używanych
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        for mtime, size, path in entries:
+            if now - mtime <= self.max_age and total <= self.max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def get_path(self, level_hash: bytes) -> str:
+        return os.path.join(self.directory, level_hash.hex() + CACHE_EXTENSION)
+
+    @staticmethod
+    def _config_key() -> tuple:
+        return config.BLOCK_OUTER_SIZE, config.GRID_SIZE, config.SPIKE_OUTER_WIDTH, config.SPIKE_OUTER_HEIGHT
+
+    @staticmethod
+    def _validate_header(data):
+        if len(data) < HEADER_SIZE or data[:4] != CACHE_MAGIC:
+            raise ValueError("To nie jest plik pamięci podręcznej poziomu")
+        if data[4] != CACHE_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja pliku pamięci podręcznej poziomu: {data[4]}")
+
+    @staticmethod
+    def _validate_size(size, trigger_count, span_count, cell_count, cell_item_count):
+        if size != HEADER_SIZE + 8 * (trigger_count * TRIGGER_FIELDS + span_count * SPAN_FIELDS + cell_count + cell_count + 1 + cell_item_count):
+            raise ValueError("Uszkodzony plik pamięci podręcznej poziomu")
@@ -0,0 +1,312 @@
+import numpy as np
+
+from collections.abc import Sequence
+from typing import List, Optional, Tuple
+
+from config import config
+from game.level_binary import TYPE_CODES
+from game.spatial_grid import build_cell_columns
+
+from objects.block import Block
+from objects.spike import Spike
+from objects.jump_pad import JumpPad
+from objects.jump_orb import JumpOrb
+
+# Klasy obiektów w kolejności kodów typów z level_binary.TYPE_NAMES
+OBJECT_CLASSES = (Block, Spike, JumpPad, JumpOrb)
+OBJECT_CODES = {obj_class: code for code, obj_class in enumerate(OBJECT_CLASSES)}
+
+BLOCK_CODE = TYPE_CODES["block"]
+SPIKE_CODE = TYPE_CODES["spike"]
+
+# Wiersze kolumn połączonych bloków i osi czasu obiektów wyzwalanych
+SPAN_FIELDS = 5     # left, right, top, bottom, count
+TRIGGER_FIELDS = 6  # indeks w poziomie, lewa krawędź, prawa krawędź, c trzech krawędzi kolca
+
+"""Prostokątny kolider obejmujący poziomy ciąg sąsiadujących bloków na tej samej wysokości."""
+class BlockSpan:
+    __slots__ = ("left", "right", "top", "bottom", "bounds", "count")
+
+    def __init__(self, left: int, right: int, top: int, bottom: int, count: int):
+        self.left = left
+        self.right = right
+        self.top = top
+        self.bottom = bottom
+        self.count = count
+
+        # Słownik w formacie Engine._get_block_bounds, tworzony raz
+        self.bounds = {'left': left, 'right': right, 'top': top, 'bottom': bottom}
+
+    def __repr__(self):
+        return f"BlockSpan(left={self.left}, right={self.right}, top={self.top}, bottom={self.bottom}, count={self.count})"
+
+"""Obiekty poziomu zapisane kolumnami typ/x/y; obiekt tworzony jest dopiero przy pierwszym odczycie (rysowanie, kolizja)."""
+class LevelObjects(Sequence):
+    def __init__(self, types: np.ndarray, xs: np.ndarray, ys: np.ndarray, objects: Optional[list] = None):
+        """ Args:
+                types: Kody typów (level_binary.TYPE_NAMES)
+                xs: Pozycje x
+                ys: Pozycje y
+                objects: Gotowe obiekty dla tych kolumn; None - tworzone przy odczycie
+        """
+        assert len(types) == len(xs) == len(ys), "kolumny types, xs i ys muszą mieć tę samą długość"
+
+        self.types = types
+        self.xs = xs
+        self.ys = ys
+        self.objects = objects if objects is not None else [None] * len(types)
+
+        # Odczyt pojedynczych wartości z memoryview zwraca int Pythona, bez skalarów NumPy
+        self._type_values = memoryview(types)
+        self._x_values = memoryview(xs)
+        self._y_values = memoryview(ys)
+
+    """Tworzy kolumny z układu poziomu; nieznane typy są pomijane."""
+    @classmethod
+    def from_layout(cls, layout: List[dict]) -> "LevelObjects":
+        count = len(layout)
+        types = np.fromiter((TYPE_CODES.get(obj_data.get("type"), 255) for obj_data in layout), dtype=np.uint8, count=count)
+        xs = np.fromiter((obj_data.get("x") for obj_data in layout), dtype=np.int64, count=count)
+        ys = np.fromiter((obj_data.get("y") for obj_data in layout), dtype=np.int64, count=count)
+
+        known = types < len(OBJECT_CLASSES)
+        if not known.all():
+            types, xs, ys = types[known], xs[known], ys[known]
+
+        return cls(types, xs, ys)
+
+    """Kopiuje kolumny typ/x/y (np. z zamykanego pliku BinaryLevel)."""
+    @classmethod
+    def from_columns(cls, types: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> "LevelObjects":
+        return cls(np.array(types, dtype=np.uint8), np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64))
+
+    """Buduje kolumny dla istniejących obiektów; obiekty nie są tworzone ponownie."""
+    @classmethod
+    def from_objects(cls, objects: list) -> "LevelObjects":
+        if isinstance(objects, LevelObjects):
+            return objects
+
+        count = len(objects)
+        types = np.fromiter((OBJECT_CODES[type(obj)] for obj in objects), dtype=np.uint8, count=count)
+        xs = np.fromiter((obj.x for obj in objects), dtype=np.int64, count=count)
+        ys = np.fromiter((obj.y for obj in objects), dtype=np.int64, count=count)
+
+        return cls(types, xs, ys, list(objects))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        obj = self.objects[index]
+        if obj is None:
+            obj = OBJECT_CLASSES[self._type_values[index]](self._x_values[index], self._y_values[index])
+            self.objects[index] = obj
+
+        return obj
+
+    def __iter__(self):
+        for index in range(len(self.objects)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self.objects)
+
+"""Połączone bloki zapisane kolumnami; BlockSpan tworzony przy pierwszym odczycie (np. z siatki przestrzennej)."""
+class BlockSpans(Sequence):
+    def __init__(self, columns: np.ndarray):
+        """ Args:
+                columns: Tablica (SPAN_FIELDS, n) z wierszami left, right, top, bottom, count
+        """
+        self.columns = columns
+        self.spans: List[Optional[BlockSpan]] = [None] * columns.shape[1]
+        self._values = [memoryview(row) for row in columns]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        span = self.spans[index]
+        if span is None:
+            span = BlockSpan(*[row[index] for row in self._values])
+            self.spans[index] = span
+
+        return span
+
+    def __iter__(self):
+        for index in range(len(self.spans)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self.spans)
+
+"""Posortowana po x oś czasu kolców, jump padów i jump orbów; obiekt pobierany z LevelObjects przy pierwszym odczycie."""
+class TriggerTimeline(Sequence):
+    def __init__(self, objects: LevelObjects, columns: np.ndarray):
+        """ Args:
+                objects: Obiekty poziomu
+                columns: Tablica (TRIGGER_FIELDS, n) z kolumnami osi czasu (compile_triggers)
+        """
+        self.objects = objects
+        self.columns = columns
+        self.triggers: list = [None] * columns.shape[1]
+        self._order = memoryview(columns[0])
+        self._edges = [memoryview(row) for row in columns[3:]]
+        self._spike_template: Optional[tuple] = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+
+        obj = self.triggers[index]
+        if obj is None:
+            obj = self.objects[self._order[index]]
+            if isinstance(obj, Spike) and obj.collider_edges is None:
+                self._set_collider(obj, index)
+            self.triggers[index] = obj
+
+        return obj
+
+    """Ustawia kolider kolca z wyliczonych kolumn krawędzi zamiast budować go od nowa."""
+    def _set_collider(self, spike: Spike, index: int):
+        if self._spike_template is None:
+            self._spike_template = spike_template()
+
+        (left, top, right, bottom), edges = self._spike_template
+
+        spike.collider_bounds = (spike.x + left, spike.y + top, spike.x + right, spike.y + bottom)
+        spike.collider_edges = tuple((a, b, row[index]) for (a, b, _), row in zip(edges, self._edges))
+
+    def __iter__(self):
+        for index in range(len(self.triggers)):
+            yield self[index]
+
+    def __len__(self):
+        return len(self.triggers)
+
+"""Skompilowany poziom: połączone bloki, posortowana po x oś czasu kolców, jump padów i jump orbów oraz komórki siatki przestrzennej."""
+class CompiledLevel:
+    def __init__(self, objects: LevelObjects, spans: np.ndarray, triggers: np.ndarray, cells: Tuple[np.ndarray, np.ndarray, np.ndarray], furthest_x: int):
+        """ Args:
+                objects: Obiekty poziomu
+                spans: Kolumny połączonych bloków (SPAN_FIELDS, n)
+                triggers: Kolumny osi czasu obiektów wyzwalanych (TRIGGER_FIELDS, n)
+                cells: Kolumny komórek siatki przestrzennej (spatial_grid.build_cell_columns)
+                furthest_x: x najdalszego obiektu (0 dla pustego poziomu)
+        """
+        self.objects = objects
+        self.span_columns = spans
+        self.trigger_columns = triggers
+        self.cells = cells
+        self.furthest_x = furthest_x
+
+        self.block_spans = BlockSpans(spans)
+        self.triggers = TriggerTimeline(objects, triggers)
+
+        # Wszystkie obiekty wyzwalane mają tę samą szerokość, więc sortowanie po lewej krawędzi
+        # porządkuje też prawe krawędzie - kursor w Engine może przesuwać się po obu kolumnach
+        self.trigger_lefts = memoryview(triggers[1])
+        self.trigger_rights = memoryview(triggers[2])
+
+    """Zwraca pusty poziom."""
+    @classmethod
+    def empty(cls) -> "CompiledLevel":
+        return compile_level([])
+
+"""Kompiluje obiekty poziomu do struktur używanych przez Engine przy kolizjach - operacjami na kolumnach, bez tworzenia obiektów."""
+def compile_level(objects) -> CompiledLevel:
+    """ Args:
+            objects: LevelObjects albo lista obiektów poziomu (Block, Spike, JumpPad, JumpOrb)
+        Returns:
+            CompiledLevel z połączonymi blokami, osią czasu obiektów wyzwalanych i komórkami siatki
+    """
+    objects = LevelObjects.from_objects(objects)
+
+    is_block = objects.types == BLOCK_CODE
+    spans = merge_block_columns(objects.xs[is_block], objects.ys[is_block])
+
+    # Sortowanie stabilne - obiekty w tym samym x zachowują kolejność z układu poziomu
+    trigger_order = np.flatnonzero(~is_block)
+    trigger_order = trigger_order[np.argsort(objects.xs[trigger_order], kind="stable")]
+
+    cells = build_cell_columns(spans[0], spans[2], spans[1], spans[3], config.GRID_SIZE)
+    furthest_x = int(objects.xs.max()) if len(objects) else 0
+
+    return CompiledLevel(objects, spans, compile_triggers(objects, trigger_order), cells, furthest_x)
+
+"""Buduje kolumny osi czasu obiektów wyzwalanych: indeks obiektu, krawędzie x i współczynniki c krawędzi kolców."""
+def compile_triggers(objects: LevelObjects, trigger_order: np.ndarray) -> np.ndarray:
+    """ Args:
+            objects: Obiekty poziomu
+            trigger_order: Indeksy obiektów wyzwalanych posortowane po x
+        Returns:
+            Tablica (TRIGGER_FIELDS, n) typu int64
+    """
+    half_size = config.BLOCK_OUTER_SIZE // 2
+    xs = objects.xs[trigger_order]
+    ys = objects.ys[trigger_order]
+
+    triggers = np.zeros((TRIGGER_FIELDS, len(trigger_order)), dtype=np.int64)
+    triggers[0] = trigger_order
+    triggers[1] = xs - half_size
+    triggers[2] = xs + half_size
+
+    # Trójkąt kolca to przesunięty wzorzec: a i b krawędzi się nie zmieniają, a c = c0 - a*x - b*y
+    is_spike = objects.types[trigger_order] == SPIKE_CODE
+    _, edges = spike_template()
+    for row, (a, b, c) in enumerate(edges, start=3):
+        triggers[row] = np.where(is_spike, c - a * xs - b * ys, 0)
+
+    return triggers
+
+"""Zwraca kolider kolca w punkcie (0, 0): prostokąt ograniczający i współczynniki (a, b, c) trzech krawędzi."""
+def spike_template() -> tuple:
+    spike = Spike(0, 0)
+    spike.build_collider()
+
+    return spike.collider_bounds, spike.collider_edges
+
+"""Łączy bloki leżące obok siebie w tym samym wierszu w jeden kolider."""
+def merge_blocks(blocks: List[Block]) -> List[BlockSpan]:
+    """ Args:
+            blocks: Lista bloków
+        Returns:
+            Lista BlockSpan posortowana po (y, x)
+    """
+    xs = np.fromiter((block.x for block in blocks), dtype=np.int64, count=len(blocks))
+    ys = np.fromiter((block.y for block in blocks), dtype=np.int64, count=len(blocks))
+
+    return list(BlockSpans(merge_block_columns(xs, ys)))
+
+"""Łączy bloki z kolumn x/y: ciąg w jednym wierszu trwa, dopóki odstęp kolejnych bloków nie przekracza ich rozmiaru."""
+def merge_block_columns(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """ Args:
+            xs: Pozycje x bloków
+            ys: Pozycje y bloków
+        Returns:
+            Tablica (SPAN_FIELDS, n) typu int64, ciągi posortowane po (y, x)
+    """
+    size = config.BLOCK_OUTER_SIZE
+    half_size = size // 2
+
+    order = np.lexsort((xs, ys))
+    xs = xs[order].astype(np.int64)
+    ys = ys[order].astype(np.int64)
+
+    # Powtórzone bloki w tym samym miejscu liczone są raz
+    unique = np.ones(len(xs), dtype=bool)
+    unique[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+    xs, ys = xs[unique], ys[unique]
+
+    run_starts = np.ones(len(xs), dtype=bool)
+    run_starts[1:] = (ys[1:] != ys[:-1]) | (xs[1:] - xs[:-1] > size)
+    starts = np.flatnonzero(run_starts)
+    ends = np.append(starts[1:], len(xs))[:len(starts)] - 1
+
+    spans = np.empty((SPAN_FIELDS, len(starts)), dtype=np.int64)
+    spans[0] = xs[starts] - half_size
+    spans[1] = xs[ends] + half_size
+    spans[2] = ys[starts] - half_size
+    spans[3] = ys[starts] + half_size
+    spans[4] = ends - starts + 1
+
+    return spans
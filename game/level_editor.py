@@ -1,25 +1,53 @@
-import json
+import bisect, multiprocessing
 
 import pygame, os
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from game.floor import Floor
+from game.level_store import LevelStore
+from game.level_solver import SolveResult, check_snapshot
 from ui.button import Button
 from ui.label import Label
 from ui.slider import Slider
+from ui.scale_context import ScaleContext
 from config import config
 
 from objects.block import Block
-from objects.spike import Spike
-from objects.jump_pad import JumpPad
-from objects.jump_orb import JumpOrb
+from objects.sprite_cache import SpriteCache
+
+LEVELS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
 
 class LevelEditor:
-    def __init__(self, window: pygame.Surface, levels, floor: Floor):
+    def __init__(self, window: pygame.Surface, levels, floor: Floor, level_store: LevelStore = None):
         assert isinstance(window, pygame.Surface), "screen musi być instancją pygame.Surface"
         assert isinstance(floor, Floor), "floor musi być instancją klasy Floor"
+        assert level_store is None or isinstance(level_store, LevelStore), "level_store musi być instancją klasy LevelStore"
 
         self.window = window
+        # Wpisy manifestu współdzielone z GameManager i UIManager
         self.levels = levels
+        self.level_store = level_store if level_store is not None else LevelStore(LEVELS_DIR)
+
+        # Zmiany aktualnego poziomu od ostatniego zapisu (trafiają do dziennika) i liczba zmian w dzienniku od kompaktowania
+        self.pending_edits = []
+        self.journal_edit_count = 0
+
+        # Kompaktowanie dziennika do pliku poziomu działa w tle, w jednym wątku
+        self.compaction_executor = None
+        self.compaction = None
+
+        # Sprawdzanie solverem, czy zapisany poziom da się ukończyć, działa w tle, w osobnym procesie; wersja układu
+        # rośnie przy każdym zapisie i wczytaniu poziomu - wynik sprawdzenia starszej wersji jest odrzucany
+        self.solver_executor = None
+        self.solver_check = None
+        self.solver_check_version = 0
+        self.solver_check_pending = False
+        self.layout_version = 0
+        self.is_finishable = None
+        self.finishable_label = None
+
         self.current_level_index = -1
         self.current_level = self.create_empty_level()
 
@@ -69,6 +97,13 @@ class LevelEditor:
 
         self.max_slider_x = config.MAX_SLIDER_X
 
+        self.sprite_cache = SpriteCache()
+
+        # Indeksy obiektów układu posortowane po x - aktualizowane przy dodaniu i usunięciu obiektu, przebudowywane, gdy zmieni się układ
+        self.layout_index_source = None
+        self.layout_index_xs = []
+        self.layout_index_order = []
+
         self.editor_view_init()
 
     def editor_view_init(self):
@@ -101,6 +136,9 @@ class LevelEditor:
         self.selected_tool_label = Label(
             920, 850, "")
 
+        self.finishable_label = Label(
+            920, 790, "")
+
         self.change_tool("select")
 
         self.slider = Slider(
@@ -110,34 +148,167 @@ class LevelEditor:
         self.x_coordinate_label = Label(
             self.screen_width // 2, 125, "")
 
+    """Przekazuje kontekst skali widżetom edytora."""
+    def apply_scale(self, context: ScaleContext):
+        for button in self.buttons.values():
+            button.apply_scale(context)
+
+        self.selected_tool_label.apply_scale(context)
+        self.finishable_label.apply_scale(context)
+        self.slider.apply_scale(context)
+        self.x_coordinate_label.apply_scale(context)
+
+    """Zapisuje aktualny poziom - zmiany układu zapisanego już poziomu są dopisywane do dziennika, cały plik poziomu i manifest przepisywane są tylko dla nowego poziomu albo zmienionej nazwy lub trudności."""
     def save_levels(self):
-        BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-        PROJECT_DIR = os.path.abspath(os.path.join(BASE_DIR, ".."))
-        levels_path = os.path.join(PROJECT_DIR, "levels", "levels.json")
+        self.collect_compaction()
+        entry = self.get_entry(self.current_level["index"])
+
+        if entry is None or (entry["name"], entry["difficulty"]) != (self.current_level["name"], self.current_level["difficulty"]):
+            self.collect_compaction(wait=True)
 
-        if int(self.current_level["index"]) > len(self.levels):
-            self.levels.append(self.current_level)
+            self.replace_entry(self.level_store.save_level(self.current_level, self.levels))
+            self.journal_edit_count = 0
         else:
-            for index, level in enumerate(self.levels):
-                if level["index"] == self.current_level["index"]:
-                    self.levels[index] = self.current_level
-                    break
+            self.level_store.append_edits(entry, self.pending_edits)
+            self.journal_edit_count += len(self.pending_edits)
+
+            if self.journal_edit_count >= config.JOURNAL_COMPACT_EDITS and self.compaction is None:
+                self.start_compaction(entry)
+
+        self.pending_edits = []
 
-        with open(levels_path, "w") as file:
-            json.dump(self.levels, file, indent=2)
+        self.layout_version += 1
+        self.start_solver_check()
+
+    """Przepisuje w tle plik poziomu ze zmianami z dziennika."""
+    def start_compaction(self, entry: dict):
+        if self.compaction_executor is None:
+            self.compaction_executor = ThreadPoolExecutor(max_workers=1)
+
+        self.compaction = self.compaction_executor.submit(self.level_store.compact, entry)
+        self.journal_edit_count = 0
+
+    """Odbiera wynik kompaktowania w tle i aktualizuje wpis poziomu."""
+    def collect_compaction(self, wait: bool = False):
+        """ Args:
+                wait: Czekaj na zakończenie kompaktowania zamiast sprawdzić, czy już się zakończyło
+        """
+        if self.compaction is None or (not wait and not self.compaction.done()):
+            return
+
+        compaction, self.compaction = self.compaction, None
+        try:
+            self.replace_entry(compaction.result())
+        except (OSError, ValueError) as error:
+            # Zmiany zostają w dzienniku - kolejne kompaktowanie spróbuje ponownie
+            print(f"Ostrzeżenie: Nie udało się przepisać poziomu: {error}")
+
+    """Przenosi do pliku poziomu wszystkie zmiany z dziennika (przed grą w poziom) i zwraca aktualny wpis."""
+    def commit_level(self, level_index: str) -> dict:
+        self.collect_compaction(wait=True)
+
+        entry = self.get_entry(level_index)
+        if entry is not None and self.level_store.has_pending_edits(entry):
+            entry = self.level_store.compact(entry)
+            self.replace_entry(entry)
+
+        return entry
+
+    def get_entry(self, level_index: str):
+        for level in self.levels:
+            if level["index"] == level_index:
+                return level
+
+        return None
+
+    def replace_entry(self, entry: dict):
+        for index, level in enumerate(self.levels):
+            if level["index"] == entry["index"]:
+                self.levels[index] = entry
+                break
+        else:
+            self.levels.append(entry)
+
+    """Uruchamia w tle sprawdzenie, czy zapisany aktualny poziom da się ukończyć; trwające sprawdzenie zostanie po zakończeniu powtórzone dla nowego układu."""
+    def start_solver_check(self):
+        self.is_finishable = None
+        self._set_finishable_text("Finishable: checking...")
+
+        if self.solver_check is not None:
+            self.solver_check_pending = True
+            return
+
+        # Nowy interpreter zamiast fork - kopiowanie przy zapisie stron dużego poziomu spowalniałoby edytor po uruchomieniu sprawdzenia
+        if self.solver_executor is None:
+            self.solver_executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+        # Proces dostaje tekst pliku poziomu i dziennika odczytany pod blokadą magazynu - serializacja długiego układu
+        # blokowałaby edytor, a samodzielny odczyt w procesie mógłby trafić na plik i dziennik z różnych chwil kompaktowania
+        snapshot = self.level_store.read_snapshot(self.get_entry(self.current_level["index"]))
+        self.solver_check = self.solver_executor.submit(check_snapshot, snapshot,
+                                                       config.SOLVER_TIME_BUDGET, config.SOLVER_MAX_STATES)
+        self.solver_check_version = self.layout_version
+        self.solver_check_pending = False
+
+    """Odbiera wynik sprawdzenia w tle i pokazuje go w edytorze."""
+    def collect_solver_check(self, wait: bool = False) -> SolveResult:
+        """ Args:
+                wait: Czekaj na zakończenie sprawdzenia zamiast sprawdzić, czy już się zakończyło
+            Returns:
+                Wynik sprawdzenia aktualnego układu albo None, jeśli go jeszcze nie ma
+        """
+        if self.solver_check is None or (not wait and not self.solver_check.done()):
+            return None
+
+        solver_check, self.solver_check = self.solver_check, None
+        if self.solver_check_version != self.layout_version:
+            if self.solver_check_pending:
+                self.start_solver_check()
+                return self.collect_solver_check(wait) if wait else None
+            return None
+
+        try:
+            result = solver_check.result()
+        except (BrokenProcessPool, OSError, ValueError) as error:
+            print(f"Ostrzeżenie: Nie udało się sprawdzić poziomu: {error}")
+            self._set_finishable_text("")
+            return None
+
+        self.is_finishable = result.finishable
+        self._set_finishable_text({True: "Finishable: yes", False: "Finishable: NO", None: "Finishable: unknown"}[result.finishable])
+
+        if result.finishable is False:
+            print(f"Ostrzeżenie: Poziomu \"{self.current_level['name']}\" nie da się ukończyć")
+
+        return result
+
+    """Odrzuca wynik sprawdzenia poprzedniego poziomu po wczytaniu lub utworzeniu nowego."""
+    def reset_solver_check(self):
+        self.layout_version += 1
+        self.solver_check_pending = False
+        self.is_finishable = None
+        self._set_finishable_text("")
+
+    def _set_finishable_text(self, text: str):
+        if self.finishable_label is not None:
+            self.finishable_label.set_text(text)
 
     def load_level(self, index: int):
         assert isinstance(index, int) and index > 0, "index musi być dodatnią liczbą całkowitą"
 
         for level in self.levels:
             if int(level["index"]) == index:
-                self.current_level = level.copy()
+                self.current_level = {**level, "layout": self.level_store.get_layout(level)}
                 self.current_level_index = index
+                self.pending_edits = []
+                self.reset_solver_check()
                 self.name_input = level["name"]
                 self.difficulty_input = level["difficulty"]
 
     def create_empty_level(self) -> list:
         self.current_level_index = len(self.levels)
+        self.pending_edits = []
+        self.reset_solver_check()
         return \
             {
             "index": str(len(self.levels) + 1),
@@ -243,39 +414,103 @@ class LevelEditor:
             self.slider.max_val = furthest_obj_x + config.SLIDER_MARGIN
 
     def draw_objects(self):
-        for x, obj in enumerate(self.current_level["layout"]):
-            is_selected = (x == self.selected_object_index)
-            self.draw_object(obj, is_selected)
+        self.sprite_cache.update(self.window)
+
+        layout = self.current_level["layout"]
+        visible = self.get_visible_object_indices()
+
+        blit_sequence = []
+        for index in visible:
+            obj = layout[index]
+            screen_pos = self.world_to_screen((obj["x"], obj["y"]))
+            blit_sequence.append(self._get_object_blit(obj, screen_pos))
+
+        # Podświetlenie rysowane pod zaznaczonym obiektem, tak jak przy rysowaniu pojedynczo
+        selected = bisect.bisect_left(visible, self.selected_object_index)
+        if selected < len(visible) and visible[selected] == self.selected_object_index:
+            self.window.blits(blit_sequence[:selected], False)
+            self.draw_highlight(layout[self.selected_object_index])
+            self.window.blits(blit_sequence[selected:], False)
+        else:
+            self.window.blits(blit_sequence, False)
+
+    """Zwraca rosnące indeksy obiektów układu widocznych przy aktualnym przesunięciu kamery."""
+    def get_visible_object_indices(self) -> list:
+        layout = self.current_level["layout"]
+        if self.layout_index_source is not layout or len(self.layout_index_order) != len(layout):
+            self.rebuild_layout_index()
+
+        # Ten sam zakres co w Engine: obiekt jest widoczny, gdy -RENDER_MARGIN < ekranowe x < SCREEN_WIDTH + RENDER_MARGIN
+        start = bisect.bisect_right(self.layout_index_xs, -self.camera_offset_x - config.RENDER_MARGIN)
+        end = bisect.bisect_left(self.layout_index_xs, -self.camera_offset_x + config.SCREEN_WIDTH + config.RENDER_MARGIN)
+
+        return sorted(self.layout_index_order[start:end])
+
+    """Buduje posortowany po x indeks obiektów aktualnego układu."""
+    def rebuild_layout_index(self):
+        layout = self.current_level["layout"]
+        order = sorted(range(len(layout)), key=lambda index: layout[index]["x"])
+
+        self.layout_index_source = layout
+        self.layout_index_order = order
+        self.layout_index_xs = [layout[index]["x"] for index in order]
+
+    """Dopisuje do indeksu obiekt dodany na końcu układu."""
+    def add_to_layout_index(self):
+        layout = self.current_level["layout"]
+        if self.layout_index_source is not layout or len(self.layout_index_order) != len(layout) - 1:
+            self.rebuild_layout_index()
+            return
+
+        # Za obiektami o tym samym x - jak w stabilnym sortowaniu przy przebudowie
+        x = layout[-1]["x"]
+        position = bisect.bisect_right(self.layout_index_xs, x)
+        self.layout_index_xs.insert(position, x)
+        self.layout_index_order.insert(position, len(layout) - 1)
+
+    """Usuwa z indeksu obiekt usunięty z układu i przesuwa indeksy obiektów za nim."""
+    def remove_from_layout_index(self, index: int, x: int):
+        layout = self.current_level["layout"]
+        if self.layout_index_source is not layout or len(self.layout_index_order) != len(layout) + 1:
+            self.rebuild_layout_index()
+            return
+
+        start = bisect.bisect_left(self.layout_index_xs, x)
+        end = bisect.bisect_right(self.layout_index_xs, x)
+        position = self.layout_index_order.index(index, start, end)
+
+        del self.layout_index_xs[position]
+        del self.layout_index_order[position]
+        self.layout_index_order = [order - 1 if order > index else order for order in self.layout_index_order]
 
     def draw_object(self, obj, is_selected):
         assert isinstance(is_selected, bool), "is_selected musi być wartością boolowską"
 
-        obj_type = obj["type"]
-        screen_pos = self.world_to_screen((obj["x"], obj["y"]))
+        self.sprite_cache.update(self.window)
 
         if is_selected:
-            highlight_color = config.HIGHLIGHT_COLOR
+            self.draw_highlight(obj)
 
-            if obj_type == "block":
-                rect = pygame.Rect(
-                    screen_pos[0] - self.grid_size // 2 - 2,
-                    screen_pos[1] - self.grid_size // 2 - 2,
-                    self.grid_size + 4,
-                    self.grid_size + 4
-                )
-                pygame.draw.rect(self.window, highlight_color, rect, 2)
-            else:
-                pygame.draw.circle(self.window, highlight_color, (screen_pos[0], screen_pos[1]), self.grid_size // 2, 2)
+        screen_pos = self.world_to_screen((obj["x"], obj["y"]))
+        self.window.blit(*self._get_object_blit(obj, screen_pos))
 
-        types = {
-            "block" : Block(screen_pos[0], screen_pos[1]),
-            "spike" : Spike(screen_pos[0], screen_pos[1]),
-            "jump_orb" : JumpOrb(screen_pos[0], screen_pos[1]),
-            "jump_pad": JumpPad(screen_pos[0], screen_pos[1])
-        }
+    def draw_highlight(self, obj):
+        screen_pos = self.world_to_screen((obj["x"], obj["y"]))
+        highlight_color = config.HIGHLIGHT_COLOR
 
-        types[obj_type].draw(self.window)
+        if obj["type"] == "block":
+            rect = pygame.Rect(
+                screen_pos[0] - self.grid_size // 2 - 2,
+                screen_pos[1] - self.grid_size // 2 - 2,
+                self.grid_size + 4,
+                self.grid_size + 4
+            )
+            pygame.draw.rect(self.window, highlight_color, rect, 2)
+        else:
+            pygame.draw.circle(self.window, highlight_color, (screen_pos[0], screen_pos[1]), self.grid_size // 2, 2)
 
+    def _get_object_blit(self, obj, screen_pos):
+        return self.sprite_cache.get_blit(SpriteCache.LAYOUT_TYPES[obj["type"]], screen_pos[0], screen_pos[1])
 
     def add_object(self, obj_type: str, position):
         assert isinstance(position, tuple) and all(isinstance(x, int) for x in position), "position musi być krotką 2 liczb całkowitych"
@@ -291,8 +526,10 @@ class LevelEditor:
         new_obj = {"type": obj_type, "x": x, "y": y}
 
         self.current_level["layout"].append(new_obj)
+        self.pending_edits.append({"op": "add", "object": dict(new_obj)})
         self.selected_object = new_obj
         self.selected_object_index = len(self.current_level["layout"]) - 1
+        self.add_to_layout_index()
 
         self.update_slider_x()
 
@@ -314,8 +551,10 @@ class LevelEditor:
 
             if obj_grid_x == grid_x and obj_grid_y == grid_y:
                 del self.current_level["layout"][index]
+                self.pending_edits.append({"op": "delete", "index": index})
                 self.selected_object = None
                 self.selected_object_index = -1
+                self.remove_from_layout_index(index, obj_x)
                 break
 
     def handle_event(self, event: pygame.event, save_button_event, load_button_event, exit_button_event):
@@ -356,11 +595,14 @@ class LevelEditor:
                     self.add_object(self.selected_tool, world_pos)
 
     def render(self):
+        self.collect_solver_check()
+
         self.draw_grid()
         self.draw_objects()
 
         self.floor.draw(self.window)
         self.selected_tool_label.draw(self.window)
+        self.finishable_label.draw(self.window)
 
         self.slider.draw(self.window)
         self.x_coordinate_label.draw(self.window)
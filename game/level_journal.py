@@ -0,0 +1,129 @@
+import json, os
+
+from typing import List, Optional, Tuple
+
+JOURNAL_EXTENSION = ".journal"
+
+"""Dopisywany na końcu pliku dziennik zmian układu jednego poziomu (add, delete) - zapis zmiany nie przepisuje całego poziomu."""
+class LevelJournal:
+    def __init__(self, path: str):
+        assert isinstance(path, str), "path musi być stringiem"
+
+        self.path = path
+
+    """Dopisuje zmiany na końcu dziennika i czeka na zapis na dysk."""
+    def append(self, base_hash: str, edits: List[dict]):
+        """ Args:
+                base_hash: Hash (hex) układu, na który nakładane są zmiany - zapisywany tylko w nowym dzienniku
+                edits: Zmiany w kolejności wykonania
+        """
+        for edit in edits:
+            self._validate_edit(edit)
+
+        # Pierwszy wiersz dziennika to nagłówek z hashem układu bazowego, kolejne to po jednej zmianie
+        lines = [] if self._truncate_torn_line() else [json.dumps({"base": base_hash})]
+        lines.extend(json.dumps(edit, separators=(", ", ": ")) for edit in edits)
+        if not lines:
+            return
+
+        with open(self.path, "a") as journal_file:
+            journal_file.write("\n".join(lines) + "\n")
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+    """Wczytuje dziennik; urwany ostatni wiersz (przerwany zapis) jest pomijany."""
+    def read(self) -> Tuple[Optional[str], List[dict]]:
+        """ Returns:
+                Hash układu bazowego (None, jeśli dziennika nie ma) i lista zmian
+        """
+        return self.parse(self.read_text(), self.path)
+
+    """Zwraca całą zawartość dziennika (None, jeśli dziennika nie ma)."""
+    def read_text(self) -> Optional[str]:
+        if not self.exists():
+            return None
+
+        with open(self.path, "r") as journal_file:
+            return journal_file.read()
+
+    """Dzieli zawartość dziennika na hash układu bazowego i zmiany; urwany ostatni wiersz jest pomijany."""
+    @staticmethod
+    def parse(text: Optional[str], path: str) -> Tuple[Optional[str], List[dict]]:
+        """ Args:
+                text: Zawartość dziennika z read_text
+                path: Ścieżka dziennika (do komunikatu o błędzie)
+            Returns:
+                Hash układu bazowego (None, jeśli dziennika nie ma) i lista zmian
+        """
+        if text is None:
+            return None, []
+
+        lines = text.split("\n")
+
+        # Każdy pełny wpis kończy się znakiem nowej linii - ostatni element to pusty tekst albo urwany wpis
+        try:
+            base_hash = json.loads(lines[0])["base"] if len(lines) > 1 else None
+            edits = [json.loads(line) for line in lines[1:-1]]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Uszkodzony dziennik zmian poziomu: {path}")
+
+        return base_hash, edits
+
+    """Zastępuje dziennik nowym (nowy układ bazowy i zmiany jeszcze w nim nieuwzględnione) przez plik tymczasowy i zamianę nazwy."""
+    def rewrite(self, base_hash: str, edits: List[dict]):
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as journal_file:
+            journal_file.write("".join(json.dumps(line, separators=(", ", ": ")) + "\n" for line in [{"base": base_hash}, *edits]))
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        os.replace(temporary_path, self.path)
+
+    """Usuwa urwany ostatni wiersz po przerwanym zapisie - nowy wpis nie może zostać doklejony do jego fragmentu."""
+    def _truncate_torn_line(self) -> bool:
+        """ Returns:
+                Czy dziennik zawiera przynajmniej pełny nagłówek
+        """
+        if not self.exists():
+            return False
+
+        with open(self.path, "r+b") as journal_file:
+            size = journal_file.seek(0, os.SEEK_END)
+            if size == 0:
+                return False
+
+            journal_file.seek(size - 1)
+            if journal_file.read(1) == b"\n":
+                return True
+
+            journal_file.seek(0)
+            end = journal_file.read().rfind(b"\n") + 1
+            journal_file.truncate(end)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+
+        return end > 0
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def remove(self):
+        if self.exists():
+            os.remove(self.path)
+
+    """Nakłada zmiany z dziennika na układ (w miejscu) i zwraca go."""
+    @staticmethod
+    def apply_edits(layout: List[dict], edits: List[dict]) -> List[dict]:
+        for edit in edits:
+            match edit["op"]:
+                case "add":
+                    layout.append(dict(edit["object"]))
+                case "delete":
+                    del layout[edit["index"]]
+
+        return layout
+
+    @staticmethod
+    def _validate_edit(edit):
+        if not isinstance(edit, dict) or edit.get("op") not in ("add", "delete"):
+            raise ValueError("Zmiana w dzienniku musi być słownikiem z op równym add albo delete")
@@ -0,0 +1,170 @@
+import argparse, mmap, os, struct
+
+import numpy as np
+
+from typing import Iterator, List, Optional, Tuple
+
+from config import config
+from game.level_binary import TYPE_CODES, TYPE_NAMES, column_padding
+from game.level_store import LevelStore, layout_hash
+
+# Nagłówek: znacznik, wersja, liczba obiektów, szerokość segmentu, liczba segmentów, hash układu JSON
+SEGMENTS_MAGIC = b"GDSG"
+SEGMENTS_VERSION = 1
+HEADER_FORMAT = "<4sBxxxIII32s"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SEGMENTS_EXTENSION = ".gds"
+
+"""Koduje układ do kontenera segmentów: obiekty posortowane po x, indeks początków segmentów i kolumny typ/x/y."""
+def encode_segmented_layout(layout: List[dict], segment_width: int = config.SEGMENT_WIDTH) -> bytes:
+    """ Args:
+            layout: Układ poziomu (lista obiektów z type, x, y)
+            segment_width: Szerokość segmentu w jednostkach świata
+        Returns:
+            Zawartość pliku .gds
+    """
+    assert isinstance(segment_width, int) and segment_width > 0, "segment_width musi być dodatnią liczbą całkowitą"
+
+    # Sortowanie stabilne - obiekty w tym samym x zachowują kolejność z układu
+    objects = sorted((obj for obj in layout if obj.get("type") in TYPE_CODES), key=lambda obj: obj["x"])
+    count = len(objects)
+
+    types = np.fromiter((TYPE_CODES[obj["type"]] for obj in objects), dtype=np.uint8, count=count)
+    xs = np.fromiter((obj["x"] for obj in objects), dtype="<i4", count=count)
+    ys = np.fromiter((obj["y"] for obj in objects), dtype="<i4", count=count)
+
+    # Obiekty o x < 0 należą do segmentu 0
+    segment_count = int(xs.max()) // segment_width + 1 if count and xs.max() > 0 else 1
+    boundaries = np.arange(segment_count + 1, dtype=np.int64) * segment_width
+    index = np.searchsorted(xs, boundaries, side="left").astype("<u4")
+    index[0] = 0
+    index[-1] = count
+
+    header = struct.pack(HEADER_FORMAT, SEGMENTS_MAGIC, SEGMENTS_VERSION, count, segment_width, segment_count, layout_hash(layout))
+
+    return header + index.tobytes() + types.tobytes() + bytes(column_padding(count)) + xs.tobytes() + ys.tobytes()
+
+"""Zapisuje układ poziomu do kontenera segmentów (przez plik tymczasowy i zamianę nazwy)."""
+def write_segmented_level(path: str, layout: List[dict], segment_width: int = config.SEGMENT_WIDTH):
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as level_file:
+        level_file.write(encode_segmented_layout(layout, segment_width))
+
+    os.replace(temporary_path, path)
+
+"""Poziom podzielony na segmenty o stałej szerokości, zmapowany do pamięci; segment wczytywany jest tylko na żądanie."""
+class SegmentedLevel:
+    def __init__(self, path: str):
+        assert isinstance(path, str), "path musi być stringiem"
+
+        self.path = path
+
+        with open(path, "rb") as level_file:
+            self.map = mmap.mmap(level_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._validate_header(self.map)
+            _, _, count, segment_width, segment_count, level_hash = struct.unpack_from(HEADER_FORMAT, self.map)
+            self._validate_size(len(self.map), count, segment_count)
+        except ValueError:
+            self.map.close()
+            raise
+
+        self.count = count
+        self.segment_width = segment_width
+        self.segment_count = segment_count
+        self.level_hash = level_hash
+
+        types_offset = HEADER_SIZE + 4 * (segment_count + 1)
+        xs_offset = types_offset + count + column_padding(count)
+        self.index = np.frombuffer(self.map, dtype="<u4", count=segment_count + 1, offset=HEADER_SIZE)
+        self.types = np.frombuffer(self.map, dtype=np.uint8, count=count, offset=types_offset)
+        self.xs = np.frombuffer(self.map, dtype="<i4", count=count, offset=xs_offset)
+        self.ys = np.frombuffer(self.map, dtype="<i4", count=count, offset=xs_offset + 4 * count)
+
+        # Obiekty są posortowane po x, więc ostatni wyznacza koniec poziomu
+        self.end_x = int(self.xs[-1]) if count else 0
+
+    """Zwraca numer segmentu zawierającego pozycję x (ograniczony do istniejących segmentów)."""
+    def segment_at(self, x: float) -> int:
+        return min(max(int(x // self.segment_width), 0), self.segment_count - 1)
+
+    """Zwraca obiekty jednego segmentu jako krotki (typ, x, y)."""
+    def iter_segment(self, segment: int) -> Iterator[Tuple[str, int, int]]:
+        start, end = int(self.index[segment]), int(self.index[segment + 1])
+
+        for code, x, y in zip(self.types[start:end].tolist(), self.xs[start:end].tolist(), self.ys[start:end].tolist()):
+            yield TYPE_NAMES[code], x, y
+
+    """Zamyka mapowanie pliku."""
+    def close(self):
+        self.index = self.types = self.xs = self.ys = None
+        self.map.close()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _validate_header(data):
+        if len(data) < HEADER_SIZE or data[:4] != SEGMENTS_MAGIC:
+            raise ValueError("To nie jest plik poziomu z segmentami")
+        if data[4] != SEGMENTS_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja pliku poziomu z segmentami: {data[4]}")
+
+    @staticmethod
+    def _validate_size(size, count, segment_count):
+        if segment_count == 0 or size != HEADER_SIZE + 4 * (segment_count + 1) + count + column_padding(count) + 8 * count:
+            raise ValueError("Uszkodzony plik poziomu z segmentami")
+
+"""Zwraca ścieżkę kontenera segmentów obok pliku JSON poziomu z manifestu."""
+def segmented_path(store: LevelStore, entry: dict) -> str:
+    return os.path.join(store.directory, os.path.splitext(entry["file"])[0] + SEGMENTS_EXTENSION)
+
+"""Otwiera kontener segmentów poziomu, jeśli istnieje i powstał z aktualnego układu."""
+def open_segmented_level(store: LevelStore, entry: dict) -> Optional[SegmentedLevel]:
+    """ Args:
+            store: Magazyn poziomów
+            entry: Wpis manifestu poziomu
+        Returns:
+            SegmentedLevel albo None, jeśli pliku nie ma lub jest nieaktualny
+    """
+    path = segmented_path(store, entry)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        level = SegmentedLevel(path)
+    except ValueError as error:
+        print(f"Ostrzeżenie: Pominięto plik {path}: {error}")
+        return None
+
+    if level.level_hash.hex() != entry["hash"]:
+        level.close()
+        return None
+
+    return level
+
+def main():
+    parser = argparse.ArgumentParser(description="Zapisuje poziomy jako kontenery segmentów (.gds) wczytywane strumieniowo przez Engine.")
+    parser.add_argument("levels", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
+    parser.add_argument("--index", help="Konwertuj tylko poziom o podanym indeksie")
+    parser.add_argument("--segment-width", type=int, default=config.SEGMENT_WIDTH)
+    args = parser.parse_args()
+
+    store = LevelStore(args.levels)
+    for entry in store.load():
+        if args.index is not None and entry["index"] != args.index:
+            continue
+
+        path = segmented_path(store, entry)
+        write_segmented_level(path, store.get_layout(entry), args.segment_width)
+        print(f"Zapisano {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+import argparse, bisect, multiprocessing, os, time
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Optional, Tuple
+
+from config import config
+from game.engine import Engine
+from game.floor import Floor
+from game.level_binary import TYPE_CODES
+from game.level_store import LevelSnapshot, LevelStore, load_full_levels
+from game.simulation_state import SimulationState
+
+# Kwantyzacja stanu przy usuwaniu powtórzeń: (x, y) co 1 px, prędkość pionowa co VELOCITY_QUANTUM px/s
+POSITION_QUANTUM = 1.0
+VELOCITY_QUANTUM = 15.0
+
+# Przy dzieleniu jednego poziomu między procesy: stany startowe na proces i maksymalna głębokość (w oknach decyzji) ich szukania
+SEEDS_PER_WORKER = 4
+SEED_MAX_DEPTH = 64
+
+# Ustawiany w procesach potomnych solve_level - przerywa przeszukiwanie, gdy inny proces już rozstrzygnął poziom
+_stop_event = None
+
+"""Wynik sprawdzenia, czy poziom da się ukończyć."""
+class SolveResult:
+    def __init__(self, finishable: Optional[bool], inputs: List[bool], explored: int):
+        # None - budżet przeszukiwania skończył się, zanim udało się rozstrzygnąć
+        self.finishable = finishable
+        self.inputs = inputs
+        self.explored = explored
+
+    def __repr__(self):
+        return f"SolveResult(finishable={self.finishable}, ticks={len(self.inputs)}, explored={self.explored})"
+
+"""Przeszukuje momenty skoków na fizyce Engine.step i szuka przejścia poziomu."""
+class LevelSolver:
+    def __init__(self, layout: List[dict],
+                 decision_ticks: int = 4,
+                 time_budget: Optional[float] = None,
+                 max_states: Optional[int] = None,
+                 stop_event=None):
+
+        assert isinstance(layout, list), "layout musi być listą"
+        assert isinstance(decision_ticks, int) and decision_ticks > 0, "decision_ticks musi być dodatnią liczbą całkowitą"
+        assert time_budget is None or (isinstance(time_budget, (int, float)) and time_budget > 0), "time_budget musi być liczbą dodatnią"
+        assert max_states is None or (isinstance(max_states, int) and max_states > 0), "max_states musi być dodatnią liczbą całkowitą"
+
+        self.layout = layout
+
+        # Wejście (skok lub brak skoku) trzymane jest przez decision_ticks kroków fizyki
+        self.decision_ticks = decision_ticks
+
+        # Po przekroczeniu budżetu wynik jest nierozstrzygnięty (finishable=None)
+        self.time_budget = time_budget
+        self.max_states = max_states
+        self.stop_event = stop_event
+
+        self.engine = _create_engine(layout)
+        self.level_end_x = self.engine.get_furthest_object_x()
+
+        # Orby wyzwalane skokiem - w ich pobliżu gałąź ze skokiem jest rozwijana zawsze
+        objects = self.engine.objects
+        self.orb_xs = sorted(objects.xs[objects.types == TYPE_CODES["jump_orb"]].tolist())
+        self.orb_reach = config.PLAYER_OUTER_SIZE + config.PLAYER_SPEED * config.PHYSICS_TIMESTEP * decision_ticks
+
+    """Sprawdza, czy poziom da się ukończyć i zwraca przykładową sekwencję wejść."""
+    def solve(self, seeds: Optional[list] = None) -> SolveResult:
+        """ Args:
+                seeds: Stany startowe (spakowany stan, ścieżka decyzji) z LevelSolver.seed; None - początek poziomu
+            Returns:
+                SolveResult z flagą finishable i sekwencją wejść (jedno na krok fizyki); przy seeds False oznacza,
+                że żaden z podanych stanów nie prowadzi do końca poziomu
+        """
+        engine = self.engine
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+
+        if seeds is None:
+            seeds = [(_pack_state(engine.create_state()), None)]
+
+        # Przeszukiwanie w głąb - zawsze rozwijany jest stan, który zaszedł najdalej, więc na przechodnim poziomie
+        # praca rośnie liniowo z jego długością zamiast z szerokością całego frontu; odwiedzone stany nie są powtarzane
+        stack = list(reversed(seeds))
+        visited = {_quantize(_unpack_state(packed)) for packed, _ in seeds}
+        explored = 0
+        expanded = 0
+
+        while stack:
+            packed, path = stack.pop()
+
+            children, inputs, branches = self._expand(packed, path, visited)
+            explored += branches
+            expanded += 1
+
+            if inputs is not None:
+                return SolveResult(True, inputs, explored)
+            if self._budget_exceeded(explored, expanded, deadline):
+                return SolveResult(None, [], explored)
+
+            # Gałąź bez skoku jest rozwijana jako pierwsza - trafia na stos ostatnia
+            stack.extend(reversed(children))
+
+        return SolveResult(False, [], explored)
+
+    """Rozwija stany wszerz, okno decyzji po oknie, aż front ma co najmniej count stanów - stany startowe do podziału między procesy."""
+    def seed(self, count: int, max_depth: int = SEED_MAX_DEPTH) -> Tuple[list, SolveResult]:
+        """ Args:
+                count: Liczba stanów, po której rozwijanie się kończy
+                max_depth: Maksymalna liczba okien decyzji od początku poziomu
+            Returns:
+                (front: lista (spakowany stan, ścieżka), wynik) - wynik rozstrzygnięty (finishable True albo False),
+                jeśli poziom udało się rozstrzygnąć już przy rozwijaniu; w przeciwnym razie finishable=None
+        """
+        frontier = [(_pack_state(self.engine.create_state()), None)]
+        visited = {_quantize(self.engine.create_state())}
+        explored = 0
+
+        for _ in range(max_depth):
+            if len(frontier) >= count:
+                break
+
+            next_frontier = []
+            for packed, path in frontier:
+                children, inputs, branches = self._expand(packed, path, visited)
+                explored += branches
+
+                if inputs is not None:
+                    return [], SolveResult(True, inputs, explored)
+
+                next_frontier.extend(children)
+
+            frontier = next_frontier
+            if not frontier:
+                return [], SolveResult(False, [], explored)
+
+        return frontier, SolveResult(None, [], explored)
+
+    """Symuluje jedno okno decyzji bez skoku i ze skokiem; zwraca nowe stany, wejścia kończące poziom (albo None) i liczbę gałęzi."""
+    def _expand(self, packed: tuple, path: Optional[tuple], visited: set) -> Tuple[list, Optional[List[bool]], int]:
+        """ Args:
+                packed: Spakowany stan na początku okna
+                path: Ścieżka decyzji prowadząca do stanu (rodzic, skok)
+                visited: Skwantowane odwiedzone stany; nowe stany są do niego dopisywane
+            Returns:
+                (lista (spakowany stan, ścieżka), wejścia albo None, liczba zasymulowanych gałęzi)
+        """
+        engine = self.engine
+        children = []
+        branches = 0
+
+        # Czy gracz zaczął któryś krok okna bez skoku na ziemi - do pierwszego skoku obie gałęzie przebiegają identycznie,
+        # więc skok może coś zmienić tylko wtedy albo na orbie
+        ground_seen = False
+
+        for jump_pressed in (False, True):
+            if jump_pressed and not ground_seen and not _orb_nearby(self.orb_xs, packed[0], self.orb_reach):
+                continue
+
+            branches += 1
+            state = _unpack_state(packed)
+
+            died = False
+            for tick in range(self.decision_ticks):
+                ground_seen = ground_seen or state.on_ground
+
+                if engine.step(state, jump_pressed):
+                    died = True
+                    break
+
+                if state.x >= self.level_end_x:
+                    return [], self._expand_inputs((path, jump_pressed), tick + 1), branches
+
+            if died:
+                continue
+
+            key = _quantize(state)
+            if key not in visited:
+                visited.add(key)
+                children.append((_pack_state(state), (path, jump_pressed)))
+
+        return children, None, branches
+
+    """Odtwarza sekwencję wejść na Engine.step i sprawdza, czy gracz dociera do końca poziomu."""
+    def verify(self, inputs: List[bool]) -> bool:
+        """ Args:
+                inputs: Wejście skoku dla każdego kroku fizyki
+            Returns:
+                True, jeśli sekwencja kończy poziom bez śmierci
+        """
+        state = self.engine.create_state()
+
+        for jump_pressed in inputs:
+            if self.engine.step(state, jump_pressed):
+                return False
+            if state.x >= self.level_end_x:
+                return True
+
+        return False
+
+    def _budget_exceeded(self, explored: int, expanded: int, deadline: Optional[float]) -> bool:
+        if self.max_states is not None and explored > self.max_states:
+            return True
+
+        # Zegar i przerwanie sprawdzane co 256 rozwiniętych stanów - odczyt kosztuje więcej niż samo porównanie
+        if expanded % 256 != 0:
+            return False
+        if self.stop_event is not None and self.stop_event.is_set():
+            return True
+
+        return deadline is not None and time.perf_counter() > deadline
+
+    """Zamienia ścieżkę decyzji (rodzic, skok) na wejście dla każdego kroku fizyki; ostatnia decyzja trwa last_ticks kroków."""
+    def _expand_inputs(self, path: tuple, last_ticks: int) -> List[bool]:
+        decisions = []
+        while path is not None:
+            path, jump_pressed = path
+            decisions.append(jump_pressed)
+        decisions.reverse()
+
+        inputs = [jump_pressed for jump_pressed in decisions[:-1] for _ in range(self.decision_ticks)]
+        inputs.extend([decisions[-1]] * last_ticks)
+        return inputs
+
+"""Sprawdza układ poziomu z podanym budżetem - funkcja modułu, więc można ją uruchomić w osobnym procesie."""
+def check_layout(layout: List[dict], time_budget: Optional[float] = None, max_states: Optional[int] = None) -> SolveResult:
+    return LevelSolver(layout, time_budget=time_budget, max_states=max_states).solve()
+
+"""Odtwarza układ z migawki zapisanego poziomu i sprawdza go z podanym budżetem - do procesu przesyłany jest tekst plików, a nie lista obiektów."""
+def check_snapshot(snapshot: LevelSnapshot, time_budget: Optional[float] = None, max_states: Optional[int] = None) -> SolveResult:
+    return check_layout(LevelStore.layout_from_snapshot(snapshot), time_budget, max_states)
+
+"""Sprawdza jeden poziom w kilku procesach: front stanów na stałej głębokości dzielony jest między procesy, każdy przeszukuje swoje stany w głąb."""
+def solve_level(layout: List[dict], workers: Optional[int] = None,
+                time_budget: Optional[float] = None, max_states: Optional[int] = None) -> SolveResult:
+    """ Args:
+            layout: Układ poziomu
+            workers: Liczba procesów; domyślnie liczba rdzeni
+            time_budget: Limit czasu w sekundach
+            max_states: Limit przebadanych gałęzi (łącznie we wszystkich procesach)
+        Returns:
+            SolveResult; explored to suma gałęzi ze wszystkich procesów
+    """
+    assert workers is None or (isinstance(workers, int) and workers > 0), "workers musi być dodatnią liczbą całkowitą"
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    if workers == 1:
+        return check_layout(layout, time_budget, max_states)
+
+    start_time = time.perf_counter()
+
+    seeds, result = LevelSolver(layout, time_budget=time_budget, max_states=max_states).seed(workers * SEEDS_PER_WORKER)
+    if result.finishable is not None:
+        return result
+
+    explored = result.explored
+    if time_budget is not None:
+        time_budget = time_budget - (time.perf_counter() - start_time)
+        if time_budget <= 0:
+            return SolveResult(None, [], explored)
+
+    # Procesy mają osobne zbiory odwiedzonych stanów - stan osiągalny z dwóch frontów może być przeszukany dwa razy,
+    # ale wynik False zapada dopiero, gdy żaden proces nie znalazł przejścia. Sąsiednie stany frontu (wspólni przodkowie,
+    # najbardziej nakładające się poddrzewa) trafiają do tego samego procesu
+    chunk_size = -(-len(seeds) // workers)
+    chunks = [seeds[index:index + chunk_size] for index in range(0, len(seeds), chunk_size)]
+    chunk_states = max((max_states - explored) // len(chunks), 1) if max_states is not None else None
+
+    context = multiprocessing.get_context()
+    stop_event = context.Event()
+    undecided = False
+    with ProcessPoolExecutor(len(chunks), mp_context=context, initializer=_init_worker, initargs=(stop_event,)) as executor:
+        pending = {executor.submit(check_seeds, layout, chunk, time_budget, chunk_states) for chunk in chunks}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_result = future.result()
+                explored += chunk_result.explored
+
+                if chunk_result.finishable:
+                    stop_event.set()
+                    return SolveResult(True, chunk_result.inputs, explored)
+
+                undecided = undecided or chunk_result.finishable is None
+
+    return SolveResult(None if undecided else False, [], explored)
+
+"""Przeszukuje poziom od podanych stanów startowych - funkcja modułu uruchamiana w procesach solve_level."""
+def check_seeds(layout: List[dict], seeds: list, time_budget: Optional[float] = None, max_states: Optional[int] = None) -> SolveResult:
+    return LevelSolver(layout, time_budget=time_budget, max_states=max_states, stop_event=_stop_event).solve(seeds)
+
+def _init_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+"""Sprawdza wiele poziomów naraz - każdy poziom w osobnym procesie; pojedynczy poziom dzielony jest między procesy (solve_level)."""
+def solve_levels(layouts: List[List[dict]], workers: Optional[int] = None,
+                 time_budget: Optional[float] = None, max_states: Optional[int] = None) -> List[SolveResult]:
+    """ Args:
+            layouts: Układy poziomów
+            workers: Liczba procesów; domyślnie liczba rdzeni
+            time_budget: Limit czasu na jeden poziom w sekundach
+            max_states: Limit przebadanych gałęzi na jeden poziom
+        Returns:
+            Wyniki w kolejności układów
+    """
+    assert workers is None or (isinstance(workers, int) and workers > 0), "workers musi być dodatnią liczbą całkowitą"
+
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+    budgets = [time_budget] * len(layouts), [max_states] * len(layouts)
+
+    if workers > 1 and len(layouts) == 1:
+        return [solve_level(layouts[0], workers, time_budget, max_states)]
+
+    if workers > 1 and len(layouts) > 1:
+        with ProcessPoolExecutor(min(workers, len(layouts))) as executor:
+            return list(executor.map(check_layout, layouts, *budgets))
+
+    return [check_layout(layout, *budget) for layout, *budget in zip(layouts, *budgets)]
+
+def _orb_nearby(orb_xs: list, x: float, reach: float) -> bool:
+    index = bisect.bisect_left(orb_xs, x - reach)
+    return index < len(orb_xs) and orb_xs[index] <= x + reach
+
+def _create_engine(layout: List[dict]) -> Engine:
+    engine = Engine(Floor(config.FLOOR_Y))
+    engine.set_objects_from_layout(layout)
+    return engine
+
+def _pack_state(state: SimulationState) -> tuple:
+    return state.x, state.y, state.velocity_y, state.on_ground
+
+def _unpack_state(packed: tuple) -> SimulationState:
+    return SimulationState(*packed)
+
+def _quantize(state: SimulationState) -> tuple:
+    return (round(state.x / POSITION_QUANTUM), round(state.y / POSITION_QUANTUM),
+            round(state.velocity_y / VELOCITY_QUANTUM), state.on_ground)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sprawdza, czy poziomy z katalogu levels da się ukończyć.")
+    parser.add_argument("levels", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
+    parser.add_argument("--index", help="Sprawdź tylko poziom o podanym indeksie")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--time-budget", type=float, default=config.SOLVER_TIME_BUDGET, help="Limit czasu na poziom w sekundach")
+    parser.add_argument("--max-states", type=int, default=config.SOLVER_MAX_STATES, help="Limit przebadanych gałęzi na poziom")
+    args = parser.parse_args()
+
+    levels = [level for level in load_full_levels(args.levels) if args.index is None or level["index"] == args.index]
+    results = solve_levels([level["layout"] for level in levels], args.workers, args.time_budget, args.max_states)
+
+    for level, result in zip(levels, results):
+        status = {True: "OK", False: "NIE DA SIĘ UKOŃCZYĆ", None: "NIEROZSTRZYGNIĘTE (budżet)"}[result.finishable]
+        print(f"[{level['index']}] {level['name']}: {status} ({result.explored} stanów)")
+
+if __name__ == "__main__":
+    main()
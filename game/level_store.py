@@ -0,0 +1,249 @@
+import hashlib, json, os, threading
+
+from typing import Dict, Iterator, List, Optional
+
+from game.level_journal import JOURNAL_EXTENSION, LevelJournal
+
+MANIFEST_FILE = "manifest.json"
+LEGACY_LEVELS_FILE = "levels.json"
+
+"""Zwraca skrót SHA-256 układu poziomu, niezależny od kolejności kluczy w obiektach."""
+def layout_hash(layout: List[dict]) -> bytes:
+    """ Args:
+            layout: Układ poziomu (lista obiektów z type, x, y)
+        Returns:
+            32 bajty skrótu
+    """
+    data = json.dumps(layout, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).digest()
+
+"""Wczytuje wszystkie poziomy razem z układami z katalogu poziomów albo ze starego pliku levels.json."""
+def load_full_levels(path: str) -> List[dict]:
+    """ Args:
+            path: Katalog z manifestem albo plik .json z listą poziomów
+        Returns:
+            Lista poziomów z kluczem layout
+    """
+    if os.path.isfile(path):
+        with open(path, "r") as level_file:
+            return json.load(level_file)
+
+    return list(LevelStore(path).iter_levels())
+
+"""Zawartość pliku poziomu i jego dziennika odczytana w jednej chwili - niezależna od późniejszego kompaktowania."""
+class LevelSnapshot:
+    def __init__(self, layout_text: str, journal_path: str, journal_text: Optional[str]):
+        assert isinstance(layout_text, str), "layout_text musi być stringiem"
+        assert isinstance(journal_path, str), "journal_path musi być stringiem"
+        assert journal_text is None or isinstance(journal_text, str), "journal_text musi być stringiem albo None"
+
+        self.layout_text = layout_text
+        self.journal_path = journal_path
+        self.journal_text = journal_text
+
+"""Poziomy zapisane jako mały manifest (index, name, difficulty, object_count, hash) i osobny plik z układem każdego poziomu."""
+class LevelStore:
+    def __init__(self, directory: str):
+        assert isinstance(directory, str), "directory musi być stringiem"
+
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+
+        # Kompaktowanie dziennika działa w tle - zapis pliku poziomu, manifestu i dziennika nie może się przeplatać
+        self.lock = threading.RLock()
+
+    """Wczytuje manifest; przy pierwszym uruchomieniu dzieli stary levels.json na pliki poziomów."""
+    def load(self) -> List[Dict[str, str]]:
+        """ Returns:
+                Lista wpisów manifestu (bez układów poziomów)
+        """
+        if not os.path.exists(self.manifest_path):
+            legacy_path = os.path.join(self.directory, LEGACY_LEVELS_FILE)
+            if os.path.exists(legacy_path):
+                return self.migrate(legacy_path)
+
+        with open(self.manifest_path, "r") as manifest_file:
+            return json.load(manifest_file)
+
+    """Wczytuje układ jednego poziomu z jego pliku razem ze zmianami z dziennika, które nie trafiły jeszcze do pliku."""
+    def get_layout(self, entry: Dict[str, str]) -> List[dict]:
+        """ Args:
+                entry: Wpis manifestu poziomu
+            Returns:
+                Lista obiektów poziomu
+        """
+        return self.layout_from_snapshot(self.read_snapshot(entry))
+
+    """Odczytuje pod blokadą plik poziomu i dziennik bez dekodowania - migawkę można przekazać do innego procesu, a kompaktowanie w tle nie podmieni w trakcie odczytu jednego z plików."""
+    def read_snapshot(self, entry: Dict[str, str]) -> LevelSnapshot:
+        journal = self.get_journal(entry)
+
+        with self.lock:
+            with open(os.path.join(self.directory, entry["file"]), "r") as level_file:
+                layout_text = level_file.read()
+
+            return LevelSnapshot(layout_text, journal.path, journal.read_text())
+
+    """Odtwarza układ poziomu z migawki razem ze zmianami z dziennika, które nie trafiły jeszcze do pliku."""
+    @staticmethod
+    def layout_from_snapshot(snapshot: LevelSnapshot) -> List[dict]:
+        layout = json.loads(snapshot.layout_text)
+
+        return LevelJournal.apply_edits(layout, LevelStore._snapshot_edits(snapshot, layout))
+
+    """Dopisuje zmiany układu do dziennika poziomu - plik poziomu i manifest nie są przepisywane."""
+    def append_edits(self, entry: Dict[str, str], edits: List[dict]):
+        """ Args:
+                entry: Aktualny wpis manifestu poziomu
+                edits: Zmiany (add, delete) w kolejności wykonania
+        """
+        with self.lock:
+            self.get_journal(entry).append(entry["hash"], edits)
+
+    """Sprawdza, czy dziennik poziomu zawiera zmiany, których nie ma jeszcze w pliku poziomu."""
+    def has_pending_edits(self, entry: Dict[str, str]) -> bool:
+        with self.lock:
+            try:
+                return bool(self.get_journal(entry).read()[1])
+            except ValueError:
+                return False
+
+    """Przepisuje plik poziomu ze zmianami z dziennika i aktualizuje manifest; można wywołać w osobnym wątku."""
+    def compact(self, entry: Dict[str, str]) -> Dict[str, str]:
+        """ Args:
+                entry: Wpis manifestu poziomu
+            Returns:
+                Nowy wpis manifestu (ten sam, jeśli dziennik nie miał zmian)
+        """
+        snapshot = self.read_snapshot(entry)
+        layout = json.loads(snapshot.layout_text)
+        edits = self._snapshot_edits(snapshot, layout)
+
+        if not edits:
+            return entry
+
+        # Serializacja i zapis dużego układu trwają długo - w tym czasie edytor może dopisywać kolejne zmiany
+        level = {key: entry[key] for key in ("index", "name", "difficulty")}
+        level["layout"] = LevelJournal.apply_edits(layout, edits)
+        compacted = self._create_entry(level)
+
+        path = os.path.join(self.directory, compacted["file"])
+        temporary_path = self._write_temporary(path, self._dump_layout(level["layout"]))
+
+        with self.lock:
+            # Zmiany dopisane w trakcie zapisu zostają w dzienniku, już względem nowego układu
+            journal = self.get_journal(entry)
+            remaining = journal.read()[1][len(edits):]
+
+            os.replace(temporary_path, path)
+            journal.rewrite(compacted["hash"], remaining)
+            self._write_manifest_entry(compacted, self.load())
+
+        return compacted
+
+    def get_journal(self, entry: Dict[str, str]) -> LevelJournal:
+        return LevelJournal(os.path.join(self.directory, os.path.splitext(entry["file"])[0] + JOURNAL_EXTENSION))
+
+    """Zwraca kolejno pełne poziomy (wpis manifestu z układem) - dla narzędzi przetwarzających wszystkie poziomy."""
+    def iter_levels(self) -> Iterator[dict]:
+        for entry in self.load():
+            yield {**entry, "layout": self.get_layout(entry)}
+
+    """Zapisuje układ poziomu do jego pliku i aktualizuje manifest."""
+    def save_level(self, level: dict, manifest: Optional[List[Dict[str, str]]] = None) -> Dict[str, str]:
+        """ Args:
+                level: Poziom z kluczami index, name, difficulty i layout
+                manifest: Aktualne wpisy manifestu; domyślnie wczytywane z dysku
+            Returns:
+                Nowy wpis manifestu dla tego poziomu
+        """
+        self._validate_level(level)
+
+        entry = self._create_entry(level)
+
+        with self.lock:
+            self._write_file(os.path.join(self.directory, entry["file"]), self._dump_layout(level["layout"]))
+            # Pełny układ jest już w pliku - zmiany z dziennika są w nim uwzględnione
+            self.get_journal(entry).remove()
+
+            if manifest is None:
+                manifest = self.load() if os.path.exists(self.manifest_path) else []
+
+            self._write_manifest_entry(entry, manifest)
+
+        return entry
+
+    """Dzieli plik levels.json na manifest i pliki poziomów."""
+    def migrate(self, legacy_path: str) -> List[Dict[str, str]]:
+        with open(legacy_path, "r") as legacy_file:
+            levels = json.load(legacy_file)
+
+        entries = []
+        for level in levels:
+            entry = self._create_entry(level)
+            self._write_file(os.path.join(self.directory, entry["file"]), self._dump_layout(level["layout"]))
+            entries.append(entry)
+
+        self._write_file(self.manifest_path, json.dumps(entries, indent=2))
+
+        return entries
+
+    def _write_manifest_entry(self, entry: Dict[str, str], manifest: List[Dict[str, str]]):
+        entries = [existing for existing in manifest if existing["index"] != entry["index"]]
+        entries.append(entry)
+        entries.sort(key=lambda existing: int(existing["index"]))
+
+        self._write_file(self.manifest_path, json.dumps(entries, indent=2))
+
+    """Zwraca zmiany z dziennika w migawce, jeśli dziennik dotyczy układu zapisanego w pliku."""
+    @staticmethod
+    def _snapshot_edits(snapshot: LevelSnapshot, layout: List[dict]) -> List[dict]:
+        try:
+            base_hash, edits = LevelJournal.parse(snapshot.journal_text, snapshot.journal_path)
+        except ValueError as error:
+            print(f"Ostrzeżenie: {error}")
+            return []
+
+        # Przerwane kompaktowanie mogło już zapisać plik poziomu ze zmianami - wtedy dziennik jest nieaktualny
+        if edits and base_hash != layout_hash(layout).hex():
+            print(f"Ostrzeżenie: Pominięto nieaktualny dziennik zmian {snapshot.journal_path}")
+            return []
+
+        return edits
+
+    @staticmethod
+    def _create_entry(level: dict) -> Dict[str, str]:
+        return {
+            "index": level["index"],
+            "name": level["name"],
+            "difficulty": level["difficulty"],
+            "object_count": len(level["layout"]),
+            "hash": layout_hash(level["layout"]).hex(),
+            "file": f"level_{level['index']}.json"
+        }
+
+    """Zapisuje układ po jednym obiekcie w wierszu - plik jest zwięzły, a zmiany w gicie czytelne."""
+    @staticmethod
+    def _dump_layout(layout: List[dict]) -> str:
+        if not layout:
+            return "[]\n"
+
+        return "[\n" + ",\n".join(json.dumps(obj, separators=(", ", ": ")) for obj in layout) + "\n]\n"
+
+    """Zapisuje plik przez plik tymczasowy i zamianę nazwy - przerwany zapis nie uszkadza istniejących danych."""
+    def _write_file(self, path: str, text: str):
+        os.replace(self._write_temporary(path, text), path)
+
+    def _write_temporary(self, path: str, text: str) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w") as file:
+            file.write(text)
+
+        return temporary_path
+
+    @staticmethod
+    def _validate_level(level):
+        if not isinstance(level, dict) or not {"index", "name", "difficulty", "layout"} <= level.keys():
+            raise ValueError("level musi być słownikiem z kluczami index, name, difficulty i layout")
@@ -2,6 +2,7 @@ import pygame
 
 from config import config
 from game.floor import Floor
+from ui.scale_context import ScaleContext
 
 class Player:
     def __init__(self):
@@ -25,6 +26,9 @@ class Player:
 
         self.distance_to_floor = config.FLOOR_Y - self.y
 
+        # Kontekst skali, dla którego policzono rozmiary prostokątów
+        self.scale_context = None
+
     def draw(self, screen: pygame.Surface, camera_offset_x: int):
         self._validate_draw_params(screen, camera_offset_x)
 
@@ -34,21 +38,25 @@ class Player:
         pygame.draw.rect(screen, self.inner_color, self.inner_rect, border_radius=2)
 
     def _update_size(self, screen: pygame.Surface, camera_offset_x: int):
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
 
-        screen_width, screen_height = screen.get_size()
+        # Rozmiary są stałe dla kontekstu - co klatkę zmienia się tylko środek
+        center = context.point(self.x + camera_offset_x, self.y)
 
-        rect_outer_size = int(screen_width * (self.outer_size / config.SCREEN_WIDTH))
-        rect_inner_size = int(screen_height * (self.inner_size / config.SCREEN_HEIGHT))
+        self.outer_rect.center = center
+        self.inner_rect.center = center
 
-        world_x = self.x + camera_offset_x
-        rect_x = int(screen_width * (world_x / config.SCREEN_WIDTH))
-        rect_y = int(screen_height * (self.y / config.SCREEN_HEIGHT))
+    """Przelicza rozmiary prostokątów gracza dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        self.outer_rect = pygame.Rect(0, 0, rect_outer_size, rect_outer_size)
-        self.outer_rect.center = (rect_x, rect_y)
+        rect_outer_size = context.x(self.outer_size)
+        rect_inner_size = context.y(self.inner_size)
 
+        self.outer_rect = pygame.Rect(0, 0, rect_outer_size, rect_outer_size)
         self.inner_rect = pygame.Rect(0, 0, rect_inner_size, rect_inner_size)
-        self.inner_rect.center = (rect_x, rect_y)
 
     @staticmethod
     def _validate_draw_params(screen: pygame.Surface, camera_offset_x: int):
@@ -0,0 +1,291 @@
+import argparse, os, struct, time
+
+import numpy as np
+
+from typing import Iterator, List, Optional
+
+from config import config
+from game.batch_simulator import BatchSimulator
+from game.engine import Engine
+from game.floor import Floor
+from game.level_store import layout_hash, load_full_levels
+from game.simulation_state import SimulationState
+from game.state_hash import StateHashLog
+
+# Nagłówek pliku: znacznik, wersja, częstotliwość fizyki, hash poziomu, pierwsze wejście, liczba kroków
+REPLAY_MAGIC = b"GDRP"
+REPLAY_VERSION = 1
+HEADER_FORMAT = "<4sBH32s?I"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Krok BatchSimulator kosztuje prawie tyle samo dla 1 i dla 64 graczy (ok. 100-200 µs, Engine.step 15-50 µs) - wspólne
+# odtwarzanie opłaca się dopiero od kilku powtórek naraz
+BATCH_REPLAY_MIN = 8
+
+"""Nagranie wejścia skoku dla kolejnych kroków fizyki, zapisane jako długości serii."""
+class Replay:
+    def __init__(self, level_hash: bytes, first_input: bool = False, runs: Optional[List[int]] = None,
+                 tick_rate: int = config.PHYSICS_TICK_RATE):
+
+        assert isinstance(level_hash, bytes) and len(level_hash) == 32, "level_hash musi mieć 32 bajty"
+        assert isinstance(first_input, bool), "first_input musi być wartością boolowską"
+        assert isinstance(tick_rate, int) and tick_rate > 0, "tick_rate musi być dodatnią liczbą całkowitą"
+
+        self.level_hash = level_hash
+        self.tick_rate = tick_rate
+
+        # Serie na przemian: first_input, not first_input, ...
+        self.first_input = first_input
+        self.runs: List[int] = runs if runs is not None else []
+
+    @property
+    def ticks(self) -> int:
+        return sum(self.runs)
+
+    """Zwraca wejście skoku dla każdego kroku jako tablicę bool."""
+    def input_column(self) -> np.ndarray:
+        values = (np.arange(len(self.runs)) % 2 == 1) != self.first_input
+        return np.repeat(values, self.runs)
+
+    """Zwraca wejście skoku dla każdego kroku po kolei."""
+    def inputs(self) -> Iterator[bool]:
+        jump_pressed = self.first_input
+        for length in self.runs:
+            for _ in range(length):
+                yield jump_pressed
+            jump_pressed = not jump_pressed
+
+    """Koduje nagranie do postaci binarnej."""
+    def to_bytes(self) -> bytes:
+        body = bytearray()
+        for length in self.runs:
+            # Długości serii jako liczby o zmiennej długości (7 bitów na bajt)
+            while length >= 0x80:
+                body.append(length & 0x7F | 0x80)
+                length >>= 7
+            body.append(length)
+
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.tick_rate, self.level_hash, self.first_input, self.ticks)
+
+        return header + bytes(body)
+
+    """Odczytuje nagranie z postaci binarnej."""
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """ Args:
+                data: Zawartość pliku powtórki
+            Returns:
+                Odczytany Replay
+        """
+        cls._validate_header(data)
+
+        _, _, tick_rate, level_hash, first_input, ticks = struct.unpack_from(HEADER_FORMAT, data)
+
+        runs = []
+        length = shift = 0
+        for byte in data[HEADER_SIZE:]:
+            length |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                runs.append(length)
+                length = shift = 0
+
+        if shift or sum(runs) != ticks:
+            raise ValueError("Uszkodzony plik powtórki")
+
+        return cls(level_hash, first_input, runs, tick_rate)
+
+    """Zapisuje nagranie do pliku."""
+    def save(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    """Wczytuje nagranie z pliku."""
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+    @staticmethod
+    def _validate_header(data: bytes):
+        if len(data) < HEADER_SIZE or data[:4] != REPLAY_MAGIC:
+            raise ValueError("To nie jest plik powtórki")
+        if data[4] != REPLAY_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja powtórki: {data[4]}")
+
+    def __repr__(self):
+        return f"Replay(level_hash={self.level_hash.hex()[:12]}, ticks={self.ticks}, runs={len(self.runs)})"
+
+"""Nagrywa wejście skoku w kolejnych krokach fizyki gry."""
+class ReplayRecorder:
+    def __init__(self, level_hash: bytes):
+        self.replay = Replay(level_hash)
+        self.last_input: Optional[bool] = None
+
+    """Dopisuje wejście jednego kroku fizyki."""
+    def record(self, jump_pressed: bool):
+        if self.last_input is None:
+            self.replay.first_input = jump_pressed
+            self.replay.runs.append(0)
+        elif jump_pressed != self.last_input:
+            self.replay.runs.append(0)
+
+        self.replay.runs[-1] += 1
+        self.last_input = jump_pressed
+
+"""Wynik odtworzenia powtórki."""
+class ReplayResult:
+    def __init__(self, finished: bool, died: bool, ticks: int, state: SimulationState):
+        self.finished = finished
+        self.died = died
+        self.ticks = ticks
+        self.state = state
+
+    def __repr__(self):
+        return f"ReplayResult(finished={self.finished}, died={self.died}, ticks={self.ticks}, x={self.state.x})"
+
+"""Odtwarza powtórkę na Engine.step bez okna, tak szybko, jak pozwala procesor."""
+def play_replay(replay: Replay, layout: List[dict], engine: Optional[Engine] = None,
+                hash_log: Optional[StateHashLog] = None, level_hash: Optional[bytes] = None) -> ReplayResult:
+    """ Args:
+            replay: Nagranie do odtworzenia
+            layout: Układ poziomu, na którym nagrano powtórkę
+            engine: Silnik z wczytanym tym poziomem; domyślnie tworzony nowy
+            hash_log: Jeśli podany, dopisywane są do niego skróty stanu po każdym kroku
+            level_hash: Hash układu (layout_hash), jeśli wywołujący już go policzył - bez niego liczony od nowa
+        Returns:
+            ReplayResult ze stanem gracza po ostatnim wykonanym kroku
+    """
+    _validate_replay(replay, level_hash if level_hash is not None else layout_hash(layout))
+
+    if engine is None:
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(layout)
+
+    # Silnik mógł odtwarzać wcześniej inną powtórkę - kamera i kursor obiektów wyzwalanych wracają na start
+    engine.camera_offset_x = 0
+    engine.trigger_cursor = 0
+    engine.state_hash_log = hash_log
+    try:
+        return _run_inputs(engine, replay)
+    finally:
+        engine.state_hash_log = None
+
+"""Odtwarza wiele powtórek tego samego poziomu - od BATCH_REPLAY_MIN powtórek wszystkie naraz w jednym BatchSimulator."""
+def play_replays(replays: List[Replay], layout: List[dict], engine: Optional[Engine] = None,
+                 level_hash: Optional[bytes] = None) -> List[ReplayResult]:
+    """ Args:
+            replays: Nagrania do odtworzenia
+            layout: Układ poziomu, na którym nagrano powtórki
+            engine: Silnik z wczytanym tym poziomem; domyślnie tworzony nowy
+            level_hash: Hash układu (layout_hash), jeśli wywołujący już go policzył - bez niego liczony od nowa
+        Returns:
+            ReplayResult dla każdej powtórki, w kolejności replays
+    """
+    level_hash = level_hash if level_hash is not None else layout_hash(layout)
+    for replay in replays:
+        _validate_replay(replay, level_hash)
+
+    if engine is None:
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(layout)
+
+    if len(replays) < BATCH_REPLAY_MIN:
+        return [play_replay(replay, layout, engine, level_hash=level_hash) for replay in replays]
+
+    return _run_batch(BatchSimulator(engine, len(replays)), replays)
+
+def _run_inputs(engine: Engine, replay: Replay) -> ReplayResult:
+    state = engine.create_state()
+    level_end_x = engine.get_furthest_object_x()
+    step = engine.step
+
+    tick = 0
+    jump_pressed = replay.first_input
+    for length in replay.runs:
+        for _ in range(length):
+            tick += 1
+            if step(state, jump_pressed):
+                return ReplayResult(False, True, tick, state)
+            if state.x >= level_end_x:
+                return ReplayResult(True, False, tick, state)
+
+        jump_pressed = not jump_pressed
+
+    return ReplayResult(False, False, tick, state)
+
+def _run_batch(simulator: BatchSimulator, replays: List[Replay]) -> List[ReplayResult]:
+    lengths = np.array([replay.ticks for replay in replays], dtype=np.int64)
+    schedule = np.zeros((int(lengths.max()), len(replays)), dtype=bool)
+    for column, replay in enumerate(replays):
+        schedule[:lengths[column], column] = replay.input_column()
+
+    # Gracz, którego nagranie się skończyło, symulowany jest dalej bez skoku - jego stan zapamiętywany jest w ostatnim kroku nagrania
+    interrupted = {index: _batch_state(simulator, index) for index in np.flatnonzero(lengths == 0).tolist()}
+    for tick, jump_pressed in enumerate(schedule):
+        if not (simulator.active() & (lengths > tick)).any():
+            break
+
+        simulator.step(jump_pressed)
+
+        for index in np.flatnonzero((lengths == tick + 1) & simulator.active()).tolist():
+            interrupted[index] = _batch_state(simulator, index)
+
+    results = []
+    for index, length in enumerate(lengths.tolist()):
+        if index in interrupted:
+            results.append(ReplayResult(False, False, length, interrupted[index]))
+            continue
+
+        # Martwi i ukończeni gracze nie są już przesuwani - ich stan to stan z kroku śmierci albo ukończenia
+        died = bool(simulator.death_tick[index] >= 0)
+        last_tick = simulator.death_tick[index] if died else simulator.finish_tick[index]
+        results.append(ReplayResult(not died, died, int(last_tick) + 1, _batch_state(simulator, index)))
+
+    return results
+
+def _batch_state(simulator: BatchSimulator, index: int) -> SimulationState:
+    return SimulationState(float(simulator.x[index]), float(simulator.y[index]),
+                           float(simulator.velocity_y[index]), bool(simulator.on_ground[index]))
+
+def _validate_replay(replay: Replay, level_hash: bytes):
+    if replay.tick_rate != config.PHYSICS_TICK_RATE:
+        raise ValueError(f"Powtórka nagrana przy {replay.tick_rate} krokach/s, gra używa {config.PHYSICS_TICK_RATE}")
+    if replay.level_hash != level_hash:
+        raise ValueError("Powtórka została nagrana na innej wersji poziomu")
+
+def main():
+    parser = argparse.ArgumentParser(description="Odtwarza powtórkę bez okna i wypisuje jej wynik.")
+    parser.add_argument("replay")
+    parser.add_argument("levels", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
+    parser.add_argument("--hash-log", help="Zapisz skróty stanu po każdym kroku do pliku (porównanie: python -m game.state_hash)")
+    args = parser.parse_args()
+
+    replay = Replay.load(args.replay)
+
+    levels = load_full_levels(args.levels)
+
+    level = next((level for level in levels if layout_hash(level["layout"]) == replay.level_hash), None)
+    if level is None:
+        print("BŁĄD: Nie znaleziono poziomu, na którym nagrano powtórkę")
+        return
+
+    hash_log = StateHashLog() if args.hash_log else None
+
+    start = time.perf_counter()
+    result = play_replay(replay, level["layout"], hash_log=hash_log)
+    elapsed = time.perf_counter() - start
+
+    if hash_log is not None:
+        hash_log.save(args.hash_log)
+
+    status = "UKOŃCZONO" if result.finished else "ŚMIERĆ" if result.died else "PRZERWANO"
+    print(f"[{level['index']}] {level['name']}: {status} po {result.ticks} krokach "
+          f"({result.ticks / replay.tick_rate:.2f} s gry, odtworzono w {elapsed * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse, json, os, time
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from config import config
+from game.engine import Engine
+from game.floor import Floor
+from game.level_store import layout_hash, load_full_levels
+from game.replay import Replay, play_replay
+
+REPLAY_EXTENSION = ".gdr"
+BASELINE_FILE = "baseline.json"
+
+# Poziomy w procesie roboczym: hash układu -> (poziom, silnik tworzony przy pierwszej powtórce)
+_worker_levels: Dict[bytes, list] = {}
+
+"""Zwraca posortowane ścieżki wszystkich powtórek w katalogu i jego podkatalogach."""
+def collect_replays(replay_dir: str) -> List[str]:
+    paths = []
+    for directory, _, files in os.walk(replay_dir):
+        paths.extend(os.path.join(directory, name) for name in files if name.endswith(REPLAY_EXTENSION))
+
+    return sorted(paths)
+
+"""Odtwarza powtórki na Engine w wielu procesach i zwraca wynik każdej z nich."""
+def run_replays(replay_dir: str, levels: List[dict], workers: Optional[int] = None) -> Dict[str, dict]:
+    """ Args:
+            replay_dir: Katalog z plikami powtórek
+            levels: Poziomy z układami (load_full_levels)
+            workers: Liczba procesów; domyślnie liczba rdzeni
+        Returns:
+            Nazwa powtórki (ścieżka względem replay_dir) -> wynik
+    """
+    assert workers is None or (isinstance(workers, int) and workers > 0), "workers musi być dodatnią liczbą całkowitą"
+
+    paths = collect_replays(replay_dir)
+    names = [os.path.relpath(path, replay_dir).replace(os.sep, "/") for path in paths]
+    workers = workers if workers is not None else (os.cpu_count() or 1)
+
+    if workers > 1 and len(paths) > 1:
+        # Powtórki są krótkie, więc wysyłane są paczkami, żeby narzut komunikacji nie przeważył
+        chunksize = max(1, len(paths) // (workers * 8))
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(levels,)) as executor:
+            outcomes = list(executor.map(_run_replay, paths, chunksize=chunksize))
+    else:
+        _init_worker(levels)
+        outcomes = [_run_replay(path) for path in paths]
+
+    return dict(zip(names, outcomes))
+
+"""Porównuje wyniki z bazowymi i zwraca opis każdej różnicy."""
+def compare_outcomes(baseline: Dict[str, dict], outcomes: Dict[str, dict]) -> List[str]:
+    """ Args:
+            baseline: Wyniki zapisane wcześniej
+            outcomes: Wyniki bieżącego przebiegu
+        Returns:
+            Lista opisów zmienionych, nowych i brakujących powtórek
+    """
+    differences = []
+
+    for name in sorted(set(baseline) | set(outcomes)):
+        if name not in outcomes:
+            differences.append(f"{name}: brak powtórki")
+        elif name not in baseline:
+            differences.append(f"{name}: brak w wynikach bazowych")
+        elif outcomes[name] != baseline[name]:
+            changes = ", ".join(f"{key} {baseline[name].get(key)} -> {outcomes[name].get(key)}"
+                                for key in sorted(set(baseline[name]) | set(outcomes[name]))
+                                if baseline[name].get(key) != outcomes[name].get(key))
+            differences.append(f"{name}: {changes}")
+
+    return differences
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    with open(path, "r") as baseline_file:
+        return json.load(baseline_file)
+
+def save_baseline(path: str, outcomes: Dict[str, dict]):
+    with open(path, "w") as baseline_file:
+        json.dump(outcomes, baseline_file, indent=1, sort_keys=True)
+
+def _init_worker(levels: List[dict]):
+    global _worker_levels
+    _worker_levels = {layout_hash(level["layout"]): [level, None] for level in levels}
+
+"""Odtwarza jedną powtórkę na silniku jej poziomu."""
+def _run_replay(path: str) -> dict:
+    try:
+        replay = Replay.load(path)
+    except (OSError, ValueError) as error:
+        return {"error": str(error)}
+
+    entry = _worker_levels.get(replay.level_hash)
+    if entry is None:
+        return {"error": "nieznany poziom"}
+
+    level, engine = entry
+    if engine is None:
+        engine = entry[1] = _create_engine(level["layout"])
+
+    try:
+        # Poziom wybrany po hashu powtórki - hash układu nie jest liczony ponownie dla każdej powtórki
+        result = play_replay(replay, level["layout"], engine, level_hash=replay.level_hash)
+    except ValueError as error:
+        return {"error": str(error)}
+
+    # x po ostatnim kroku: miejsce śmierci, ukończenia albo przerwania powtórki
+    return {
+        "level": level["index"],
+        "finished": result.finished,
+        "died": result.died,
+        "ticks": result.ticks,
+        "x": result.state.x
+    }
+
+def _create_engine(layout: List[dict]) -> Engine:
+    engine = Engine(Floor(config.FLOOR_Y))
+    engine.set_objects_from_layout(layout)
+    return engine
+
+def main():
+    parser = argparse.ArgumentParser(description="Odtwarza katalog powtórek i porównuje wyniki z zapisanymi wcześniej.")
+    parser.add_argument("replays")
+    parser.add_argument("levels", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "levels"))
+    parser.add_argument("--baseline", help=f"Plik z wynikami bazowymi (domyślnie <replays>/{BASELINE_FILE})")
+    parser.add_argument("--update-baseline", action="store_true", help="Zapisz bieżące wyniki jako bazowe")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    baseline_path = args.baseline or os.path.join(args.replays, BASELINE_FILE)
+
+    levels = load_full_levels(args.levels)
+
+    start = time.perf_counter()
+    outcomes = run_replays(args.replays, levels, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Odtworzono {len(outcomes)} powtórek w {elapsed:.2f} s")
+
+    if args.update_baseline or not os.path.exists(baseline_path):
+        save_baseline(baseline_path, outcomes)
+        print(f"Zapisano wyniki bazowe: {baseline_path}")
+        return
+
+    differences = compare_outcomes(load_baseline(baseline_path), outcomes)
+    for difference in differences:
+        print(difference)
+
+    if differences:
+        print(f"ZMIENIONE WYNIKI: {len(differences)}")
+        raise SystemExit(1)
+
+    print("OK - wszystkie wyniki zgodne z bazowymi")
+
+if __name__ == "__main__":
+    main()
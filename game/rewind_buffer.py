@@ -0,0 +1,79 @@
+from array import array
+
+from config import config
+
+"""Bufor cykliczny stanów gracza i kamery z ostatnich kroków fizyki, o stałym rozmiarze w pamięci."""
+class RewindBuffer:
+    # Pola jednego kroku w tablicy: x, y, velocity_y, on_ground, camera_offset_x, trigger_cursor
+    FIELDS = 6
+
+    def __init__(self, capacity: int = config.REWIND_SECONDS * config.PHYSICS_TICK_RATE):
+        assert isinstance(capacity, int) and capacity > 0, "capacity musi być dodatnią liczbą całkowitą"
+
+        self.capacity = capacity
+
+        # Cała pamięć przydzielana jest od razu - zapis nadpisuje najstarszy krok
+        self.data = array("d", bytes(8 * self.FIELDS * capacity))
+        self.start = 0
+        self.count = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.capacity * self.FIELDS * self.data.itemsize
+
+    """Zapisuje stan po kroku fizyki jako najnowszy."""
+    def push(self, engine, state):
+        """ Args:
+                engine: Silnik (kamera i kursor obiektów wyzwalanych)
+                state: Stan gracza po kroku
+        """
+        if self.count < self.capacity:
+            index = (self.start + self.count) % self.capacity
+            self.count += 1
+        else:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+
+        data = self.data
+        base = index * self.FIELDS
+        data[base] = state.x
+        data[base + 1] = state.y
+        data[base + 2] = state.velocity_y
+        data[base + 3] = state.on_ground
+        data[base + 4] = engine.camera_offset_x
+        data[base + 5] = engine.trigger_cursor
+
+    """Przywraca stan sprzed ticks_back kroków (0 - najnowszy) do istniejących obiektów."""
+    def restore(self, engine, state, ticks_back: int):
+        """ Args:
+                engine: Silnik do przywrócenia
+                state: Stan gracza nadpisywany w miejscu
+                ticks_back: Liczba kroków wstecz od najnowszego zapisu
+        """
+        self._validate_ticks_back(ticks_back, self.count)
+
+        data = self.data
+        base = (self.start + self.count - 1 - ticks_back) % self.capacity * self.FIELDS
+        state.x = data[base]
+        state.y = data[base + 1]
+        state.velocity_y = data[base + 2]
+        state.on_ground = data[base + 3] != 0.0
+        engine.camera_offset_x = int(data[base + 4])
+        engine.trigger_cursor = int(data[base + 5])
+
+    """Usuwa ticks_back najnowszych kroków - gra toczy się dalej od przewiniętego stanu."""
+    def truncate(self, ticks_back: int):
+        self._validate_ticks_back(ticks_back, self.count)
+        self.count -= ticks_back
+
+    def clear(self):
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @staticmethod
+    def _validate_ticks_back(ticks_back, count):
+        if not isinstance(ticks_back, int) or not 0 <= ticks_back < count:
+            raise ValueError(f"ticks_back musi być w zakresie [0, {count})")
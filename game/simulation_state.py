@@ -0,0 +1,26 @@
+from config import config
+
+"""Stan gracza w jednostkach świata używany przez symulację bez okna (Engine.step)."""
+class SimulationState:
+    __slots__ = ("x", "y", "velocity_y", "on_ground")
+
+    def __init__(self, x: float = config.PLAYER_RESET_X, y: float = config.FLOOR_Y - config.PLAYER_OUTER_SIZE // 2,
+                 velocity_y: float = 0, on_ground: bool = True):
+        assert isinstance(x, (int, float)) and isinstance(y, (int, float)), "x i y muszą być liczbami"
+        assert isinstance(velocity_y, (int, float)), "velocity_y musi być liczbą"
+        assert isinstance(on_ground, bool), "on_ground musi być wartością boolowską"
+
+        self.x = x
+        self.y = y
+        self.velocity_y = velocity_y
+        self.on_ground = on_ground
+
+    """Kopiuje stan z innego obiektu bez tworzenia nowego."""
+    def copy_from(self, other: "SimulationState"):
+        self.x = other.x
+        self.y = other.y
+        self.velocity_y = other.velocity_y
+        self.on_ground = other.on_ground
+
+    def __repr__(self):
+        return f"SimulationState(x={self.x}, y={self.y}, velocity_y={self.velocity_y}, on_ground={self.on_ground})"
@@ -0,0 +1,140 @@
+import numpy as np
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Komórka (cell_x, cell_y) zapisana jako jeden klucz int64: cell_x w starszych 32 bitach, cell_y przesunięte do liczb nieujemnych
+CELL_Y_BIAS = 1 << 31
+
+"""Jednorodna siatka przestrzenna (spatial hash) do szybkiego wyszukiwania obiektów w danym obszarze."""
+class SpatialGrid:
+    def __init__(self, cell_size: int):
+        assert isinstance(cell_size, int) and cell_size > 0, "cell_size musi być dodatnią liczbą całkowitą"
+
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.items: List[Any] = []
+        self.lookup = self.cells.get
+
+    """Usuwa wszystkie obiekty z siatki."""
+    def clear(self):
+        self.cells = {}
+        self.items = []
+        self.lookup = self.cells.get
+
+    """Ustawia gotowe komórki (np. z pamięci podręcznej poziomów) zamiast dodawać obiekty po kolei."""
+    def set_cells(self, items: list, cells: Dict[Tuple[int, int], List[int]]):
+        """ Args:
+                items: Obiekty w kolejności dodania (lista albo sekwencja tworząca obiekty przy odczycie)
+                cells: Komórka -> indeksy obiektów w items (słownik albo CellColumns)
+        """
+        self.items = items
+        self.cells = cells
+
+        # CellColumns uzupełnia brakujące komórki w __missing__ - odczyt przez [] zamiast get
+        self.lookup = cells.__getitem__ if isinstance(cells, CellColumns) else cells.get
+
+    """Dodaje obiekt do wszystkich komórek, na które nachodzi jego prostokąt."""
+    def insert(self, item, left: float, top: float, right: float, bottom: float):
+        """ Args:
+                item: Obiekt do dodania
+                left, top, right, bottom: Granice obiektu w jednostkach świata
+        """
+        index = len(self.items)
+        self.items.append(item)
+
+        for cell_x in range(self._cell(left), self._cell(right) + 1):
+            for cell_y in range(self._cell(top), self._cell(bottom) + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(index)
+
+    """Zwraca obiekty z komórek, na które nachodzi podany prostokąt, w kolejności dodania."""
+    def query(self, left: float, top: float, right: float, bottom: float) -> list:
+        """ Args:
+                left, top, right, bottom: Granice obszaru w jednostkach świata
+            Returns:
+                Lista obiektów-kandydatów (bez powtórzeń)
+        """
+        found = []
+        buckets = 0
+
+        for cell_x in range(self._cell(left), self._cell(right) + 1):
+            for cell_y in range(self._cell(top), self._cell(bottom) + 1):
+                bucket = self.lookup((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket)
+                    buckets += 1
+
+        # Obiekt może leżeć w kilku komórkach - usuwamy powtórzenia i zachowujemy kolejność dodania
+        if buckets > 1:
+            found = sorted(set(found))
+
+        return [self.items[index] for index in found]
+
+    def _cell(self, value: float) -> int:
+        return int(value // self.cell_size)
+
+    def __len__(self):
+        return len(self.items)
+
+"""Komórki siatki zapisane kolumnami (posortowane klucze, początki kubełków, indeksy obiektów); kubełek komórki tworzony jest przy pierwszym odczycie."""
+class CellColumns(dict):
+    def __init__(self, cell_keys: np.ndarray, offsets: np.ndarray, indices: np.ndarray):
+        """ Args:
+                cell_keys: Posortowane klucze komórek (cell_key)
+                offsets: Początki kubełków w indices; ostatni element to len(indices)
+                indices: Indeksy obiektów kolejnych kubełków, rosnąco w każdym kubełku
+        """
+        super().__init__()
+
+        self.cell_keys = cell_keys
+        self.offsets = offsets
+        self.indices = indices
+
+    def __missing__(self, cell: Tuple[int, int]) -> Optional[List[int]]:
+        key = cell_key(*cell)
+        position = int(np.searchsorted(self.cell_keys, key))
+
+        bucket = None
+        if position < len(self.cell_keys) and self.cell_keys[position] == key:
+            bucket = self.indices[self.offsets[position]:self.offsets[position + 1]].tolist()
+
+        # Puste komórki też są zapamiętywane - kolejne zapytania nie przeszukują kolumn
+        self[cell] = bucket
+        return bucket
+
+    """Zwraca wszystkie niepuste komórki jako słownik (komórka -> indeksy obiektów)."""
+    def to_dict(self) -> Dict[Tuple[int, int], List[int]]:
+        cells = {}
+        for position, key in enumerate(self.cell_keys.tolist()):
+            cells[(key >> 32, (key & 0xFFFFFFFF) - CELL_Y_BIAS)] = self.indices[self.offsets[position]:self.offsets[position + 1]].tolist()
+
+        return cells
+
+"""Zwraca klucz int64 komórki (cell_x, cell_y); kolejność kluczy to kolejność po (cell_x, cell_y)."""
+def cell_key(cell_x, cell_y):
+    return (cell_x << 32) + (cell_y + CELL_Y_BIAS)
+
+"""Buduje kolumny komórek siatki dla prostokątów operacjami NumPy - jak kolejne SpatialGrid.insert, bez pętli po obiektach."""
+def build_cell_columns(lefts: np.ndarray, tops: np.ndarray, rights: np.ndarray, bottoms: np.ndarray, cell_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Args:
+            lefts, tops, rights, bottoms: Granice prostokątów (indeks prostokąta to indeks obiektu)
+            cell_size: Bok komórki
+        Returns:
+            Posortowane klucze komórek, początki kubełków i indeksy obiektów (argumenty CellColumns)
+    """
+    first_x, last_x = lefts // cell_size, rights // cell_size
+    first_y, last_y = tops // cell_size, bottoms // cell_size
+    heights = last_y - first_y + 1
+    counts = (last_x - first_x + 1) * heights
+
+    # Każdy prostokąt rozpisany na swoje komórki, kolumnami po x, w każdej kolumnie po y
+    items = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+    steps = np.arange(len(items), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    keys = cell_key(first_x[items] + steps // heights[items], first_y[items] + steps % heights[items])
+
+    # Sortowanie stabilne - w kubełku indeksy zostają rosnące, jak przy dodawaniu po kolei
+    order = np.argsort(keys, kind="stable")
+    keys, items = keys[order], items[order]
+
+    starts = np.flatnonzero(np.diff(keys, prepend=keys[:1] - 1)) if len(keys) else np.zeros(0, dtype=np.int64)
+
+    return keys[starts], np.append(starts, len(items)).astype(np.int64), items
@@ -0,0 +1,117 @@
+import argparse, struct, sys, zlib
+
+from array import array
+from typing import Optional
+
+# Stan po kroku widoczny dla gracza: x, y, velocity_y, on_ground, camera_offset_x - bez wewnętrznych struktur silnika
+# (np. kursora obiektów wyzwalanych), które różnią się między pełnym poziomem a wczytywanym segmentami
+STATE_FORMAT = struct.Struct("<ddd?q")
+
+# Nagłówek pliku: znacznik, wersja, liczba kroków
+HASH_LOG_MAGIC = b"GDSH"
+HASH_LOG_VERSION = 2
+HEADER_FORMAT = "<4sBI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+"""Strumień skrótów stanu symulacji po każdym kroku fizyki."""
+class StateHashLog:
+    def __init__(self):
+        # Skróty są łańcuchowe (CRC32 kroku liczony od skrótu poprzedniego), więc równy skrót
+        # oznacza równą całą historię - pierwszą różnicę można znaleźć wyszukiwaniem binarnym
+        self.hashes = array("I")
+
+    """Dopisuje skrót stanu po kroku fizyki."""
+    def append(self, engine, state):
+        """ Args:
+                engine: Silnik, który wykonał krok (kamera)
+                state: Stan gracza po kroku (SimulationState lub Player)
+        """
+        previous = self.hashes[-1] if self.hashes else 0
+        data = STATE_FORMAT.pack(state.x, state.y, state.velocity_y, state.on_ground, int(engine.camera_offset_x))
+
+        self.hashes.append(zlib.crc32(data, previous))
+
+    """Koduje strumień do postaci binarnej (little-endian)."""
+    def to_bytes(self) -> bytes:
+        hashes = self.hashes
+        if sys.byteorder != "little":
+            hashes = array("I", hashes)
+            hashes.byteswap()
+
+        return struct.pack(HEADER_FORMAT, HASH_LOG_MAGIC, HASH_LOG_VERSION, len(hashes)) + hashes.tobytes()
+
+    """Odczytuje strumień z postaci binarnej."""
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StateHashLog":
+        if len(data) < HEADER_SIZE or data[:4] != HASH_LOG_MAGIC:
+            raise ValueError("To nie jest plik skrótów stanu")
+
+        _, version, count = struct.unpack_from(HEADER_FORMAT, data)
+        if version != HASH_LOG_VERSION:
+            raise ValueError(f"Nieobsługiwana wersja pliku skrótów stanu: {version}")
+
+        log = cls()
+        log.hashes.frombytes(data[HEADER_SIZE:])
+        if sys.byteorder != "little":
+            log.hashes.byteswap()
+
+        if len(log.hashes) != count:
+            raise ValueError("Uszkodzony plik skrótów stanu")
+
+        return log
+
+    def save(self, path: str):
+        with open(path, "wb") as log_file:
+            log_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "StateHashLog":
+        with open(path, "rb") as log_file:
+            return cls.from_bytes(log_file.read())
+
+    def __len__(self):
+        return len(self.hashes)
+
+"""Zwraca numer pierwszego kroku, w którym dwa przebiegi się rozjechały, albo None, jeśli są zgodne."""
+def first_divergence(first: StateHashLog, second: StateHashLog) -> Optional[int]:
+    """ Args:
+            first: Skróty pierwszego przebiegu
+            second: Skróty drugiego przebiegu
+        Returns:
+            Indeks pierwszego różnego kroku (liczony od 0); długość krótszego strumienia, jeśli jeden jest przedłużeniem drugiego
+    """
+    count = min(len(first), len(second))
+
+    # Niezmiennik: kroki [0, low) są zgodne, krok high (jeśli < count) się różni
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if first.hashes[middle] == second.hashes[middle]:
+            low = middle + 1
+        else:
+            high = middle
+
+    if low == count and len(first) == len(second):
+        return None
+
+    return low
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównuje dwa pliki skrótów stanu i wskazuje pierwszy rozbieżny krok.")
+    parser.add_argument("first")
+    parser.add_argument("second")
+    args = parser.parse_args()
+
+    first = StateHashLog.load(args.first)
+    second = StateHashLog.load(args.second)
+
+    tick = first_divergence(first, second)
+    if tick is None:
+        print(f"OK - przebiegi zgodne ({len(first)} kroków)")
+        return
+
+    print(f"ROZBIEŻNOŚĆ w kroku {tick} (długości: {len(first)} i {len(second)})")
+    raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import pygame, asyncio
 
+from config import config
 from game.game_manager import GameManager
 
 if __name__ == "__main__":
@@ -12,12 +13,10 @@ if __name__ == "__main__":
 
     async def game_loop():
         while game_manager.is_running():
-            delta_time = clock.tick(60) / 1000.0
+            delta_time = clock.tick(config.RENDER_FPS) / 1000.0
 
             game_manager.update(delta_time)
-            game_manager.render()
-
-            pygame.display.flip()
+            game_manager.present(game_manager.render())
             await asyncio.sleep(0)
 
     asyncio.run(game_loop())
@@ -20,6 +20,10 @@ class Spike:
         self.outer_points = []
         self.inner_points = []
 
+        # Kolider w jednostkach świata, budowany raz przy wczytaniu poziomu (build_collider)
+        self.collider_bounds = None
+        self.collider_edges = None
+
     def draw(self, screen: pygame.Surface):
         assert isinstance(screen, pygame.Surface), "screen musi być instancją pygame.Surface"
 
@@ -57,5 +61,39 @@ class Spike:
             (x - 2 + inner_width // 2, y + inner_height // 2)
         ]
 
+    """Zwraca wierzchołki zewnętrznego trójkąta w jednostkach świata (bez skalowania do okna)."""
+    def get_world_points(self):
+        half_width = self.outer_width // 2
+        half_height = self.outer_height // 2
+
+        return [
+            (self.x, self.y - half_height),
+            (self.x - half_width, self.y + half_height),
+            (self.x + half_width, self.y + half_height)
+        ]
+
+    """Wylicza prostokąt ograniczający i współczynniki krawędzi trójkąta w jednostkach świata."""
+    def build_collider(self):
+        points = self.get_world_points()
+
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        self.collider_bounds = (min(xs), min(ys), max(xs), max(ys))
+
+        edges = []
+        for index in range(3):
+            x1, y1 = points[index]
+            x2, y2 = points[(index + 1) % 3]
+            x3, y3 = points[(index + 2) % 3]
+
+            # Krawędź a*x + b*y + c = 0, znak dobrany tak, by trzeci wierzchołek był po dodatniej stronie
+            a, b, c = y1 - y2, x2 - x1, x1 * y2 - x2 * y1
+            if a * x3 + b * y3 + c < 0:
+                a, b, c = -a, -b, -c
+
+            edges.append((a, b, c))
+
+        self.collider_edges = tuple(edges)
+
     def get_collision_points(self):
         return self.outer_points
\ No newline at end of file
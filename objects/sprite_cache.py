@@ -0,0 +1,108 @@
+import pygame
+
+from typing import Dict, Optional, Tuple
+
+from config import config
+
+from objects.block import Block
+from objects.spike import Spike
+from objects.jump_pad import JumpPad
+from objects.jump_orb import JumpOrb
+
+"""Pamięć podręczna wyrenderowanych obiektów gry dla aktualnego rozmiaru okna."""
+class SpriteCache:
+    # Nazwa klasy obiektu -> klasa używana do narysowania wzorca
+    OBJECT_TYPES = {
+        "Block": Block,
+        "Spike": Spike,
+        "JumpOrb": JumpOrb,
+        "JumpPad": JumpPad
+    }
+
+    # Nazwy typów z układu poziomu (levels.json) -> nazwa klasy
+    LAYOUT_TYPES = {
+        "block": "Block",
+        "spike": "Spike",
+        "jump_orb": "JumpOrb",
+        "jump_pad": "JumpPad"
+    }
+
+    def __init__(self):
+        self.screen_size: Optional[Tuple[int, int]] = None
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+
+        # Nazwa klasy -> (powierzchnia, przesunięcie lewego górnego rogu względem środka obiektu)
+        self.sprites: Dict[str, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+
+    """Przebudowuje wzorce, jeśli zmienił się rozmiar ekranu."""
+    def update(self, screen: pygame.Surface):
+        """ Args:
+                screen: Powierzchnia, na której będą rysowane obiekty
+        """
+        self._validate_screen(screen)
+
+        screen_size = screen.get_size()
+        if screen_size == self.screen_size:
+            return
+
+        self.screen_size = screen_size
+        self.scale_x = screen_size[0] / config.SCREEN_WIDTH
+        self.scale_y = screen_size[1] / config.SCREEN_HEIGHT
+
+        self.sprites = {name: self._render_sprite(obj_class, screen_size) for name, obj_class in self.OBJECT_TYPES.items()}
+
+    """Usuwa wzorce - zostaną zbudowane przy następnym update."""
+    def invalidate(self):
+        self.screen_size = None
+        self.sprites = {}
+
+    """Zwraca parę (powierzchnia, pozycja) do Surface.blits dla obiektu o środku w podanym punkcie."""
+    def get_blit(self, type_name: str, x: int, y: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """ Args:
+                type_name: Nazwa klasy obiektu ("Block", "Spike", "JumpOrb", "JumpPad")
+                x: Pozycja X środka obiektu (przed skalowaniem do okna)
+                y: Pozycja Y środka obiektu (przed skalowaniem do okna)
+            Returns:
+                Krotka (powierzchnia, (x, y)) w pikselach okna
+        """
+        surface, (offset_x, offset_y) = self.sprites[type_name]
+
+        # Środek obiektu liczony tak samo jak w update_size obiektów
+        center_x = int(self.screen_size[0] * (x / config.SCREEN_WIDTH))
+        center_y = int(self.screen_size[1] * (y / config.SCREEN_HEIGHT))
+
+        return surface, (center_x + offset_x, center_y + offset_y)
+
+    """Rysuje obiekt danej klasy jego własną metodą draw i wycina go do osobnej powierzchni."""
+    @staticmethod
+    def _render_sprite(obj_class, screen_size: Tuple[int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        reference_x = config.SCREEN_WIDTH // 2
+        reference_y = config.SCREEN_HEIGHT // 2
+
+        scratch = pygame.Surface(screen_size, pygame.SRCALPHA)
+        obj_class(reference_x, reference_y).draw(scratch)
+
+        center_x = int(screen_size[0] * (reference_x / config.SCREEN_WIDTH))
+        center_y = int(screen_size[1] * (reference_y / config.SCREEN_HEIGHT))
+
+        # Obiekt mieści się w kwadracie bloku wokół środka - przeszukanie całej powierzchni okna trwa kilkanaście ms na wzorzec
+        reach = 2 * config.BLOCK_OUTER_SIZE * max(screen_size[0] / config.SCREEN_WIDTH, screen_size[1] / config.SCREEN_HEIGHT)
+        area = pygame.Rect(0, 0, 2 * reach, 2 * reach)
+        area.center = (center_x, center_y)
+        area = area.clip(scratch.get_rect())
+
+        bounds = scratch.subsurface(area).get_bounding_rect().move(area.topleft)
+        sprite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        sprite.blit(scratch, (0, 0), bounds)
+
+        # Format piksela okna przyspiesza blit; bez okna (testy, tryb bez ekranu) zostaje SRCALPHA
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+
+        return sprite, (bounds.x - center_x, bounds.y - center_y)
+
+    @staticmethod
+    def _validate_screen(screen):
+        if not isinstance(screen, pygame.Surface):
+            raise ValueError("screen musi być instancją pygame.Surface")
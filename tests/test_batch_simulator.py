@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+
+from game.engine import Engine
+from game.floor import Floor
+from game.batch_simulator import BatchSimulator
+
+from config import config
+
+class TestBatchSimulator:
+    @pytest.fixture
+    def engine(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout([
+            {"type": "block", "x": 630, "y": 690},
+            {"type": "block", "x": 690, "y": 690},
+            {"type": "spike", "x": 930, "y": 690},
+            {"type": "jump_pad", "x": 1230, "y": 690},
+            {"type": "jump_orb", "x": 1530, "y": 510},
+            {"type": "spike", "x": 1650, "y": 690}
+        ])
+        return engine
+
+    def test_matches_engine_step(self, engine):
+        count, ticks = 64, 1200
+        schedule = np.random.default_rng(7).random((ticks, count)) < 0.05
+
+        simulator = BatchSimulator(engine, count)
+        simulator.run(schedule)
+
+        for agent in range(count):
+            state = engine.create_state()
+            death_tick = -1
+            finish_tick = -1
+
+            for tick in range(ticks):
+                if engine.step(state, bool(schedule[tick, agent])):
+                    death_tick = tick
+                    break
+                if state.x >= simulator.level_end_x:
+                    finish_tick = tick
+                    break
+
+            assert simulator.death_tick[agent] == death_tick
+            assert simulator.finish_tick[agent] == finish_tick
+            if death_tick >= 0:
+                assert simulator.death_x[agent] == state.x
+
+    def test_dead_players_are_frozen(self, engine):
+        simulator = BatchSimulator(engine, 2)
+        simulator.run(np.zeros((600, 2), dtype=bool))
+
+        assert not simulator.alive.any()
+        assert (simulator.x == simulator.death_x).all()
+
+    def test_reset(self, engine):
+        simulator = BatchSimulator(engine, 3)
+        simulator.run(np.ones((100, 3), dtype=bool))
+        simulator.reset()
+
+        assert simulator.tick == 0
+        assert (simulator.x == config.PLAYER_RESET_X).all()
+        assert simulator.alive.all()
+
+    def test_invalid_schedule_shape(self, engine):
+        simulator = BatchSimulator(engine, 3)
+
+        with pytest.raises(ValueError, match="schedule musi mieć kształt"):
+            simulator.run(np.zeros((10, 4), dtype=bool))
@@ -0,0 +1,104 @@
+import pytest
+import pygame
+
+from game.chunk_renderer import ChunkRenderer
+from objects.sprite_cache import SpriteCache
+from objects.block import Block
+from objects.spike import Spike
+
+from config import config
+
+class TestChunkRenderer:
+    @pytest.fixture
+    def objects(self):
+        return [Block(30 + i * 60, 690) for i in range(40)] + [Spike(510, 630), Spike(1050, 630)]
+
+    def test_matches_sprite_blits(self, objects):
+        sprite_cache = SpriteCache()
+        renderer = ChunkRenderer(sprite_cache, prefetch=0)
+        renderer.set_objects(objects)
+
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        reference = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        # Pierwsza klatka rysowana z wzorców, zanim wątek wypiecze chunki
+        renderer.draw(screen, 0)
+        reference.blits([sprite_cache.get_blit(obj.__class__.__name__, obj.x, obj.y) for obj in objects], False)
+
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(reference, "RGB")
+
+        renderer.close()
+        assert renderer.chunks
+
+        baked = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        renderer.draw(baked, 0)
+        renderer.close()
+
+        assert pygame.image.tobytes(baked, "RGB") == pygame.image.tobytes(reference, "RGB")
+
+    def test_bakes_only_chunks_near_camera(self, objects):
+        renderer = ChunkRenderer(SpriteCache(), prefetch=0)
+        renderer.set_objects(objects)
+
+        renderer.draw(pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)), -1024)
+        renderer.close()
+
+        assert sorted(renderer.chunks) == [2, 3, 4, 5]
+
+    def test_evicts_least_recently_used_over_budget(self, objects):
+        renderer = ChunkRenderer(SpriteCache(), chunk_width=256, prefetch=0, budget_bytes=1)
+        renderer.set_objects(objects)
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        renderer.draw(screen, 0)
+        renderer.close()
+        renderer.draw(screen, -1024)
+        renderer.close()
+
+        # Widoczne chunki zostają nawet po przekroczeniu budżetu
+        assert min(renderer.chunks) == 4
+
+    def test_set_objects_and_resize_invalidate(self, objects):
+        renderer = ChunkRenderer(SpriteCache(), prefetch=0)
+        renderer.set_objects(objects)
+        renderer.draw(pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)), 0)
+        renderer.close()
+        generation = renderer.generation
+
+        renderer.draw(pygame.Surface((800, 450)), 0)
+        assert renderer.generation == generation + 1
+
+        renderer.set_objects([])
+        assert renderer.chunks == {}
+        assert renderer.cache_bytes == 0
+
+    def test_prefetch_without_threads(self, objects):
+        renderer = ChunkRenderer(SpriteCache(), prefetch=2)
+        renderer.worker_available = False
+        renderer.set_objects(objects)
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        renderer.draw(screen, 0)
+        renderer.draw(screen, 0)
+
+        assert 4 in renderer.chunks and 5 in renderer.chunks
+        assert renderer.worker is None
+
+    def test_worker_bakes_ahead(self, objects):
+        renderer = ChunkRenderer(SpriteCache(), prefetch=2)
+        renderer.set_objects(objects)
+
+        renderer.draw(pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)), 0)
+        renderer.close()
+
+        assert 4 in renderer.chunks and 5 in renderer.chunks
+
+    def test_first_frame_does_not_bake(self, objects, monkeypatch):
+        renderer = ChunkRenderer(SpriteCache(), prefetch=0)
+        renderer.set_objects(objects)
+        monkeypatch.setattr(renderer, "_start_worker", lambda: setattr(renderer, "worker", object()))
+
+        renderer.draw(pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)), 0)
+
+        assert renderer.chunks == {}
+        assert renderer.jobs.qsize() == 4
@@ -7,6 +7,10 @@ from game.engine import Engine
 from game.player import Player
 from game.floor import Floor
 
+from objects.block import Block
+from objects.spike import Spike
+from objects.jump_pad import JumpPad
+
 from config import config
 
 class TestEngineIntegration:
@@ -113,15 +117,12 @@ class TestEngineIntegration:
             {"type": "jump_pad", "x": 330, "y": 490}
         ]
 
-        with patch('game.engine.Block') as mock_block, \
-                patch('game.engine.Spike') as mock_spike, \
-                patch('game.engine.JumpPad') as mock_jump_pad:
-            engine.set_objects_from_layout(layout)
+        engine.set_objects_from_layout(layout)
 
+        # Obiekty gry tworzone są dopiero przy pierwszym odczycie
         assert len(engine.objects) == 3
-        mock_block.assert_called_once_with(330, 390)
-        mock_spike.assert_called_once_with(330, 450)
-        mock_jump_pad.assert_called_once_with(330, 490)
+        assert engine.objects.objects == [None, None, None]
+        assert [(type(obj), obj.x, obj.y) for obj in engine.objects] == [(Block, 330, 390), (Spike, 330, 450), (JumpPad, 330, 490)]
 
     @patch('config.config.MIN_LEVEL_LENGTH', 1020)
     @patch('config.config.END_WALL_X', 120)
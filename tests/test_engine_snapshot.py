@@ -0,0 +1,108 @@
+import pytest
+import sys
+
+from game.engine import Engine
+from game.engine_snapshot import EngineSnapshot
+from game.floor import Floor
+from game.game_manager import GameManager
+from game.player import Player
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 630, "y": 390},
+    {"type": "jump_orb", "x": 1530, "y": 510},
+    {"type": "spike", "x": 2430, "y": 690}
+]
+
+class TestEngineSnapshot:
+    @pytest.fixture
+    def engine(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(LAYOUT)
+        return engine
+
+    @pytest.fixture
+    def game_manager(self):
+        game_manager = GameManager()
+        game_manager.floor = Floor(config.FLOOR_Y)
+        game_manager.player = Player()
+        game_manager.engine = Engine(game_manager.floor)
+        game_manager.engine.set_objects_from_layout(LAYOUT)
+        game_manager.reset_physics()
+        return game_manager
+
+    def test_restore_continues_identically(self, engine):
+        state = engine.create_state()
+        for tick in range(600):
+            engine.step(state, tick % 90 == 0)
+
+        snapshot = EngineSnapshot()
+        snapshot.capture(engine, state)
+
+        expected = []
+        for tick in range(200):
+            engine.step(state, tick % 40 == 0)
+            expected.append((state.x, state.y, state.velocity_y, state.on_ground, engine.camera_offset_x))
+
+        snapshot.restore(engine, state)
+
+        for tick in range(200):
+            engine.step(state, tick % 40 == 0)
+            assert (state.x, state.y, state.velocity_y, state.on_ground, engine.camera_offset_x) == expected[tick]
+
+    def test_restore_does_not_allocate(self, engine):
+        state = engine.create_state()
+        for _ in range(300):
+            engine.step(state, False)
+
+        snapshot = EngineSnapshot()
+        snapshot.capture(engine, state)
+
+        restore = snapshot.restore
+        restore(engine, state)
+        blocks = sys.getallocatedblocks()
+        for _ in range(10000):
+            restore(engine, state)
+
+        assert sys.getallocatedblocks() - blocks < 10
+
+    def test_death_in_practice_mode_restores_checkpoint(self, game_manager):
+        game_manager.toggle_practice_mode()
+
+        for _ in range(60):
+            game_manager._update_physics(1 / 60, False)
+        game_manager.place_checkpoint()
+        checkpoint_x = game_manager.physics_state.x
+
+        attempts = game_manager.engine.attempts
+        for _ in range(600):
+            game_manager._update_physics(1 / 60, False)
+            if game_manager.engine.attempts > attempts:
+                break
+
+        assert game_manager.engine.attempts == attempts + 1
+        assert game_manager.physics_state.x == checkpoint_x
+        assert game_manager.player.x == checkpoint_x
+        assert game_manager.replay_recorder is None
+
+    def test_death_without_practice_mode_restarts_level(self, game_manager):
+        for _ in range(60):
+            game_manager._update_physics(1 / 60, False)
+        game_manager.place_checkpoint()
+
+        assert not game_manager.checkpoint_set
+
+        attempts = game_manager.engine.attempts
+        while game_manager.engine.attempts == attempts:
+            game_manager._update_physics(1 / 60, False)
+
+        assert game_manager.physics_state.x == config.PLAYER_RESET_X
+
+    def test_leaving_practice_mode_clears_checkpoint(self, game_manager):
+        game_manager.toggle_practice_mode()
+        game_manager.place_checkpoint()
+        game_manager.toggle_practice_mode()
+
+        assert not game_manager.practice_mode
+        assert not game_manager.checkpoint_set
@@ -0,0 +1,92 @@
+import pytest
+import pygame
+
+from unittest.mock import patch
+
+from game.engine import Engine
+from game.floor import Floor
+from game.simulation_state import SimulationState
+
+from config import config
+
+class TestEngineStep:
+    @pytest.fixture
+    def engine(self):
+        return Engine(Floor(config.FLOOR_Y))
+
+    def test_create_state_on_floor(self, engine):
+        state = engine.create_state()
+
+        assert state.x == config.PLAYER_RESET_X
+        assert state.y == config.FLOOR_Y - config.PLAYER_OUTER_SIZE // 2
+        assert state.velocity_y == 0
+        assert state.on_ground
+
+    def test_step_runs_without_display(self, engine):
+        state = engine.create_state()
+
+        with patch('pygame.display.get_surface', side_effect=AssertionError("get_surface nie powinno być wołane")):
+            for _ in range(config.PHYSICS_TICK_RATE):
+                assert not engine.step(state, True)
+
+        assert state.x == pytest.approx(config.PLAYER_RESET_X + config.PLAYER_SPEED)
+
+    def test_step_jump_and_land(self, engine):
+        state = engine.create_state()
+
+        engine.step(state, True)
+        assert state.velocity_y < 0
+        assert not state.on_ground
+
+        for _ in range(config.PHYSICS_TICK_RATE):
+            engine.step(state, False)
+            if state.on_ground: break
+
+        assert state.on_ground
+        assert state.y == config.FLOOR_Y - config.PLAYER_OUTER_SIZE // 2
+
+    def test_step_spike_collision(self, engine):
+        engine.set_objects_from_layout([{"type": "spike", "x": 390, "y": 690}])
+        state = engine.create_state()
+
+        game_over = False
+        for _ in range(config.PHYSICS_TICK_RATE):
+            game_over = engine.step(state, False)
+            if game_over: break
+
+        assert game_over
+        assert state.x < 390
+
+    def test_step_jump_pad(self, engine):
+        engine.set_objects_from_layout([{"type": "jump_pad", "x": 150, "y": 690}])
+        state = engine.create_state()
+
+        engine.step(state, False)
+
+        assert state.velocity_y == pytest.approx(engine.jump_force * 1.3)
+
+    def test_step_is_deterministic(self, engine):
+        engine.set_objects_from_layout([
+            {"type": "block", "x": 570, "y": 690},
+            {"type": "spike", "x": 930, "y": 690},
+            {"type": "jump_orb", "x": 750, "y": 570}
+        ])
+
+        def run():
+            state = engine.create_state()
+            trace = []
+            for tick in range(600):
+                game_over = engine.step(state, tick % 50 < 5)
+                trace.append((state.x, state.y, state.velocity_y, state.on_ground, game_over))
+                if game_over: break
+            return trace
+
+        assert run() == run()
+
+    def test_step_with_invalid_state(self, engine):
+        with pytest.raises(ValueError, match="state musi być instancją klasy SimulationState lub Player"):
+            engine.step("not_a_state", False)
+
+    def test_step_with_invalid_dt(self, engine):
+        with pytest.raises(ValueError, match="dt musi być dodatnią liczbą zmiennoprzecinkową"):
+            engine.step(SimulationState(), False, 0)
@@ -0,0 +1,53 @@
+import pytest
+import pygame
+
+from unittest.mock import patch
+
+from ui.font_cache import FontCache
+from ui.label import Label
+
+from config import config
+
+class TestFontCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        pygame.font.init()
+        FontCache.clear()
+        yield
+        FontCache.clear()
+
+    def test_font_created_once_per_size(self):
+        with patch('pygame.font.SysFont', wraps=pygame.font.SysFont) as sys_font:
+            first = FontCache.get_font(24)
+            second = FontCache.get_font(24.0)
+            FontCache.get_font(32)
+
+        assert first is second
+        assert sys_font.call_count == 2
+
+    def test_render_reuses_surface(self):
+        first = FontCache.render("Attempt 1", 24, (255, 255, 255))
+
+        assert FontCache.render("Attempt 1", 24, (255, 255, 255)) is first
+        assert FontCache.render("Attempt 1", 24, (0, 0, 0)) is not first
+        assert FontCache.render("Attempt 2", 24, (255, 255, 255)) is not first
+
+    def test_render_evicts_least_recently_used(self):
+        with patch.object(FontCache, 'max_texts', 2):
+            FontCache.render("a", 24, (255, 255, 255))
+            FontCache.render("b", 24, (255, 255, 255))
+            FontCache.render("a", 24, (255, 255, 255))
+            FontCache.render("c", 24, (255, 255, 255))
+
+        assert [key[0] for key in FontCache.texts] == ["a", "c"]
+
+    def test_label_draw_does_not_create_fonts(self):
+        label = Label(100, 100, "Attempt 1")
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        label.draw(screen)
+
+        with patch('pygame.font.SysFont') as sys_font:
+            for _ in range(10):
+                label.draw(screen)
+
+        assert sys_font.call_count == 0
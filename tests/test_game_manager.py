@@ -0,0 +1,136 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock, patch
+
+from game.engine import Engine
+from game.floor import Floor
+from game.game_manager import GameManager
+from game.player import Player
+from ui.ui_manager import UIManager
+
+from config import config
+
+class TestHandleResize:
+    @pytest.fixture
+    def game_manager(self):
+        game_manager = GameManager()
+        game_manager.ui_manager = Mock(spec=UIManager)
+        game_manager.ui_manager.window = pygame.Surface((1600, 900))
+        return game_manager
+
+    def test_logical_canvas_keeps_window_surface(self, game_manager):
+        window = game_manager.ui_manager.window
+
+        with patch('config.config.LOGICAL_CANVAS', True), patch('pygame.display.set_mode') as set_mode:
+            game_manager.handle_resize(1920, 1080)
+
+        set_mode.assert_not_called()
+        assert game_manager.ui_manager.window is window
+
+    def test_window_mode_keeps_aspect_ratio(self, game_manager):
+        with patch('config.config.LOGICAL_CANVAS', False), \
+                patch('pygame.display.set_mode', return_value=pygame.Surface((1000, 562))) as set_mode, \
+                patch.object(game_manager, 'apply_scale') as apply_scale:
+            game_manager.handle_resize(1000, 1000)
+
+        set_mode.assert_called_once_with((1000, 562), pygame.RESIZABLE)
+        assert apply_scale.call_args[0][0].size == (1000, 562)
+
+    def test_invalid_size(self, game_manager):
+        with pytest.raises(ValueError, match="width must be a positive integer"):
+            game_manager.handle_resize(0, 100)
+
+class TestPresent:
+    @pytest.fixture
+    def game_manager(self):
+        game_manager = GameManager()
+        game_manager.ui_manager = Mock(spec=UIManager)
+        game_manager.ui_manager.render.return_value = [pygame.Rect(10, 20, 30, 40)]
+        return game_manager
+
+    def test_window_mode_updates_returned_rects(self, game_manager):
+        with patch('config.config.LOGICAL_CANVAS', False), \
+                patch('pygame.display.update') as update, patch('pygame.display.flip') as flip:
+            dirty_rects = game_manager.render()
+            game_manager.present(dirty_rects)
+
+        update.assert_called_once()
+        assert update.call_args[0][0] is dirty_rects
+        assert dirty_rects == [pygame.Rect(10, 20, 30, 40)]
+        flip.assert_not_called()
+
+    def test_logical_canvas_presents_whole_frame(self, game_manager):
+        with patch('config.config.LOGICAL_CANVAS', True), \
+                patch('pygame.display.update') as update, patch('pygame.display.flip') as flip:
+            game_manager.present(game_manager.render())
+
+        flip.assert_called_once_with()
+        update.assert_not_called()
+
+class TestFixedRatePhysics:
+    @staticmethod
+    def _create_game_manager():
+        game_manager = GameManager()
+        game_manager.floor = Floor(config.FLOOR_Y)
+        game_manager.player = Player()
+        game_manager.engine = Engine(game_manager.floor)
+        game_manager.engine.set_objects_from_layout([])
+        game_manager.reset_physics()
+        return game_manager
+
+    @pytest.fixture
+    def game_manager(self):
+        return self._create_game_manager()
+
+    def test_steps_per_frame_follow_tick_rate(self, game_manager):
+        with patch.object(game_manager.engine, 'step', return_value=False) as step:
+            game_manager._update_physics(1 / 30, False)
+
+        assert step.call_count == round(config.PHYSICS_TICK_RATE / 30)
+
+    def test_leftover_time_is_carried_to_next_frame(self, game_manager):
+        with patch.object(game_manager.engine, 'step', return_value=False) as step:
+            game_manager._update_physics(config.PHYSICS_TIMESTEP * 1.5, False)
+            assert step.call_count == 1
+
+            game_manager._update_physics(config.PHYSICS_TIMESTEP * 0.5, False)
+            assert step.call_count == 2
+
+    def test_frame_time_is_capped(self, game_manager):
+        with patch.object(game_manager.engine, 'step', return_value=False) as step:
+            game_manager._update_physics(10.0, False)
+
+        # Odejmowanie kroku od akumulatora może zgubić ostatni krok przez zaokrąglenia
+        assert round(config.MAX_FRAME_TIME / config.PHYSICS_TIMESTEP) - 1 <= step.call_count <= round(config.MAX_FRAME_TIME / config.PHYSICS_TIMESTEP)
+
+    def test_player_is_interpolated_between_steps(self, game_manager):
+        game_manager._update_physics(config.PHYSICS_TIMESTEP * 2.5, False)
+
+        previous_x = game_manager.previous_physics_state.x
+        current_x = game_manager.physics_state.x
+
+        assert previous_x < game_manager.player.x < current_x
+        assert game_manager.player.x == pytest.approx(previous_x + (current_x - previous_x) * 0.5)
+
+    def test_result_independent_of_render_rate(self):
+        results = []
+        for fps in (30, 60, 144):
+            game_manager = self._create_game_manager()
+
+            for _ in range(fps):
+                game_manager._update_physics(1 / fps, False)
+
+            results.append(game_manager.physics_state.x)
+
+        assert results[0] == pytest.approx(results[1]) == pytest.approx(results[2])
+
+    def test_game_over_resets_physics(self, game_manager):
+        attempts = game_manager.engine.attempts
+
+        with patch.object(game_manager.engine, 'step', return_value=True):
+            game_manager._update_physics(1 / 30, False)
+
+        assert game_manager.engine.attempts == attempts + 1
+        assert game_manager.physics_accumulator == 0.0
+        assert game_manager.physics_state.x == config.PLAYER_RESET_X
@@ -0,0 +1,98 @@
+import time
+
+import pytest
+
+from game.engine import Engine
+from game.floor import Floor
+from game.level_binary import BinaryLevel, write_level, encode_layout, convert_store, open_binary_level, HEADER_SIZE
+from game.level_store import LevelStore, layout_hash
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 690, "y": 690},
+    {"type": "spike", "x": 450, "y": 690},
+    {"type": "jump_pad", "x": 1230, "y": 690},
+    {"type": "jump_orb", "x": 1530, "y": 510},
+    {"type": "block", "x": -60, "y": 2147483647}
+]
+
+class TestLevelBinary:
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = str(tmp_path / "level.gdl")
+        write_level(path, LAYOUT)
+        return path
+
+    def test_round_trip(self, path):
+        with BinaryLevel(path) as level:
+            assert len(level) == 5
+            assert level.to_layout() == LAYOUT
+            assert level.level_hash == layout_hash(LAYOUT)
+
+    def test_columns_are_views_on_the_file(self, path):
+        with BinaryLevel(path) as level:
+            assert not level.xs.flags.owndata
+            assert level.xs.base is not None
+            assert level.xs.tolist() == [obj["x"] for obj in LAYOUT]
+            assert level.types.tolist() == [0, 1, 2, 3, 0]
+
+    def test_size_is_nine_bytes_per_object(self):
+        layout = [{"type": "block", "x": x, "y": 690} for x in range(0, 60000, 60)]
+
+        assert len(encode_layout(layout)) == HEADER_SIZE + 9 * len(layout)
+
+    def test_rejects_invalid_files(self, tmp_path, path):
+        invalid = tmp_path / "invalid.gdl"
+        invalid.write_bytes(b"not a level file")
+        with pytest.raises(ValueError, match="To nie jest binarny plik poziomu"):
+            BinaryLevel(str(invalid))
+
+        with open(path, "rb") as level_file:
+            truncated = level_file.read()[:-1]
+        invalid.write_bytes(truncated)
+        with pytest.raises(ValueError, match="Uszkodzony binarny plik poziomu"):
+            BinaryLevel(str(invalid))
+
+    def test_engine_objects_match_json_layout(self, path):
+        from_json = Engine(Floor(config.FLOOR_Y))
+        from_json.set_objects_from_layout(LAYOUT)
+
+        from_binary = Engine(Floor(config.FLOOR_Y))
+        with BinaryLevel(path) as level:
+            from_binary.set_objects_from_binary(level)
+
+        assert [(type(obj), obj.x, obj.y) for obj in from_binary.objects] == [(type(obj), obj.x, obj.y) for obj in from_json.objects]
+        assert len(from_binary.compiled_level.triggers) == len(from_json.compiled_level.triggers)
+
+    def test_binary_load_creates_no_objects(self, tmp_path):
+        layout = [{"type": ("block", "spike", "jump_pad", "jump_orb")[i % 4], "x": 30 + 60 * (i // 2), "y": 690 - 60 * (i % 2)}
+                  for i in range(100000)]
+        path = str(tmp_path / "long.gdl")
+        write_level(path, layout)
+
+        engine = Engine(Floor(config.FLOOR_Y))
+        start_time = time.perf_counter()
+        with BinaryLevel(path) as level:
+            engine.set_objects_from_binary(level)
+        execution_time = time.perf_counter() - start_time
+
+        # Struktury kolizji budowane są z kolumn - obiekty gry powstają dopiero przy rysowaniu lub kolizji
+        assert all(obj is None for obj in engine.objects.objects)
+        assert all(span is None for span in engine.compiled_level.block_spans.spans)
+        assert len(engine.compiled_level.triggers) == 75000
+        assert execution_time < 0.5
+
+    def test_store_conversion_and_staleness(self, tmp_path):
+        store = LevelStore(str(tmp_path))
+        store.save_level({"index": "1", "name": "One", "difficulty": "easy", "layout": LAYOUT})
+
+        convert_store(store)
+        entry = store.load()[0]
+
+        level = open_binary_level(store, entry)
+        assert level is not None
+        level.close()
+
+        changed = store.save_level({**entry, "layout": LAYOUT[:2]})
+        assert open_binary_level(store, changed) is None
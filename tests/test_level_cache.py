@@ -0,0 +1,134 @@
+import os, time
+
+import pytest
+
+from game.engine import Engine
+from game.floor import Floor
+from game.level_cache import LevelCache
+from game.level_store import layout_hash
+
+from objects.spike import Spike
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 690, "y": 690},
+    {"type": "block", "x": 750, "y": 690},
+    {"type": "spike", "x": 1230, "y": 690},
+    {"type": "jump_pad", "x": 450, "y": 690},
+    {"type": "jump_orb", "x": 930, "y": 510},
+    {"type": "block", "x": 2010, "y": 570}
+]
+
+LEVEL_HASH = layout_hash(LAYOUT)
+
+class TestLevelCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return LevelCache(str(tmp_path))
+
+    def _create_engine(self, cache):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.level_cache = cache
+        return engine
+
+    def test_cached_structures_match_compiled(self, cache):
+        compiled = self._create_engine(cache)
+        compiled.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+        assert os.path.exists(cache.get_path(LEVEL_HASH))
+
+        cached = self._create_engine(cache)
+        cached.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        assert [repr(span) for span in cached.compiled_level.block_spans] == [repr(span) for span in compiled.compiled_level.block_spans]
+        assert [(obj.x, obj.y) for obj in cached.compiled_level.triggers] == [(obj.x, obj.y) for obj in compiled.compiled_level.triggers]
+        assert all(obj in cached.objects for obj in cached.compiled_level.triggers)
+        assert cached.compiled_level.trigger_lefts == compiled.compiled_level.trigger_lefts
+        assert cached.spatial_grid.cells.to_dict() == compiled.spatial_grid.cells.to_dict()
+        assert cached.get_furthest_object_x() == compiled.get_furthest_object_x() == 2010 + config.END_WALL_X
+
+    def test_cache_hit_skips_compilation(self, cache, monkeypatch):
+        self._create_engine(cache).set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        monkeypatch.setattr("game.engine.compile_level", lambda *args: pytest.fail("kompilacja przy trafieniu w pamięci podręcznej"))
+        engine = self._create_engine(cache)
+        engine.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        # Oś czasu i krawędzie kolców są widokami na dane pliku; obiekty gry nie są tworzone
+        assert not engine.compiled_level.trigger_columns.flags.owndata
+        assert all(obj is None for obj in engine.objects.objects)
+
+        spike = engine.compiled_level.triggers[2]
+        expected = Spike(1230, 690)
+        expected.build_collider()
+        assert spike.collider_edges == expected.collider_edges
+
+    def test_cache_is_not_used_without_hash(self, cache, monkeypatch):
+        monkeypatch.setattr(cache, "load", lambda *args: pytest.fail("load bez hasha poziomu"))
+
+        self._create_engine(cache).set_objects_from_layout(LAYOUT)
+
+        assert not os.listdir(cache.directory)
+
+    def test_step_matches_uncached_engine(self, cache):
+        uncached = Engine(Floor(config.FLOOR_Y))
+        uncached.set_objects_from_layout(LAYOUT)
+
+        self._create_engine(cache).set_objects_from_layout(LAYOUT, LEVEL_HASH)
+        cached = self._create_engine(cache)
+        cached.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        uncached_state = uncached.create_state()
+        cached_state = cached.create_state()
+        for tick in range(config.PHYSICS_TICK_RATE * 3):
+            jump = tick % 60 < 5
+            assert cached.step(cached_state, jump) == uncached.step(uncached_state, jump)
+            assert (cached_state.x, cached_state.y, cached_state.velocity_y) == (uncached_state.x, uncached_state.y, uncached_state.velocity_y)
+
+    def test_config_change_invalidates_entry(self, cache, monkeypatch):
+        self._create_engine(cache).set_objects_from_layout(LAYOUT, LEVEL_HASH)
+        engine = self._create_engine(cache)
+        engine.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        monkeypatch.setattr(config, "GRID_SIZE", config.GRID_SIZE * 2)
+
+        assert cache.load(LEVEL_HASH, engine.objects) is None
+
+        # Krawędzie kolców zapisane w pliku zależą od rozmiaru kolca
+        monkeypatch.setattr(config, "GRID_SIZE", config.GRID_SIZE // 2)
+        monkeypatch.setattr(config, "SPIKE_OUTER_WIDTH", config.SPIKE_OUTER_WIDTH + 2)
+
+        assert cache.load(LEVEL_HASH, engine.objects) is None
+
+    def test_corrupted_entry_is_skipped(self, cache):
+        engine = self._create_engine(cache)
+        engine.set_objects_from_layout(LAYOUT, LEVEL_HASH)
+
+        with open(cache.get_path(LEVEL_HASH), "r+b") as cache_file:
+            cache_file.truncate(os.path.getsize(cache.get_path(LEVEL_HASH)) - 4)
+
+        assert cache.load(LEVEL_HASH, engine.objects) is None
+
+    def test_evicts_by_age_and_size(self, tmp_path):
+        cache = LevelCache(str(tmp_path), max_bytes=10 ** 6, max_age=60)
+        engine = self._create_engine(cache)
+
+        layouts = [LAYOUT[:count] for count in range(2, 6)]
+        for layout in layouts:
+            engine.set_objects_from_layout(layout, layout_hash(layout))
+
+        # Najstarszy wpis nieużywany od godziny
+        old_path = cache.get_path(layout_hash(layouts[0]))
+        os.utime(old_path, (time.time() - 3600, time.time() - 3600))
+        cache.evict()
+        assert not os.path.exists(old_path)
+
+        sizes = {layout_hash(layout): os.path.getsize(cache.get_path(layout_hash(layout))) for layout in layouts[1:]}
+        for index, layout in enumerate(layouts[1:]):
+            os.utime(cache.get_path(layout_hash(layout)), (time.time() - 30 + index, time.time() - 30 + index))
+
+        # Limit rozmiaru mieści tylko dwa najnowsze wpisy
+        cache.max_bytes = sizes[layout_hash(layouts[2])] + sizes[layout_hash(layouts[3])]
+        cache.evict()
+
+        assert [os.path.exists(cache.get_path(layout_hash(layout))) for layout in layouts[1:]] == [False, True, True]
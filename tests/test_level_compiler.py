@@ -0,0 +1,71 @@
+import pytest
+
+from unittest.mock import Mock
+
+from game.engine import Engine
+from game.floor import Floor
+from game.level_compiler import compile_level, merge_blocks
+from game.simulation_state import SimulationState
+
+from objects.block import Block
+from objects.spike import Spike
+from objects.jump_pad import JumpPad
+
+from config import config
+
+class TestLevelCompiler:
+    def test_adjacent_blocks_are_merged(self):
+        blocks = [Block(x, 690) for x in (150, 30, 90, 270)] + [Block(90, 630)]
+
+        spans = merge_blocks(blocks)
+
+        assert [(span.left, span.right, span.top, span.count) for span in spans] == [
+            (60, 120, 600, 1),
+            (0, 180, 660, 3),
+            (240, 300, 660, 1)
+        ]
+
+    def test_duplicate_blocks_are_merged(self):
+        spans = merge_blocks([Block(30, 690), Block(30, 690)])
+
+        assert len(spans) == 1
+        assert spans[0].right == 60
+
+    def test_triggers_sorted_by_x(self):
+        objects = [Spike(300, 690), Block(30, 690), JumpPad(120, 690), Spike(120, 630)]
+
+        level = compile_level(objects)
+
+        assert [obj.x for obj in level.triggers] == [120, 120, 300]
+        assert isinstance(level.triggers[0], JumpPad)
+        assert level.trigger_lefts.tolist() == [90, 90, 270]
+        assert level.trigger_rights.tolist() == [150, 150, 330]
+
+    def test_trigger_cursor_moves_forward_and_reseeks(self):
+        engine = Engine(Mock(spec=Floor))
+        engine.set_objects_from_layout([{"type": "spike", "x": x, "y": 690} for x in range(30, 6000, 60)])
+
+        assert list(engine._get_trigger_window(3000, 3060)) == [49, 50, 51]
+        assert engine.trigger_cursor == 49
+
+        assert list(engine._get_trigger_window(3010, 3070)) == [50, 51]
+        assert engine.trigger_cursor == 50
+
+        # Cofnięcie gracza (np. reset) - kursor wyszukiwany binarnie
+        assert list(engine._get_trigger_window(0, 60)) == [0, 1]
+        assert engine.trigger_cursor == 0
+
+    def test_long_block_run_collision(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout([{"type": "block", "x": x, "y": 690} for x in range(630, 60630, 60)])
+
+        assert len(engine.compiled_level.block_spans) == 1
+
+        state = engine.create_state()
+        game_over = False
+        for _ in range(config.PHYSICS_TICK_RATE):
+            game_over = engine.step(state, False)
+            if game_over: break
+
+        assert game_over
+        assert state.x < 600
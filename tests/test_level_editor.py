@@ -0,0 +1,111 @@
+import pytest
+import pygame
+
+from game.level_editor import LevelEditor
+from game.floor import Floor
+from game.level_store import LevelStore
+
+from config import config
+
+class TestLevelEditorCulling:
+    @pytest.fixture
+    def editor(self):
+        pygame.init()
+        window = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        editor = LevelEditor(window, [], Floor(config.FLOOR_Y))
+        editor.current_level["layout"] = [{"type": "block", "x": 30 + i * 60, "y": 690} for i in range(1000)]
+
+        return editor
+
+    def test_visible_indices_follow_camera(self, editor):
+        assert editor.get_visible_object_indices() == list(range(28))
+
+        editor.camera_offset_x = -3000
+        visible = editor.get_visible_object_indices()
+
+        assert visible == list(range(48, 78))
+        for index in visible:
+            screen_x = editor.current_level["layout"][index]["x"] + editor.camera_offset_x
+            assert -config.RENDER_MARGIN < screen_x < config.SCREEN_WIDTH + config.RENDER_MARGIN
+
+    def test_visible_indices_keep_layout_order(self, editor):
+        editor.current_level["layout"] = [
+            {"type": "block", "x": 330, "y": 690},
+            {"type": "spike", "x": 90, "y": 690},
+            {"type": "block", "x": 5000, "y": 690},
+            {"type": "jump_orb", "x": 210, "y": 510}
+        ]
+
+        assert editor.get_visible_object_indices() == [0, 1, 3]
+
+    def test_index_rebuilt_after_delete(self, editor, monkeypatch):
+        monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (30, 690))
+        editor.delete_object()
+
+        assert len(editor.layout_index_order) == 999
+        assert editor.layout_index_xs[0] == 90
+
+    def test_index_updated_incrementally(self, editor, monkeypatch):
+        editor.get_visible_object_indices()
+        monkeypatch.setattr(editor, "rebuild_layout_index", lambda: pytest.fail("indeks przebudowany od nowa"))
+
+        steps = [("add", (90, 630)), ("delete", (30, 690)), ("add", (1530, 570)),
+                 ("add", (90, 570)), ("delete", (90, 630)), ("delete", (1530, 570))]
+        for action, position in steps:
+            monkeypatch.setattr(pygame.mouse, "get_pos", lambda: position)
+            if action == "add":
+                editor.add_object("block", position)
+            else:
+                editor.delete_object()
+
+        monkeypatch.undo()
+        layout = editor.current_level["layout"]
+        order = sorted(range(len(layout)), key=lambda index: layout[index]["x"])
+
+        assert editor.layout_index_order == order
+        assert editor.layout_index_xs == [layout[index]["x"] for index in order]
+
+class TestLevelEditorSolverCheck:
+    @pytest.fixture
+    def editor(self, tmp_path):
+        pygame.init()
+        window = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        editor = LevelEditor(window, [], Floor(config.FLOOR_Y), LevelStore(str(tmp_path)))
+        editor.current_level["layout"] = [{"type": "spike", "x": 450, "y": 690}]
+
+        return editor
+
+    def test_check_runs_in_background(self, editor):
+        editor.save_levels()
+
+        assert editor.is_finishable is None
+        assert editor.finishable_label.text == "Finishable: checking..."
+
+        result = editor.collect_solver_check(wait=True)
+
+        assert result.finishable
+        assert editor.is_finishable
+        assert editor.finishable_label.text == "Finishable: yes"
+
+    def test_save_during_check_restarts_it(self, editor):
+        editor.save_levels()
+
+        # Zmiana nazwy - układ zapisywany jest w całości, a nie przez dziennik
+        editor.current_level["layout"] = [{"type": "block", "x": 630, "y": y} for y in range(30, 720, 60)]
+        editor.current_level["name"] = "Wall"
+        editor.save_levels()
+
+        result = editor.collect_solver_check(wait=True)
+
+        assert result.finishable is False
+        assert editor.finishable_label.text == "Finishable: NO"
+
+    def test_result_is_dropped_after_loading_level(self, editor):
+        editor.save_levels()
+        editor.load_level(1)
+
+        assert editor.collect_solver_check(wait=True) is None
+        assert editor.is_finishable is None
+        assert editor.finishable_label.text == ""
@@ -0,0 +1,211 @@
+import pickle, time
+
+import pytest
+import pygame
+
+from game.floor import Floor
+from game.level_editor import LevelEditor
+from game.level_journal import LevelJournal
+from game.level_store import LevelStore, layout_hash
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 690, "y": 690},
+    {"type": "spike", "x": 450, "y": 690},
+    {"type": "jump_orb", "x": 930, "y": 510}
+]
+
+EDITS = [
+    {"op": "add", "object": {"type": "jump_pad", "x": 1230, "y": 690}},
+    {"op": "delete", "index": 0},
+    {"op": "delete", "index": 1},
+    {"op": "add", "object": {"type": "jump_orb", "x": 990, "y": 450}}
+]
+
+EDITED_LAYOUT = [
+    {"type": "spike", "x": 450, "y": 690},
+    {"type": "jump_pad", "x": 1230, "y": 690},
+    {"type": "jump_orb", "x": 990, "y": 450}
+]
+
+class TestLevelJournal:
+    def test_append_and_read(self, tmp_path):
+        journal = LevelJournal(str(tmp_path / "level_1.journal"))
+
+        journal.append("abc", EDITS[:1])
+        journal.append("ignored", EDITS[1:])
+
+        assert journal.read() == ("abc", EDITS)
+
+    def test_truncated_last_line_is_skipped(self, tmp_path):
+        journal = LevelJournal(str(tmp_path / "level_1.journal"))
+        journal.append("abc", EDITS)
+
+        with open(journal.path, "a") as journal_file:
+            journal_file.write('{"op": "add", "obj')
+
+        assert journal.read() == ("abc", EDITS)
+
+    def test_append_after_truncated_line(self, tmp_path):
+        journal = LevelJournal(str(tmp_path / "level_1.journal"))
+        journal.append("abc", EDITS[:1])
+
+        with open(journal.path, "a") as journal_file:
+            journal_file.write('{"op": "add", "obj')
+
+        journal.append("ignored", EDITS[1:])
+
+        assert journal.read() == ("abc", EDITS)
+
+    def test_append_after_truncated_header(self, tmp_path):
+        journal = LevelJournal(str(tmp_path / "level_1.journal"))
+
+        with open(journal.path, "w") as journal_file:
+            journal_file.write('{"base": "ab')
+
+        journal.append("abc", EDITS)
+
+        assert journal.read() == ("abc", EDITS)
+
+    def test_apply_edits(self):
+        assert LevelJournal.apply_edits([dict(obj) for obj in LAYOUT], EDITS) == EDITED_LAYOUT
+
+    def test_invalid_edit(self, tmp_path):
+        with pytest.raises(ValueError, match="Zmiana w dzienniku"):
+            LevelJournal(str(tmp_path / "level_1.journal")).append("abc", [{"op": "resize"}])
+
+    def test_move_is_not_an_edit(self, tmp_path):
+        # Edytor przesuwa obiekt przez usunięcie i dodanie - dziennik nie zna osobnej operacji przesunięcia
+        with pytest.raises(ValueError, match="Zmiana w dzienniku"):
+            LevelJournal(str(tmp_path / "level_1.journal")).append("abc", [{"op": "move", "index": 0, "x": 0, "y": 0}])
+
+class TestLevelStoreJournal:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LevelStore(str(tmp_path))
+
+    @pytest.fixture
+    def entry(self, store):
+        return store.save_level({"index": "1", "name": "One", "difficulty": "easy", "layout": LAYOUT})
+
+    def test_edits_are_applied_on_load_without_rewriting_level(self, store, entry, tmp_path):
+        level_mtime = (tmp_path / "level_1.json").stat().st_mtime_ns
+        manifest_mtime = (tmp_path / "manifest.json").stat().st_mtime_ns
+
+        store.append_edits(entry, EDITS)
+
+        assert store.get_layout(entry) == EDITED_LAYOUT
+        assert store.has_pending_edits(entry)
+        assert (tmp_path / "level_1.json").stat().st_mtime_ns == level_mtime
+        assert (tmp_path / "manifest.json").stat().st_mtime_ns == manifest_mtime
+
+    def test_compact(self, store, entry, tmp_path):
+        store.append_edits(entry, EDITS)
+
+        compacted = store.compact(entry)
+
+        assert compacted["hash"] == layout_hash(EDITED_LAYOUT).hex()
+        assert compacted["object_count"] == 3
+        assert store.load() == [compacted]
+        assert not store.has_pending_edits(compacted)
+        assert store.get_layout(compacted) == EDITED_LAYOUT
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # Kolejne zmiany dopisywane są do dziennika względem nowego układu
+        store.append_edits(entry, [{"op": "delete", "index": 0}])
+        assert store.get_layout(compacted) == EDITED_LAYOUT[1:]
+
+    def test_stale_journal_is_ignored(self, store, entry):
+        store.append_edits(entry, EDITS)
+        journal = store.get_journal(entry)
+
+        # Przerwane kompaktowanie: plik poziomu już zawiera zmiany, a dziennik nie został zastąpiony
+        store._write_file(journal.path.replace(".journal", ".json"), store._dump_layout(EDITED_LAYOUT))
+
+        assert store.get_layout(entry) == EDITED_LAYOUT
+
+    def test_snapshot_is_not_affected_by_compaction(self, store, entry):
+        store.append_edits(entry, EDITS)
+        snapshot = pickle.loads(pickle.dumps(store.read_snapshot(entry)))
+
+        # Kompaktowanie podmienia plik poziomu i dziennik - migawka sprzed niego wciąż daje ten sam układ
+        compacted = store.compact(entry)
+        store.append_edits(compacted, [{"op": "delete", "index": 0}])
+
+        assert LevelStore.layout_from_snapshot(snapshot) == EDITED_LAYOUT
+        assert store.get_layout(compacted) == EDITED_LAYOUT[1:]
+
+    def test_edits_survive_torn_append(self, store, entry):
+        store.append_edits(entry, [{"op": "add", "object": {"type": "block", "x": 1290, "y": 690}}])
+
+        with open(store.get_journal(entry).path, "a") as journal_file:
+            journal_file.write('{"op": "add", "obj')
+
+        store.append_edits(entry, [{"op": "add", "object": {"type": "block", "x": 1350, "y": 690}}])
+
+        assert len(store.get_layout(entry)) == len(LAYOUT) + 2
+
+    def test_full_save_removes_journal(self, store, entry):
+        store.append_edits(entry, EDITS)
+
+        store.save_level({**entry, "layout": LAYOUT[:1]})
+
+        assert not store.get_journal(entry).exists()
+        assert store.get_layout(entry) == LAYOUT[:1]
+
+class TestLevelEditorJournal:
+    @pytest.fixture
+    def editor(self, tmp_path, monkeypatch):
+        # Sprawdzanie solverem w tle po zapisie nie rozstrzygnie tak długiego poziomu - krótki budżet nie obciąża reszty testów
+        monkeypatch.setattr(config, "SOLVER_TIME_BUDGET", 0.5)
+        pygame.init()
+        window = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        store = LevelStore(str(tmp_path))
+        layout = [{"type": "block", "x": 30 + i * 60, "y": 390} for i in range(50000)]
+        levels = [store.save_level({"index": "1", "name": "Long", "difficulty": "hard", "layout": layout})]
+
+        editor = LevelEditor(window, levels, Floor(config.FLOOR_Y), store)
+        editor.load_level(1)
+
+        return editor
+
+    def test_saving_one_object_appends_to_journal(self, editor, monkeypatch, tmp_path):
+        monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (90, 390))
+        level_mtime = (tmp_path / "level_1.json").stat().st_mtime_ns
+
+        editor.delete_object()
+
+        start = time.perf_counter()
+        editor.save_levels()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.1
+        assert (tmp_path / "level_1.json").stat().st_mtime_ns == level_mtime
+        assert editor.level_store.get_journal(editor.levels[0]).read()[1] == [{"op": "delete", "index": 1}]
+
+    def test_commit_level_compacts_journal(self, editor, monkeypatch):
+        monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (90, 390))
+        editor.delete_object()
+        editor.save_levels()
+
+        entry = editor.commit_level("1")
+
+        assert entry is editor.levels[0]
+        assert entry["object_count"] == 49999
+        assert entry["hash"] == layout_hash(editor.current_level["layout"]).hex()
+        assert not editor.level_store.has_pending_edits(entry)
+
+    def test_background_compaction(self, editor, monkeypatch):
+        monkeypatch.setattr(config, "JOURNAL_COMPACT_EDITS", 1)
+        monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (90, 390))
+        editor.delete_object()
+        editor.save_levels()
+
+        assert editor.compaction is not None
+        editor.collect_compaction(wait=True)
+
+        assert editor.compaction is None
+        assert editor.levels[0]["object_count"] == 49999
+        assert editor.level_store.load() == editor.levels
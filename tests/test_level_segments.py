@@ -0,0 +1,118 @@
+import pytest
+
+from game.engine import Engine
+from game.floor import Floor
+from game.level_segments import SegmentedLevel, write_segmented_level, open_segmented_level, segmented_path
+from game.level_store import LevelStore, layout_hash
+
+from config import config
+
+SEGMENT_WIDTH = 600
+
+# Długi poziom: kolce co 300 jednostek na 60 segmentach, ostatni kolec daleko za startem
+LAYOUT = [{"type": "spike", "x": x, "y": 690} for x in range(36000, 600, -300)]
+
+class TestLevelSegments:
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = str(tmp_path / "level.gds")
+        write_segmented_level(path, LAYOUT, SEGMENT_WIDTH)
+        return path
+
+    def test_index_splits_objects_by_x(self, path):
+        with SegmentedLevel(path) as level:
+            assert len(level) == len(LAYOUT)
+            assert level.segment_count == 36000 // SEGMENT_WIDTH + 1
+            assert level.level_hash == layout_hash(LAYOUT)
+            assert level.end_x == 36000
+
+            objects = [obj for segment in range(level.segment_count) for obj in level.iter_segment(segment)]
+            assert objects == sorted((obj["type"], obj["x"], obj["y"]) for obj in LAYOUT)
+
+            for segment in range(level.segment_count):
+                assert all(level.segment_at(x) == segment for _, x, _ in level.iter_segment(segment))
+
+    def test_segment_at_is_clamped(self, path):
+        with SegmentedLevel(path) as level:
+            assert level.segment_at(-100) == 0
+            assert level.segment_at(10 ** 9) == level.segment_count - 1
+
+    def test_rejects_invalid_files(self, tmp_path, path):
+        invalid = tmp_path / "invalid.gds"
+        invalid.write_bytes(b"not a level file")
+        with pytest.raises(ValueError, match="To nie jest plik poziomu z segmentami"):
+            SegmentedLevel(str(invalid))
+
+        with open(path, "rb") as level_file:
+            invalid.write_bytes(level_file.read()[:-1])
+        with pytest.raises(ValueError, match="Uszkodzony plik poziomu z segmentami"):
+            SegmentedLevel(str(invalid))
+
+    def test_engine_keeps_only_nearby_segments(self, path, monkeypatch):
+        monkeypatch.setattr(config, "STREAM_SEGMENTS_AHEAD", 2)
+        monkeypatch.setattr(config, "STREAM_SEGMENTS_BEHIND", 1)
+
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_segments(SegmentedLevel(path))
+        state = engine.create_state()
+
+        for x in range(0, 36000, 250):
+            state.x = x
+            engine.step(state, False)
+
+            segment = engine.segmented_level.segment_at(state.x)
+            assert engine.loaded_segments.start >= segment - 1
+            assert engine.loaded_segments.stop <= segment + 3
+            assert len(engine.objects) <= 4 * SEGMENT_WIDTH // 300
+
+        assert engine.get_furthest_object_x() == 36000 + config.END_WALL_X
+
+    def test_step_matches_full_level(self, tmp_path):
+        # Bloki nad graczem w każdym segmencie i kolec daleko za startem - gracz przechodzi przez kilkanaście segmentów
+        layout = [{"type": "block", "x": x, "y": 390} for x in range(900, 9000, 450)] + [{"type": "spike", "x": 9000, "y": 690}]
+        path = str(tmp_path / "long.gds")
+        write_segmented_level(path, layout, SEGMENT_WIDTH)
+
+        full = Engine(Floor(config.FLOOR_Y))
+        full.set_objects_from_layout(layout)
+
+        streamed = Engine(Floor(config.FLOOR_Y))
+        streamed.set_objects_from_segments(SegmentedLevel(path))
+
+        full_state = full.create_state()
+        streamed_state = streamed.create_state()
+
+        for _ in range(config.PHYSICS_TICK_RATE * 20):
+            full_died = full.step(full_state, False)
+            streamed_died = streamed.step(streamed_state, False)
+
+            assert full_died == streamed_died
+            assert (streamed_state.x, streamed_state.y, streamed_state.velocity_y) == (full_state.x, full_state.y, full_state.velocity_y)
+            if full_died:
+                break
+
+        assert full_died
+        assert streamed_state.x > 8000
+
+    def test_switching_level_closes_segments(self, path):
+        engine = Engine(Floor(config.FLOOR_Y))
+        level = SegmentedLevel(path)
+        engine.set_objects_from_segments(level)
+
+        engine.set_objects_from_layout(LAYOUT[:3])
+
+        assert engine.segmented_level is None
+        assert level.map.closed
+        assert len(engine.objects) == 3
+
+    def test_store_staleness(self, tmp_path):
+        store = LevelStore(str(tmp_path))
+        entry = store.save_level({"index": "1", "name": "One", "difficulty": "easy", "layout": LAYOUT})
+
+        write_segmented_level(segmented_path(store, entry), LAYOUT, SEGMENT_WIDTH)
+        level = open_segmented_level(store, entry)
+        assert level is not None
+        level.close()
+
+        changed = store.save_level({**entry, "layout": LAYOUT[:2]})
+        assert open_segmented_level(store, changed) is None
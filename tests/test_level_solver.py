@@ -0,0 +1,113 @@
+import pytest
+
+from game.level_solver import LevelSolver, solve_level, solve_levels
+
+from config import config
+
+SPIKES = [
+    {"type": "spike", "x": 450, "y": 690},
+    {"type": "spike", "x": 870, "y": 690}
+]
+
+class TestLevelSolver:
+    def test_empty_level_is_finishable(self):
+        result = LevelSolver([]).solve()
+
+        assert result.finishable
+        assert not any(result.inputs)
+
+    def test_spike_requires_jump(self):
+        layout = [{"type": "spike", "x": 450, "y": 690}]
+        solver = LevelSolver(layout)
+
+        result = solver.solve()
+
+        assert result.finishable
+        assert any(result.inputs)
+        assert solver.verify(result.inputs)
+        assert not solver.verify([False] * len(result.inputs))
+
+    def test_wall_is_not_finishable(self):
+        layout = [{"type": "block", "x": 630, "y": y} for y in range(30, 720, 60)]
+
+        result = LevelSolver(layout).solve()
+
+        assert result.finishable is False
+        assert result.inputs == []
+
+    def test_long_level_scales_with_length(self):
+        # Ten sam fragment powtórzony 20 razy - liczba przebadanych stanów rośnie liniowo z długością
+        short = LevelSolver(SPIKES).solve()
+        layout = [{**obj, "x": obj["x"] + offset} for offset in range(0, 20 * 840, 840) for obj in SPIKES]
+        solver = LevelSolver(layout)
+
+        result = solver.solve()
+
+        assert result.finishable
+        assert solver.verify(result.inputs)
+        assert result.explored < 20 * short.explored * 2
+
+    def test_jump_branch_kept_when_landing_inside_window(self):
+        solver = LevelSolver([])
+
+        # Gracz był w powietrzu przez całe poprzednie okno i ląduje w pierwszym kroku następnego
+        floor_y = config.FLOOR_Y - config.PLAYER_OUTER_SIZE // 2
+        packed = (300.0, floor_y - 1.0, 600.0, False)
+
+        children, inputs, branches = solver._expand(packed, None, set())
+
+        assert inputs is None
+        assert branches == 2
+        assert [path[1] for _, path in children] == [False, True]
+
+    def test_jump_branch_pruned_while_airborne(self):
+        solver = LevelSolver([])
+
+        children, _, branches = solver._expand((300.0, 300.0, -600.0, False), None, set())
+
+        assert branches == 1
+        assert len(children) == 1
+
+    def test_exhausted_budget_is_undecided(self):
+        layout = [{"type": "block", "x": 630, "y": y} for y in range(30, 720, 60)]
+
+        result = LevelSolver(layout, max_states=10).solve()
+
+        assert result.finishable is None
+        assert result.inputs == []
+
+    def test_invalid_budget(self):
+        with pytest.raises(AssertionError, match="time_budget musi być liczbą dodatnią"):
+            LevelSolver([], time_budget=0)
+
+class TestSolveLevels:
+    def test_process_pool_finds_same_answer(self):
+        layouts = [SPIKES, [{"type": "block", "x": 630, "y": y} for y in range(30, 720, 60)]]
+
+        results = solve_levels(layouts, workers=2)
+
+        assert [result.finishable for result in results] == [True, False]
+        assert LevelSolver(SPIKES).verify(results[0].inputs)
+
+    def test_single_level_split_between_workers(self):
+        layout = [{**obj, "x": obj["x"] + offset} for offset in range(0, 5 * 840, 840) for obj in SPIKES]
+
+        result = solve_level(layout, workers=2)
+
+        assert result.finishable
+        assert LevelSolver(layout).verify(result.inputs)
+
+    def test_split_level_wall_is_not_finishable(self):
+        layout = [{"type": "block", "x": 1230, "y": y} for y in range(30, 720, 60)]
+
+        seeds, seed_result = LevelSolver(layout).seed(8)
+        assert len(seeds) >= 8 and seed_result.finishable is None
+
+        result = solve_levels([layout], workers=2)[0]
+
+        assert result.finishable is False
+        assert result.explored > seed_result.explored
+
+    def test_invalid_workers(self):
+        with pytest.raises(AssertionError, match="workers musi być dodatnią liczbą całkowitą"):
+            solve_levels([], workers=0)
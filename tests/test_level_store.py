@@ -0,0 +1,61 @@
+import json
+import pytest
+
+from game.level_store import LevelStore, layout_hash, load_full_levels
+
+LEVELS = [
+    {"index": "1", "name": "One", "difficulty": "easy", "layout": [{"type": "block", "x": 690, "y": 690}]},
+    {"index": "2", "name": "Two", "difficulty": "hard", "layout": [{"type": "spike", "x": 450, "y": 690}, {"type": "jump_orb", "x": 930, "y": 510}]}
+]
+
+class TestLevelStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        with open(tmp_path / "levels.json", "w") as legacy_file:
+            json.dump(LEVELS, legacy_file)
+
+        return LevelStore(str(tmp_path))
+
+    def test_migrates_legacy_file(self, store, tmp_path):
+        entries = store.load()
+
+        assert [entry["name"] for entry in entries] == ["One", "Two"]
+        assert entries[1]["object_count"] == 2
+        assert entries[1]["hash"] == layout_hash(LEVELS[1]["layout"]).hex()
+        assert "layout" not in entries[1]
+        assert (tmp_path / "manifest.json").exists()
+
+    def test_layout_is_loaded_only_on_request(self, store):
+        entries = store.load()
+
+        assert store.get_layout(entries[1]) == LEVELS[1]["layout"]
+
+    def test_save_rewrites_only_saved_level(self, store, tmp_path):
+        entries = store.load()
+        untouched = (tmp_path / "level_1.json").stat().st_mtime_ns
+
+        level = {**entries[1], "layout": LEVELS[1]["layout"] + [{"type": "block", "x": 1230, "y": 690}]}
+        entry = store.save_level(level, entries)
+
+        assert entry["object_count"] == 3
+        assert (tmp_path / "level_1.json").stat().st_mtime_ns == untouched
+        assert store.load()[1] == entry
+        assert store.get_layout(entry) == level["layout"]
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_save_new_level(self, store):
+        entries = store.load()
+
+        store.save_level({"index": "3", "name": "Three", "difficulty": "normal", "layout": []}, entries)
+
+        assert [entry["index"] for entry in store.load()] == ["1", "2", "3"]
+
+    def test_load_full_levels(self, store, tmp_path):
+        store.load()
+
+        assert [level["layout"] for level in load_full_levels(str(tmp_path))] == [level["layout"] for level in LEVELS]
+        assert load_full_levels(str(tmp_path / "levels.json")) == LEVELS
+
+    def test_invalid_level(self, store):
+        with pytest.raises(ValueError, match="level musi być słownikiem"):
+            store.save_level({"index": "1"})
@@ -0,0 +1,173 @@
+import pytest
+import time
+
+from unittest.mock import patch
+
+from game.engine import Engine
+from game.floor import Floor
+from game.game_manager import GameManager
+from game.player import Player
+from game.replay import Replay, ReplayRecorder, layout_hash, play_replay, play_replays, BATCH_REPLAY_MIN, HEADER_SIZE
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 630, "y": 690},
+    {"type": "spike", "x": 930, "y": 690},
+    {"type": "jump_orb", "x": 1530, "y": 510},
+    {"type": "block", "x": 30030, "y": 690}
+]
+
+class TestReplay:
+    @pytest.fixture
+    def engine(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(LAYOUT)
+        return engine
+
+    @staticmethod
+    def _record(inputs):
+        recorder = ReplayRecorder(layout_hash(LAYOUT))
+        for jump_pressed in inputs:
+            recorder.record(jump_pressed)
+        return recorder.replay
+
+    def test_layout_hash_ignores_key_order(self):
+        reordered = [{"y": obj["y"], "x": obj["x"], "type": obj["type"]} for obj in LAYOUT]
+
+        assert layout_hash(reordered) == layout_hash(LAYOUT)
+        assert layout_hash(LAYOUT[:-1]) != layout_hash(LAYOUT)
+
+    def test_recorder_stores_runs(self):
+        replay = self._record([True, True, False, False, False, True])
+
+        assert replay.first_input is True
+        assert replay.runs == [2, 3, 1]
+        assert list(replay.inputs()) == [True, True, False, False, False, True]
+
+    def test_bytes_round_trip(self):
+        inputs = [tick % 300 < 7 for tick in range(60 * config.PHYSICS_TICK_RATE)]
+        replay = self._record(inputs)
+
+        loaded = Replay.from_bytes(replay.to_bytes())
+
+        assert loaded.level_hash == replay.level_hash
+        assert loaded.tick_rate == config.PHYSICS_TICK_RATE
+        assert list(loaded.inputs()) == inputs
+
+    def test_long_holds_are_compact(self):
+        replay = self._record([False] * 100000 + [True] * 100000)
+
+        assert len(replay.to_bytes()) - HEADER_SIZE == 6
+
+    def test_save_and_load(self, tmp_path):
+        replay = self._record([False, True, True])
+        path = tmp_path / "replays" / "attempt.gdr"
+
+        replay.save(str(path))
+
+        assert list(Replay.load(str(path)).inputs()) == [False, True, True]
+
+    def test_rejects_invalid_data(self):
+        with pytest.raises(ValueError, match="To nie jest plik powtórki"):
+            Replay.from_bytes(b"not a replay")
+
+        data = self._record([True] * 200).to_bytes()
+        with pytest.raises(ValueError, match="Uszkodzony plik powtórki"):
+            Replay.from_bytes(data[:-1])
+
+    def test_playback_matches_engine_step(self, engine):
+        inputs = [tick % 97 < 5 for tick in range(4000)]
+
+        state = engine.create_state()
+        expected_ticks = 0
+        for jump_pressed in inputs:
+            expected_ticks += 1
+            if engine.step(state, jump_pressed):
+                break
+
+        result = play_replay(self._record(inputs), LAYOUT)
+
+        assert result.ticks == expected_ticks
+        assert result.died
+        assert result.state.x == state.x and result.state.y == state.y
+
+    def test_playback_rejects_other_level(self):
+        with pytest.raises(ValueError, match="innej wersji poziomu"):
+            play_replay(self._record([False]), LAYOUT[:-1])
+
+    def test_sixty_seconds_replay_faster_than_real_time(self):
+        layout = [{"type": "block", "x": 60000, "y": 390}]
+        recorder = ReplayRecorder(layout_hash(layout))
+        for tick in range(60 * config.PHYSICS_TICK_RATE):
+            recorder.record(tick % 120 == 0)
+
+        start = time.perf_counter()
+        result = play_replay(recorder.replay, layout)
+        elapsed = time.perf_counter() - start
+
+        assert result.ticks == 60 * config.PHYSICS_TICK_RATE
+        assert elapsed < 6.0
+
+    def test_batched_playback_matches_single_playback(self):
+        layout = [
+            {"type": "spike", "x": 930, "y": 690},
+            {"type": "jump_orb", "x": 1230, "y": 510},
+            {"type": "block", "x": 2430, "y": 390}
+        ]
+        recorder_inputs = [[tick % period < 3 for tick in range(2000)] for period in range(10, 10 + BATCH_REPLAY_MIN)]
+        # Nagranie urwane przed końcem poziomu i puste nagranie
+        recorder_inputs += [[False] * 40, []]
+
+        replays = []
+        for inputs in recorder_inputs:
+            recorder = ReplayRecorder(layout_hash(layout))
+            for jump_pressed in inputs:
+                recorder.record(jump_pressed)
+            replays.append(recorder.replay)
+
+        batched = play_replays(replays, layout)
+        single = [play_replay(replay, layout) for replay in replays]
+
+        assert {(result.finished, result.died) for result in single} == {(True, False), (False, True), (False, False)}
+        for batched_result, single_result in zip(batched, single):
+            assert (batched_result.finished, batched_result.died, batched_result.ticks) == \
+                   (single_result.finished, single_result.died, single_result.ticks)
+            assert batched_result.state.x == single_result.state.x
+            assert batched_result.state.y == single_result.state.y
+
+    def test_game_manager_records_each_physics_tick(self):
+        game_manager = GameManager()
+        game_manager.floor = Floor(config.FLOOR_Y)
+        game_manager.player = Player()
+        game_manager.engine = Engine(game_manager.floor)
+        game_manager.engine.set_objects_from_layout(LAYOUT)
+        game_manager.level_hash = layout_hash(LAYOUT)
+        game_manager.reset_physics()
+
+        game_manager._update_physics(1 / 30, False)
+        game_manager._update_physics(1 / 30, True)
+
+        replay = game_manager.replay_recorder.replay
+        ticks_per_frame = round(config.PHYSICS_TICK_RATE / 30)
+
+        assert list(replay.inputs()) == [False] * ticks_per_frame + [True] * ticks_per_frame
+
+        result = play_replay(replay, LAYOUT)
+        assert result.state.x == game_manager.physics_state.x
+
+    def test_game_manager_saves_replay_on_death(self, tmp_path):
+        game_manager = GameManager()
+        game_manager.floor = Floor(config.FLOOR_Y)
+        game_manager.player = Player()
+        game_manager.engine = Engine(game_manager.floor)
+        game_manager.engine.set_objects_from_layout(LAYOUT)
+        game_manager.level_hash = layout_hash(LAYOUT)
+        game_manager.reset_physics()
+
+        path = tmp_path / "last_attempt.gdr"
+        with patch('config.config.REPLAY_PATH', str(path)):
+            for _ in range(120):
+                game_manager._update_physics(1 / 60, False)
+
+        assert play_replay(Replay.load(str(path)), LAYOUT).died
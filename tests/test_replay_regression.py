@@ -0,0 +1,76 @@
+import pytest
+
+import game.replay, game.replay_regression
+
+from game.replay import ReplayRecorder, layout_hash
+from game.replay_regression import collect_replays, run_replays, compare_outcomes, save_baseline, load_baseline
+
+from config import config
+
+LEVELS = [
+    {"index": "1", "name": "Spike", "layout": [{"type": "spike", "x": 930, "y": 690}]},
+    {"index": "2", "name": "Flat", "layout": [{"type": "block", "x": 630, "y": 390}]}
+]
+
+class TestReplayRegression:
+    @pytest.fixture
+    def replay_dir(self, tmp_path):
+        for level in LEVELS:
+            for jump_every in (0, 50, 90):
+                recorder = ReplayRecorder(layout_hash(level["layout"]))
+                for tick in range(3 * config.PHYSICS_TICK_RATE):
+                    recorder.record(jump_every > 0 and tick % jump_every == 0)
+
+                recorder.replay.save(str(tmp_path / f"level{level['index']}" / f"jump{jump_every}.gdr"))
+
+        return tmp_path
+
+    def test_collects_replays_recursively(self, replay_dir):
+        assert len(collect_replays(str(replay_dir))) == 6
+
+    def test_outcomes(self, replay_dir):
+        outcomes = run_replays(str(replay_dir), LEVELS, workers=1)
+
+        assert outcomes["level1/jump0.gdr"]["died"]
+        assert outcomes["level2/jump0.gdr"]["finished"]
+        assert outcomes["level2/jump0.gdr"]["level"] == "2"
+
+    def test_layout_hashed_once_per_level(self, replay_dir, monkeypatch):
+        calls = []
+        def counting_hash(layout):
+            calls.append(layout)
+            return layout_hash(layout)
+
+        monkeypatch.setattr(game.replay, "layout_hash", counting_hash)
+        monkeypatch.setattr(game.replay_regression, "layout_hash", counting_hash)
+
+        run_replays(str(replay_dir), LEVELS, workers=1)
+
+        assert len(calls) == len(LEVELS)
+
+    def test_parallel_matches_serial(self, replay_dir):
+        assert run_replays(str(replay_dir), LEVELS, workers=2) == run_replays(str(replay_dir), LEVELS, workers=1)
+
+    def test_unchanged_run_has_no_differences(self, replay_dir, tmp_path):
+        baseline_path = str(tmp_path / "baseline.json")
+        save_baseline(baseline_path, run_replays(str(replay_dir), LEVELS, workers=1))
+
+        assert compare_outcomes(load_baseline(baseline_path), run_replays(str(replay_dir), LEVELS, workers=1)) == []
+
+    def test_reports_changed_outcome(self, replay_dir):
+        baseline = run_replays(str(replay_dir), LEVELS, workers=1)
+
+        outcomes = run_replays(str(replay_dir), LEVELS, workers=1)
+        outcomes["level1/jump0.gdr"] = {**outcomes["level1/jump0.gdr"], "x": 1.0}
+        del outcomes["level2/jump50.gdr"]
+
+        differences = compare_outcomes(baseline, outcomes)
+
+        assert len(differences) == 2
+        assert differences[0].startswith("level1/jump0.gdr: x ")
+        assert differences[1] == "level2/jump50.gdr: brak powtórki"
+
+    def test_unknown_level(self, replay_dir):
+        outcomes = run_replays(str(replay_dir), LEVELS[:1], workers=1)
+
+        assert outcomes["level2/jump0.gdr"] == {"error": "nieznany poziom"}
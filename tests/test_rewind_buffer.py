@@ -0,0 +1,134 @@
+import pytest
+
+from unittest.mock import patch
+
+from game.engine import Engine
+from game.floor import Floor
+from game.game_manager import GameManager
+from game.level_store import layout_hash
+from game.player import Player
+from game.rewind_buffer import RewindBuffer
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 630, "y": 390},
+    {"type": "jump_orb", "x": 1530, "y": 510}
+]
+
+class TestRewindBuffer:
+    @pytest.fixture
+    def engine(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(LAYOUT)
+        return engine
+
+    @pytest.fixture
+    def game_manager(self):
+        game_manager = GameManager()
+        game_manager.floor = Floor(config.FLOOR_Y)
+        game_manager.player = Player()
+        game_manager.engine = Engine(game_manager.floor)
+        game_manager.engine.set_objects_from_layout(LAYOUT)
+        game_manager.reset_physics()
+        return game_manager
+
+    def test_restores_any_recent_tick(self, engine):
+        buffer = RewindBuffer(500)
+        state = engine.create_state()
+
+        history = []
+        for tick in range(300):
+            engine.step(state, tick % 70 == 0)
+            buffer.push(engine, state)
+            history.append((state.x, state.y, state.velocity_y, state.on_ground, engine.camera_offset_x, engine.trigger_cursor))
+
+        for ticks_back in (0, 1, 150, 299):
+            buffer.restore(engine, state, ticks_back)
+            assert (state.x, state.y, state.velocity_y, state.on_ground, engine.camera_offset_x, engine.trigger_cursor) == history[-1 - ticks_back]
+
+    def test_capacity_is_fixed(self, engine):
+        buffer = RewindBuffer(100)
+        size = buffer.nbytes
+        state = engine.create_state()
+
+        for _ in range(1000):
+            engine.step(state, False)
+            buffer.push(engine, state)
+
+        assert len(buffer) == 100
+        assert buffer.nbytes == size == len(buffer.data) * buffer.data.itemsize
+
+        buffer.restore(engine, state, 0)
+        newest_x = state.x
+        buffer.restore(engine, state, 99)
+        assert newest_x - state.x == pytest.approx(99 * config.PLAYER_SPEED * config.PHYSICS_TIMESTEP)
+
+        with pytest.raises(ValueError):
+            buffer.restore(engine, state, 100)
+
+    def test_truncate_drops_newest(self, engine):
+        buffer = RewindBuffer(10)
+        state = engine.create_state()
+
+        for _ in range(15):
+            engine.step(state, False)
+            buffer.push(engine, state)
+
+        buffer.restore(engine, state, 4)
+        x = state.x
+        buffer.truncate(4)
+
+        buffer.restore(engine, state, 0)
+        assert len(buffer) == 6
+        assert state.x == x
+
+    def test_rewind_and_resume(self, game_manager):
+        game_manager.practice_mode = True
+        for _ in range(60):
+            game_manager._update_physics(1 / 60, False)
+
+        x_before = game_manager.physics_state.x
+
+        game_manager._update_rewind(1 / 60, 1)
+        game_manager._update_rewind(1 / 60, 1)
+        game_manager._update_rewind(1 / 60, -1)
+
+        ticks_per_frame = round(config.PHYSICS_TICK_RATE / 60)
+        assert game_manager.rewind_offset == ticks_per_frame
+        assert game_manager.physics_state.x == pytest.approx(x_before - ticks_per_frame * config.PLAYER_SPEED * config.PHYSICS_TIMESTEP)
+        assert game_manager.player.x == game_manager.physics_state.x
+
+        rewound_x = game_manager.physics_state.x
+        with patch.object(game_manager, '_get_rewind_direction', return_value=0), \
+                patch.object(game_manager, '_is_jump_pressed', return_value=False), \
+                patch.object(game_manager, '_update_ui_elements'), \
+                patch.object(game_manager, '_check_level_completion'):
+            game_manager._update_game_state(1 / 60)
+
+        assert game_manager.rewind_offset == 0
+        assert game_manager.physics_state.x == pytest.approx(rewound_x + ticks_per_frame * config.PLAYER_SPEED * config.PHYSICS_TIMESTEP)
+
+    def test_rewind_stops_at_oldest_tick(self, game_manager):
+        for _ in range(10):
+            game_manager._update_physics(1 / 60, False)
+
+        game_manager._update_rewind(1.0, 1)
+
+        assert game_manager.rewind_offset == len(game_manager.rewind_buffer) - 1
+        assert game_manager.physics_state.x == config.PLAYER_RESET_X
+
+    def test_forward_without_rewind_keeps_playing(self, game_manager):
+        game_manager.practice_mode = True
+        game_manager.level_hash = layout_hash(LAYOUT)
+        game_manager.reset_physics()
+
+        with patch.object(game_manager, '_get_rewind_direction', return_value=-1), \
+                patch.object(game_manager, '_is_jump_pressed', return_value=False), \
+                patch.object(game_manager, '_update_ui_elements'), \
+                patch.object(game_manager, '_check_level_completion'):
+            game_manager._update_game_state(1 / 60)
+
+        assert game_manager.rewind_offset == 0
+        assert game_manager.physics_state.x > config.PLAYER_RESET_X
+        assert game_manager.replay_recorder is not None
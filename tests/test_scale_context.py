@@ -0,0 +1,85 @@
+import pytest
+import pygame
+
+from unittest.mock import patch
+
+from ui.scale_context import ScaleContext
+from ui.button import Button
+from ui.label import Label
+from ui.slider import Slider
+from game.player import Player
+
+from config import config
+
+class TestScaleContext:
+    def test_get_returns_shared_context(self):
+        assert ScaleContext.get((800, 450)) is ScaleContext.get((800, 450))
+        assert ScaleContext.get((800, 450)) is not ScaleContext.get((1600, 900))
+
+    def test_scaling_matches_widget_formula(self):
+        context = ScaleContext.get((1003, 611))
+
+        assert context.x(220) == int(1003 * (220 / config.SCREEN_WIDTH))
+        assert context.y(80) == int(611 * (80 / config.SCREEN_HEIGHT))
+        assert context.rect(800, 450, 220, 80).center == context.point(800, 450)
+
+    def test_invalid_size(self):
+        with pytest.raises(AssertionError, match="width musi być dodatnią liczbą całkowitą"):
+            ScaleContext(0, 900)
+
+class TestCachedGeometry:
+    def test_button_geometry_computed_once_per_size(self):
+        pygame.font.init()
+        button = Button(800, 450, 220, 80, "Play")
+        screen = pygame.Surface((800, 450))
+
+        with patch.object(Button, 'apply_scale', autospec=True, side_effect=Button.apply_scale) as apply_scale:
+            for _ in range(5):
+                button.draw(screen)
+
+        assert apply_scale.call_count == 1
+        assert button.rect.size == (110, 40)
+
+    def test_pushed_context_is_used_by_draw(self):
+        pygame.font.init()
+        label = Label(800, 450, "Attempt 1")
+        label.apply_scale(ScaleContext.get((800, 450)))
+
+        with patch.object(Label, 'apply_scale') as apply_scale:
+            label.draw(pygame.Surface((800, 450)))
+
+        apply_scale.assert_not_called()
+        assert (label.rel_x, label.rel_y) == (400, 225)
+
+    def test_label_set_position_uses_cached_context(self):
+        label = Label(800, 450, "Attempt 1")
+        label.apply_scale(ScaleContext.get((800, 450)))
+
+        label.set_position(400, 450)
+
+        assert (label.rel_x, label.rel_y) == (200, 225)
+
+    def test_player_moves_without_rescaling(self):
+        player = Player()
+        screen = pygame.Surface((800, 450))
+
+        player.draw(screen, 0)
+        outer_rect = player.outer_rect
+
+        player.x += 100
+        player.draw(screen, 0)
+
+        assert player.outer_rect is outer_rect
+        assert player.outer_rect.centerx == int(800 * (player.x / config.SCREEN_WIDTH))
+
+    def test_slider_handle_follows_value(self):
+        slider = Slider(800, 60, 500, 80, 0, 100, 0)
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        slider.draw(screen)
+        start = slider.slider_rect.centerx
+
+        slider.relative_position = 1.0
+        slider.draw(screen)
+
+        assert slider.slider_rect.centerx > start
@@ -0,0 +1,104 @@
+import pytest
+import pygame
+import numpy as np
+
+from unittest.mock import Mock, patch
+
+from game.engine import Engine
+from game.player import Player
+from game.floor import Floor
+from game.spatial_grid import CellColumns, SpatialGrid, build_cell_columns
+
+from config import config
+
+class TestSpatialGrid:
+    @pytest.fixture
+    def setup(self):
+        floor = Mock(spec=Floor)
+        floor.floor_y = config.FLOOR_Y
+
+        engine = Engine(floor)
+
+        player = Mock(spec=Player)
+        player.x = config.PLAYER_START_X
+        player.y = config.FLOOR_Y - config.PLAYER_OUTER_SIZE // 2
+        player.velocity_y = 0
+        player.on_ground = True
+        player.outer_rect = pygame.Rect(0, 0, config.PLAYER_OUTER_SIZE, config.PLAYER_OUTER_SIZE)
+        player.outer_rect.center = (player.x, player.y)
+
+        return engine, player
+
+    def test_query_returns_only_nearby_items(self):
+        grid = SpatialGrid(60)
+        grid.insert("a", 0, 0, 60, 60)
+        grid.insert("b", 600, 0, 660, 60)
+
+        assert grid.query(10, 10, 50, 50) == ["a"]
+        assert grid.query(590, 10, 610, 50) == ["b"]
+        assert grid.query(200, 10, 260, 50) == []
+
+    def test_query_has_no_duplicates_and_keeps_insert_order(self):
+        grid = SpatialGrid(60)
+        grid.insert("a", 0, 0, 120, 120)
+        grid.insert("b", 30, 30, 90, 90)
+
+        assert grid.query(0, 0, 120, 120) == ["a", "b"]
+
+    def test_query_includes_touching_edges(self):
+        grid = SpatialGrid(60)
+        grid.insert("a", 60, 60, 120, 120)
+
+        assert grid.query(0, 0, 60, 60) == ["a"]
+
+    def test_cell_columns_match_insert(self):
+        rects = np.array([(0, 0, 120, 120), (30, 30, 90, 90), (-130, 600, 50, 660), (5000, -70, 5060, -10)]).T
+
+        grid = SpatialGrid(60)
+        for index, (left, top, right, bottom) in enumerate(rects.T.tolist()):
+            grid.insert(index, left, top, right, bottom)
+
+        cells = CellColumns(*build_cell_columns(rects[0], rects[1], rects[2], rects[3], 60))
+        assert cells.to_dict() == grid.cells
+
+        columnar = SpatialGrid(60)
+        columnar.set_cells(list(range(4)), cells)
+        assert columnar.query(0, 0, 120, 120) == grid.query(0, 0, 120, 120) == [0, 1]
+        assert columnar.query(-100, 610, -90, 620) == [2]
+        assert columnar.query(2000, 0, 2010, 10) == []
+
+    def test_set_objects_from_layout_builds_grid(self, setup):
+        engine, _ = setup
+
+        engine.set_objects_from_layout([
+            {"type": "block", "x": 330, "y": 690},
+            {"type": "block", "x": 3330, "y": 690},
+            {"type": "spike", "x": 3390, "y": 690}
+        ])
+
+        # Siatka zawiera tylko kolidery bloków; kolce są na osi czasu obiektów wyzwalanych
+        assert len(engine.spatial_grid) == 2
+        assert engine.spatial_grid.query(300, 660, 360, 720)[0].left == 300
+        assert engine.spatial_grid.query(3300, 660, 3360, 720)[0].left == 3300
+        assert engine.spatial_grid.query(1000, 660, 1060, 720) == []
+
+    def test_block_top_collision_uses_grid(self, setup):
+        engine, player = setup
+
+        engine.set_objects_from_layout([{"type": "block", "x": 120, "y": 480}])
+
+        player.x, player.y = 120, 440
+        player.velocity_y = 100
+
+        assert engine._check_block_collision_top(player, player.y) == 450
+
+    def test_query_cost_independent_of_level_length(self, setup):
+        engine, player = setup
+
+        layout = [{"type": "block", "x": 30 + i * 60, "y": 390} for i in range(5000)]
+        engine.set_objects_from_layout(layout)
+
+        player.x, player.y = 150030, 360
+
+        with patch.object(engine, 'objects', []):
+            assert engine._check_block_collision_top(player, 360) == 360
@@ -0,0 +1,65 @@
+import pytest
+
+from unittest.mock import Mock, patch
+
+from game.engine import Engine
+from game.floor import Floor
+from game.simulation_state import SimulationState
+
+from objects.spike import Spike
+
+from config import config
+
+class TestSpikeCollider:
+    @pytest.fixture
+    def spike(self):
+        spike = Spike(300, 690)
+        spike.build_collider()
+        return spike
+
+    def test_collider_bounds(self, spike):
+        assert spike.collider_bounds == (270, 660, 330, 720)
+
+    @pytest.mark.parametrize("point, inside", [
+        ((300, 690), True),
+        ((300, 660), True),   # wierzchołek
+        ((270, 720), True),   # róg podstawy
+        ((285, 690), True),   # na krawędzi
+        ((284, 690), False),
+        ((300, 659), False),
+        ((300, 721), False)
+    ])
+    def test_edge_function_point_test(self, spike, point, inside):
+        assert Engine._is_point_inside_edges(spike.collider_edges, *point) == inside
+
+    def test_layout_builds_colliders_once(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout([{"type": "spike", "x": 330, "y": 690}])
+
+        # Kolider ustawiany z kolumn krawędzi skompilowanego poziomu przy pierwszym odczycie z osi czasu
+        spike = engine.compiled_level.triggers[0]
+
+        assert spike is engine.objects[0]
+        assert spike.collider_edges is not None
+
+        state = SimulationState(300, 690)
+        with patch.object(Spike, 'build_collider') as build_collider, \
+                patch.object(Spike, 'get_world_points') as get_world_points:
+            assert engine._check_spike_collision(state, spike, 300.0)
+            assert not engine._check_spike_collision(state, spike, 200.0)
+
+        build_collider.assert_not_called()
+        get_world_points.assert_not_called()
+
+    def test_compiled_collider_matches_build_collider(self):
+        positions = [(330, 690), (-90, 630), (123450, 2147483647)]
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout([{"type": "spike", "x": x, "y": y} for x, y in positions])
+
+        for spike in engine.compiled_level.triggers:
+            expected = Spike(spike.x, spike.y)
+            expected.build_collider()
+
+            assert spike.collider_bounds == expected.collider_bounds
+            assert spike.collider_edges == expected.collider_edges
+
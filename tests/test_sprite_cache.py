@@ -0,0 +1,44 @@
+import pytest
+import pygame
+
+from objects.sprite_cache import SpriteCache
+from objects.block import Block
+
+from config import config
+
+class TestSpriteCache:
+    @pytest.fixture
+    def cache(self):
+        return SpriteCache()
+
+    def test_blit_matches_direct_draw(self, cache):
+        screen = pygame.Surface((800, 450))
+        reference = pygame.Surface((800, 450))
+
+        cache.update(screen)
+        screen.blit(*cache.get_blit("Block", 400, 300))
+        Block(400, 300).draw(reference)
+
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(reference, "RGB")
+
+    def test_rebuilds_only_on_size_change(self, cache):
+        cache.update(pygame.Surface((800, 450)))
+        sprites = cache.sprites
+
+        cache.update(pygame.Surface((800, 450)))
+        assert cache.sprites is sprites
+
+        cache.update(pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)))
+        assert cache.sprites is not sprites
+        assert cache.scale_x == 1.0
+
+    def test_invalidate(self, cache):
+        cache.update(pygame.Surface((800, 450)))
+        cache.invalidate()
+
+        assert cache.sprites == {}
+        assert cache.screen_size is None
+
+    def test_invalid_screen(self, cache):
+        with pytest.raises(ValueError, match="screen musi być instancją pygame.Surface"):
+            cache.update("screen")
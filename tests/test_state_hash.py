@@ -0,0 +1,105 @@
+import pytest
+
+from game.engine import Engine
+from game.floor import Floor
+from game.level_segments import SegmentedLevel, write_segmented_level
+from game.replay import ReplayRecorder, layout_hash, play_replay
+from game.state_hash import StateHashLog, first_divergence
+
+from config import config
+
+LAYOUT = [
+    {"type": "block", "x": 630, "y": 390},
+    {"type": "jump_pad", "x": 1230, "y": 690},
+    {"type": "jump_orb", "x": 1530, "y": 510},
+    {"type": "block", "x": 6030, "y": 390}
+]
+
+class TestStateHash:
+    @pytest.fixture
+    def engine(self):
+        engine = Engine(Floor(config.FLOOR_Y))
+        engine.set_objects_from_layout(LAYOUT)
+        return engine
+
+    @staticmethod
+    def _replay(inputs):
+        recorder = ReplayRecorder(layout_hash(LAYOUT))
+        for jump_pressed in inputs:
+            recorder.record(jump_pressed)
+        return recorder.replay
+
+    @staticmethod
+    def _log(hashes):
+        log = StateHashLog()
+        log.hashes.extend(hashes)
+        return log
+
+    def test_engine_step_appends_one_hash_per_tick(self, engine):
+        engine.state_hash_log = StateHashLog()
+        state = engine.create_state()
+
+        for _ in range(100):
+            engine.step(state, False)
+
+        assert len(engine.state_hash_log) == 100
+
+    def test_same_replay_gives_same_stream(self, engine):
+        replay = self._replay([tick % 80 < 3 for tick in range(2000)])
+
+        first, second = StateHashLog(), StateHashLog()
+        play_replay(replay, LAYOUT, engine, first)
+        play_replay(replay, LAYOUT, hash_log=second)
+
+        assert len(first) > 0
+        assert first.hashes == second.hashes
+        assert first_divergence(first, second) is None
+        assert engine.state_hash_log is None
+
+    def test_finds_first_changed_tick(self, engine):
+        inputs = [False] * 2000
+        changed = list(inputs)
+        changed[100] = True
+
+        first, second = StateHashLog(), StateHashLog()
+        play_replay(self._replay(inputs), LAYOUT, engine, first)
+        play_replay(self._replay(changed), LAYOUT, engine, second)
+
+        assert first_divergence(first, second) == 100
+
+    def test_segmented_level_gives_same_stream(self, tmp_path):
+        # Segmenty są wczytywane i zwalniane w trakcie przebiegu - kursor obiektów wyzwalanych różni się od pełnego poziomu
+        layout = [{"type": "jump_pad", "x": x, "y": 690} for x in range(1230, 12000, 900)]
+        path = str(tmp_path / "long.gds")
+        write_segmented_level(path, layout, 600)
+
+        full = Engine(Floor(config.FLOOR_Y))
+        full.set_objects_from_layout(layout)
+        streamed = Engine(Floor(config.FLOOR_Y))
+        streamed.set_objects_from_segments(SegmentedLevel(path))
+
+        for engine in (full, streamed):
+            engine.state_hash_log = StateHashLog()
+            state = engine.create_state()
+            for _ in range(config.PHYSICS_TICK_RATE * 20):
+                if engine.step(state, False):
+                    break
+
+        assert len(full.state_hash_log) > config.PHYSICS_TICK_RATE * 10
+        assert first_divergence(full.state_hash_log, streamed.state_hash_log) is None
+
+    def test_hashes_are_chained(self):
+        assert first_divergence(self._log([1, 2, 3, 4]), self._log([1, 2, 9, 9])) == 2
+        assert first_divergence(self._log([1, 2, 3]), self._log([1, 2, 3, 4])) == 3
+        assert first_divergence(self._log([]), self._log([])) is None
+
+    def test_bytes_round_trip(self, tmp_path):
+        log = self._log([0, 1, 0xFFFFFFFF])
+        path = str(tmp_path / "run.gdh")
+
+        log.save(path)
+
+        assert StateHashLog.load(path).hashes == log.hashes
+
+        with pytest.raises(ValueError, match="Uszkodzony plik skrótów stanu"):
+            StateHashLog.from_bytes(log.to_bytes()[:-4])
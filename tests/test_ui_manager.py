@@ -0,0 +1,133 @@
+import pytest
+import pygame
+
+from unittest.mock import Mock, patch
+
+from config import config
+from config.enums import WindowState
+
+from ui.ui_manager import UIManager
+from game.player import Player
+from game.floor import Floor
+from game.engine import Engine
+from game.level_editor import LevelEditor
+
+class TestFrozenFrame:
+    @pytest.fixture
+    def setup(self):
+        ui_manager = UIManager()
+        ui_manager.window = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+        player = Mock(spec=Player)
+        floor = Mock(spec=Floor)
+        level_editor = Mock(spec=LevelEditor)
+        engine = Mock(spec=Engine)
+        engine.camera_offset_x = 0
+
+        with patch('pygame.display.update'):
+            yield ui_manager, player, floor, level_editor, engine
+
+    def test_pause_scene_rendered_once(self, setup):
+        ui_manager, player, floor, level_editor, engine = setup
+
+        for _ in range(5):
+            ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+
+        assert engine.draw_objects.call_count == 1
+        assert player.draw.call_count == 1
+
+    def test_pause_scene_rebuilt_on_resize_and_reentry(self, setup):
+        ui_manager, player, floor, level_editor, engine = setup
+
+        ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+        ui_manager.window = pygame.Surface((800, 450))
+        ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+
+        assert engine.draw_objects.call_count == 2
+        assert ui_manager.frozen_frame.get_size() == (800, 450)
+
+        ui_manager.render(WindowState.GAME, player, floor, level_editor, engine)
+        assert ui_manager.frozen_frame is None
+
+        ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+        assert engine.draw_objects.call_count == 4
+
+    def test_edit_confirm_scene_rendered_once(self, setup):
+        ui_manager, player, floor, level_editor, engine = setup
+
+        for _ in range(5):
+            ui_manager.render(WindowState.EDIT_CONFIRM, player, floor, level_editor, engine)
+
+        assert level_editor.render.call_count == 1
+
+    def test_frozen_frame_matches_direct_render(self, setup):
+        ui_manager, player, floor, level_editor, engine = setup
+        player.draw.side_effect = lambda window, offset: pygame.draw.rect(window, (200, 0, 0), (100, 100, 60, 60))
+
+        ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+        first = pygame.image.tobytes(ui_manager.window, "RGB")
+
+        ui_manager.render(WindowState.PAUSE, player, floor, level_editor, engine)
+        assert pygame.image.tobytes(ui_manager.window, "RGB") == first
+
+class TestDirtyRender:
+    @pytest.fixture
+    def setup(self):
+        pygame.font.init()
+
+        ui_manager = UIManager()
+        ui_manager.window = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+        ui_manager.menu_view_init()
+
+        args = (Mock(spec=Player), Mock(spec=Floor), Mock(spec=LevelEditor), Mock(spec=Engine))
+
+        with patch('pygame.mouse.get_pos', return_value=(0, 0)):
+            yield ui_manager, args
+
+    def test_idle_menu_has_no_dirty_rects(self, setup):
+        ui_manager, args = setup
+
+        assert ui_manager.render(WindowState.MENU, *args) == [ui_manager.window.get_rect()]
+        assert ui_manager.render(WindowState.MENU, *args) == []
+
+    def test_hover_redraws_only_button(self, setup):
+        ui_manager, args = setup
+        ui_manager.render(WindowState.MENU, *args)
+
+        with patch('pygame.mouse.get_pos', return_value=ui_manager.start_button.rect.center):
+            dirty_rects = ui_manager.render(WindowState.MENU, *args)
+
+        assert dirty_rects == [ui_manager.start_button.rect]
+
+    def test_label_text_change_covers_old_and_new_text(self, setup):
+        ui_manager, args = setup
+        ui_manager.render(WindowState.MENU, *args)
+        old_bounds = ui_manager.title_description_label.drawn_bounds
+
+        ui_manager.title_description_label.set_text("A much longer description")
+        dirty_rects = ui_manager.render(WindowState.MENU, *args)
+
+        assert len(dirty_rects) == 1
+        assert dirty_rects[0].contains(old_bounds)
+        assert dirty_rects[0].contains(ui_manager.title_description_label.drawn_bounds)
+
+    def test_partial_redraw_matches_full_redraw(self, setup):
+        ui_manager, args = setup
+        ui_manager.render(WindowState.MENU, *args)
+
+        ui_manager.title_description_label.set_text("Changed")
+        ui_manager.render(WindowState.MENU, *args)
+        partial = pygame.image.tobytes(ui_manager.window, "RGB")
+
+        ui_manager.dirty_screen_key = None
+        ui_manager.render(WindowState.MENU, *args)
+
+        assert pygame.image.tobytes(ui_manager.window, "RGB") == partial
+
+    def test_resize_triggers_full_redraw(self, setup):
+        ui_manager, args = setup
+        ui_manager.render(WindowState.MENU, *args)
+
+        ui_manager.window = pygame.Surface((800, 450))
+
+        assert ui_manager.render(WindowState.MENU, *args) == [ui_manager.window.get_rect()]
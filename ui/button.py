@@ -1,6 +1,8 @@
 import pygame
 
 from config import config
+from ui.font_cache import FontCache
+from ui.scale_context import ScaleContext
 
 class Button:
     def __init__(self,
@@ -37,7 +39,6 @@ class Button:
         self.text_size = text_size
         self.description_text = description_text
 
-        self.font = None
         self.scaled_text_size = None
         self.scaled_description_size = None
 
@@ -48,6 +49,13 @@ class Button:
 
         self.is_pressed = False
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
+        # Stan i obszar z ostatniego rysowania (dla renderowania brudnych prostokątów)
+        self.drawn_key = None
+        self.drawn_bounds = None
+
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
 
@@ -62,35 +70,57 @@ class Button:
 
         pygame.draw.rect(screen, current_color, self.rect, border_radius=4)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blits(self._get_text_blits(), False)
+
+        self.drawn_key = self._get_render_key()
+        self.drawn_bounds = self.get_bounds()
+
+    """Sprawdza, czy wygląd przycisku zmienił się od ostatniego rysowania."""
+    def is_dirty(self, screen: pygame.Surface) -> bool:
+        self._validate_draw_params(screen)
+
+        self._update_size(screen)
+        return self._get_render_key() != self.drawn_key
+
+    """Zwraca obszar zajmowany przez przycisk i jego napisy przy aktualnym rozmiarze okna."""
+    def get_bounds(self) -> pygame.Rect:
+        return self.rect.unionall([rect for _, rect in self._get_text_blits()])
+
+    def _get_text_blits(self) -> list:
+        text_surface = FontCache.render(self.text, self.scaled_text_size, self.text_color)
+        text_blits = [(text_surface, text_surface.get_rect(center=self.rect.center))]
 
         if self.description_text != "":
-            description_font = pygame.font.SysFont(None, self.scaled_description_size)
-            description_surface = description_font.render(self.description_text, True, self.text_color)
+            description_surface = FontCache.render(self.description_text, self.scaled_description_size, self.text_color)
 
             dx = self.scaled_width // 2.5 if self.description_text == "normal" else self.scaled_width // 2.4
             dy = self.scaled_height // 2.3
 
-            description_rect = description_surface.get_rect(center=(self.scaled_x - dx, self.scaled_y + dy))
-            screen.blit(description_surface, description_rect)
+            text_blits.append((description_surface, description_surface.get_rect(center=(self.scaled_x - dx, self.scaled_y + dy))))
+
+        return text_blits
+
+    def _get_render_key(self) -> tuple:
+        return tuple(self.rect), self.text, self.description_text, self.is_pressed, self.is_hovered()
 
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
+        # Geometria liczona jest tylko przy zmianie kontekstu skali (rozmiaru okna)
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
 
-        self.scaled_width = int(screen_width * (self.width / config.SCREEN_WIDTH))
-        self.scaled_height = int(screen_height * (self.height / config.SCREEN_HEIGHT))
-        self.scaled_x = int(screen_width * (self.x / config.SCREEN_WIDTH))
-        self.scaled_y = int(screen_height * (self.y / config.SCREEN_HEIGHT))
+    """Przelicza prostokąt i rozmiary czcionek dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        self.rect = pygame.Rect(0, 0, self.scaled_width, self.scaled_height)
-        self.rect.center = (self.scaled_x, self.scaled_y)
+        self.scaled_width = context.x(self.width)
+        self.scaled_height = context.y(self.height)
+        self.scaled_x, self.scaled_y = context.point(self.x, self.y)
 
-        self.scaled_text_size = int(screen_height * (self.text_size / config.SCREEN_HEIGHT))
-        self.scaled_description_size = int(self.scaled_text_size * 0.5)
+        self.rect = context.rect(self.x, self.y, self.width, self.height)
 
-        self.font = pygame.font.SysFont(None, self.scaled_text_size)
+        self.scaled_text_size = context.y(self.text_size)
+        self.scaled_description_size = int(self.scaled_text_size * 0.5)
 
     def is_hovered(self):
         return self.rect.collidepoint(pygame.mouse.get_pos())
@@ -1,6 +1,8 @@
 import pygame
 
 from config import config
+from ui.font_cache import FontCache
+from ui.scale_context import ScaleContext
 
 class Checkbox:
     def __init__(self,
@@ -32,12 +34,18 @@ class Checkbox:
 
         self.text_color = text_color
         self.text_size = text_size
-        self.font = pygame.font.SysFont(None, int(self.text_size))
-        self.scaled_text_size = None
+        self.scaled_text_size = int(self.text_size)
 
         self.checked = checked
         self.is_pressed = False
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
+        # Stan i obszar z ostatniego rysowania (dla renderowania brudnych prostokątów)
+        self.drawn_key = None
+        self.drawn_bounds = None
+
     """Rysowanie checkboxa i tekstu na ekranie."""
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
@@ -57,10 +65,25 @@ class Checkbox:
             inner_rect = self.rect.inflate(-self.rect.width * 0.4, -self.rect.height * 0.4)
             pygame.draw.rect(screen, self.check_color, inner_rect, border_radius=3)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = FontCache.render(self.text, self.scaled_text_size, self.text_color)
         text_rect = text_surface.get_rect(midleft=(self.rect.right + 20, self.rect.centery))
         screen.blit(text_surface, text_rect)
 
+        self.drawn_key = self._get_render_key()
+        self.drawn_bounds = self.rect.union(text_rect)
+
+    """Sprawdza, czy wygląd checkboxa zmienił się od ostatniego rysowania."""
+    def is_dirty(self, screen: pygame.Surface) -> bool:
+        self._validate_draw_params(screen)
+
+        self._update_size(screen)
+        return self._get_render_key() != self.drawn_key
+
+    """Zwraca obszar zajmowany przez checkbox i jego tekst przy aktualnym rozmiarze okna."""
+    def get_bounds(self) -> pygame.Rect:
+        text_surface = FontCache.render(self.text, self.scaled_text_size, self.text_color)
+        return self.rect.union(text_surface.get_rect(midleft=(self.rect.right + 20, self.rect.centery)))
+
     """Sprawdzanie, czy kursor znajduje się nad checkboxem."""
     def is_hovered(self):
         return self.rect.collidepoint(pygame.mouse.get_pos())
@@ -79,18 +102,24 @@ class Checkbox:
             self.is_pressed = False
 
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
+        # Geometria liczona jest tylko przy zmianie kontekstu skali (rozmiaru okna)
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
 
-        checkbox_size = int(screen_width * (self.size / config.SCREEN_WIDTH))
+    """Przelicza prostokąt i rozmiar czcionki dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        rect_x = int(screen_width * (self.x / config.SCREEN_WIDTH))
-        rect_y = int(screen_height * (self.y / config.SCREEN_HEIGHT))
+        checkbox_size = context.x(self.size)
 
         self.rect = pygame.Rect(0, 0, checkbox_size, checkbox_size)
-        self.rect.center = (rect_x, rect_y)
+        self.rect.center = context.point(self.x, self.y)
+
+        self.scaled_text_size = context.y(self.text_size)
 
-        self.scaled_text_size = int(screen_height * (self.text_size / config.SCREEN_HEIGHT))
-        self.font = pygame.font.SysFont(None, self.scaled_text_size)
+    def _get_render_key(self) -> tuple:
+        return tuple(self.rect), self.text, self.checked, self.is_pressed, self.is_hovered()
 
     @staticmethod
     def _validate_draw_params(screen: pygame.Surface):
@@ -0,0 +1,63 @@
+import pygame
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from config import config
+
+"""Wspólna dla całego procesu pamięć podręczna czcionek i wyrenderowanych napisów."""
+class FontCache:
+    # Rozmiar w pikselach -> czcionka systemowa
+    fonts: Dict[int, pygame.font.Font] = {}
+
+    # (tekst, rozmiar, kolor) -> powierzchnia z napisem; najdawniej używane są usuwane
+    texts: "OrderedDict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+    max_texts = config.TEXT_CACHE_SIZE
+
+    """Zwraca czcionkę o podanym rozmiarze, tworząc ją tylko przy pierwszym użyciu."""
+    @classmethod
+    def get_font(cls, size: int) -> pygame.font.Font:
+        """ Args:
+                size: Rozmiar czcionki w pikselach
+            Returns:
+                Czcionka pygame.font.SysFont(None, size)
+        """
+        size = int(size)
+
+        font = cls.fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(None, size)
+            cls.fonts[size] = font
+
+        return font
+
+    """Zwraca powierzchnię z wyrenderowanym napisem, renderując go tylko przy pierwszym użyciu."""
+    @classmethod
+    def render(cls, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """ Args:
+                text: Tekst do wyrenderowania
+                size: Rozmiar czcionki w pikselach
+                color: Kolor tekstu
+            Returns:
+                Powierzchnia z napisem (współdzielona - nie należy jej modyfikować)
+        """
+        key = (text, int(size), tuple(color))
+
+        surface = cls.texts.get(key)
+        if surface is not None:
+            cls.texts.move_to_end(key)
+            return surface
+
+        surface = cls.get_font(size).render(text, True, color)
+        cls.texts[key] = surface
+
+        while len(cls.texts) > cls.max_texts:
+            cls.texts.popitem(last=False)
+
+        return surface
+
+    """Usuwa wszystkie czcionki i napisy (np. po ponownej inicjalizacji pygame.font)."""
+    @classmethod
+    def clear(cls):
+        cls.fonts.clear()
+        cls.texts.clear()
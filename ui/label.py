@@ -1,6 +1,8 @@
 import pygame.font
 
 from config import config
+from ui.font_cache import FontCache
+from ui.scale_context import ScaleContext
 
 class Label:
     def __init__(self,
@@ -20,31 +22,66 @@ class Label:
         self.text_size = text_size
         self.text_color = text_color
 
-        self.font = pygame.font.SysFont(None, int(text_size))
+        self.font_size = int(text_size)
 
         self.rel_x = x
         self.rel_y = y
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
+        # Stan i obszar z ostatniego rysowania (dla renderowania brudnych prostokątów)
+        self.drawn_key = None
+        self.drawn_bounds = None
+
     """Rysowanie tekstu na ekranie."""
     def draw(self, screen):
         self._validate_draw_params(screen)
 
         self._update_size(screen)
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = FontCache.render(self.text, self.font_size, self.text_color)
         text_rect = text_surface.get_rect(center=(self.rel_x, self.rel_y))
         screen.blit(text_surface, text_rect)
 
-    """Aktualizacja wielkości guzika względem dynamicznie zmieniającej się rozdzielczości okna."""
+        self.drawn_key = self._get_render_key()
+        self.drawn_bounds = text_rect
+
+    """Sprawdza, czy wygląd labelu zmienił się od ostatniego rysowania."""
+    def is_dirty(self, screen: pygame.Surface) -> bool:
+        self._validate_draw_params(screen)
+
+        self._update_size(screen)
+        return self._get_render_key() != self.drawn_key
+
+    """Zwraca obszar zajmowany przez tekst przy aktualnym rozmiarze okna."""
+    def get_bounds(self) -> pygame.Rect:
+        return FontCache.render(self.text, self.font_size, self.text_color).get_rect(center=(self.rel_x, self.rel_y))
+
+    def _get_render_key(self) -> tuple:
+        return self.text, self.font_size, self.text_color, self.rel_x, self.rel_y
 
+    """Aktualizacja wielkości labelu względem rozdzielczości okna."""
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
+        # Geometria liczona jest tylko przy zmianie kontekstu skali (rozmiaru okna)
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
+
+    """Przelicza pozycję i rozmiar czcionki dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        self.rel_x = int(screen_width * (self.x / config.SCREEN_WIDTH))
-        self.rel_y = int(screen_height * (self.y / config.SCREEN_HEIGHT))
+        self.rel_x, self.rel_y = context.point(self.x, self.y)
+        self.font_size = max(24, int(context.x(self.text_size) * 0.8))
+
+    """Ustawienie pozycji labelu (w jednostkach logicznych)."""
+    def set_position(self, x: float, y: float):
+        self.x = x
+        self.y = y
 
-        text_size = int(int(screen_width * (self.text_size / config.SCREEN_WIDTH)) * 0.8)
-        self.font = pygame.font.SysFont(None, max(24, text_size))
+        if self.scale_context is not None:
+            self.rel_x, self.rel_y = self.scale_context.point(x, y)
 
     """Ustawienie tekstu labelu."""
     def set_text(self, text: str):
@@ -1,6 +1,7 @@
 import pygame
 
 from config import config
+from ui.scale_context import ScaleContext
 
 class ProgressBar:
     def __init__(self,
@@ -27,6 +28,9 @@ class ProgressBar:
         self.outer_rect = pygame.Rect(0, 0, self.width, self.height)
         self.progress_rect = pygame.Rect(0, 0, self.width, self.height)
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
 
@@ -36,29 +40,20 @@ class ProgressBar:
         pygame.draw.rect(screen, self.inner_color, self.progress_rect, border_radius=20)
 
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
-
-        scale_x = screen_width / config.SCREEN_WIDTH
-        scale_y = screen_height / config.SCREEN_HEIGHT
-
-        outer_width = int(self.width * scale_x)
-        outer_height = int(self.height * scale_y)
+        # Obramowanie liczone jest tylko przy zmianie kontekstu skali; wypełnienie zależy od wartości
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
 
-        center_x = int(self.x * scale_x)
-        center_y = int(self.y * scale_y)
+        fill_percentage = self.value / self.max_value
+        self.progress_rect.width = int(self.outer_rect.width * fill_percentage)
 
-        self.outer_rect = pygame.Rect(0, 0, outer_width, outer_height)
-        self.outer_rect.center = (center_x, center_y)
+    """Przelicza obramowanie paska dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        fill_percentage = self.value / self.max_value
-        progress_width = int(outer_width * fill_percentage)
-
-        self.progress_rect = pygame.Rect(
-            self.outer_rect.left,
-            self.outer_rect.top,
-            progress_width,
-            outer_height
-        )
+        self.outer_rect = context.rect(self.x, self.y, self.width, self.height)
+        self.progress_rect = pygame.Rect(self.outer_rect.left, self.outer_rect.top, 0, self.outer_rect.height)
 
     def get_percentage(self):
         return (self.value / self.max_value) * 100
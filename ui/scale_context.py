@@ -0,0 +1,62 @@
+import pygame
+
+from typing import Dict, Tuple
+
+from config import config
+
+"""Przeliczenie współrzędnych logicznych (SCREEN_WIDTH x SCREEN_HEIGHT) na piksele okna o danym rozmiarze."""
+class ScaleContext:
+    # Rozmiar okna -> kontekst; ten sam rozmiar zawsze daje ten sam obiekt, więc widżety porównują go przez "is"
+    contexts: Dict[Tuple[int, int], "ScaleContext"] = {}
+    max_contexts = 64
+
+    def __init__(self, width: int, height: int):
+        assert isinstance(width, int) and width > 0, "width musi być dodatnią liczbą całkowitą"
+        assert isinstance(height, int) and height > 0, "height musi być dodatnią liczbą całkowitą"
+
+        self.width = width
+        self.height = height
+        self.size = (width, height)
+
+        self.scale_x = width / config.SCREEN_WIDTH
+        self.scale_y = height / config.SCREEN_HEIGHT
+
+    """Zwraca wspólny kontekst dla podanego rozmiaru okna."""
+    @classmethod
+    def get(cls, size: Tuple[int, int]) -> "ScaleContext":
+        """ Args:
+                size: Rozmiar okna (szerokość, wysokość)
+            Returns:
+                ScaleContext dla tego rozmiaru
+        """
+        context = cls.contexts.get(size)
+        if context is None:
+            # Przeciąganie krawędzi okna tworzy wiele rozmiarów - stare konteksty nie są potrzebne
+            if len(cls.contexts) >= cls.max_contexts:
+                cls.contexts.clear()
+
+            context = cls(*size)
+            cls.contexts[size] = context
+
+        return context
+
+    """Skaluje współrzędną lub długość w osi X."""
+    def x(self, value: float) -> int:
+        return int(self.width * (value / config.SCREEN_WIDTH))
+
+    """Skaluje współrzędną lub długość w osi Y."""
+    def y(self, value: float) -> int:
+        return int(self.height * (value / config.SCREEN_HEIGHT))
+
+    """Skaluje punkt."""
+    def point(self, x: float, y: float) -> Tuple[int, int]:
+        return self.x(x), self.y(y)
+
+    """Zwraca przeskalowany prostokąt o środku w (x, y)."""
+    def rect(self, x: float, y: float, width: float, height: float) -> pygame.Rect:
+        rect = pygame.Rect(0, 0, self.x(width), self.y(height))
+        rect.center = self.point(x, y)
+        return rect
+
+    def __repr__(self):
+        return f"ScaleContext(width={self.width}, height={self.height})"
@@ -1,6 +1,7 @@
 import pygame
 
 from config import config
+from ui.scale_context import ScaleContext
 
 class Slider:
     def __init__(self,
@@ -39,6 +40,9 @@ class Slider:
         self.inner_rect = pygame.Rect(0, 0, self.width, self.height)
         self.slider_rect = pygame.Rect(0, 0, self.slider_size, self.slider_size)
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
 
@@ -73,32 +77,28 @@ class Slider:
             self.value = self.min_val + self.relative_position * (self.max_val - self.min_val)
 
     def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
-
-        scale_x = screen_width / config.SCREEN_WIDTH
-        scale_y = screen_height / config.SCREEN_HEIGHT
+        # Tor suwaka liczony jest tylko przy zmianie kontekstu skali; uchwyt zależy od wartości
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
 
-        outer_width = int(self.width * scale_x)
-        outer_height = int(self.height * scale_y)
-        slider_size_scaled = int(self.slider_size * scale_y)
+        min_x = self.outer_rect.left + self.slider_rect.width // 2 + 10
+        max_x = self.outer_rect.right - self.slider_rect.width // 2 - 10
 
-        center_x = int(self.x * scale_x)
-        center_y = int(self.y * scale_y)
+        self.slider_rect.center = (int(min_x + self.relative_position * (max_x - min_x)), self.outer_rect.centery)
 
-        self.outer_rect = pygame.Rect(0, 0, outer_width, outer_height)
-        self.outer_rect.center = (center_x, center_y)
+    """Przelicza prostokąty suwaka dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
 
-        self.inner_rect = pygame.Rect(0, 0, outer_width - slider_size_scaled, outer_height - slider_size_scaled)
-        self.inner_rect.center = (center_x, center_y)
+        slider_size_scaled = context.y(self.slider_size)
 
-        min_x = self.outer_rect.left + slider_size_scaled // 2 + 10
-        max_x = self.outer_rect.right - slider_size_scaled // 2 - 10
+        self.outer_rect = context.rect(self.x, self.y, self.width, self.height)
 
-        slider_x = int(min_x + self.relative_position * (max_x - min_x))
-        slider_y = self.outer_rect.centery
+        self.inner_rect = pygame.Rect(0, 0, self.outer_rect.width - slider_size_scaled, self.outer_rect.height - slider_size_scaled)
+        self.inner_rect.center = self.outer_rect.center
 
         self.slider_rect = pygame.Rect(0, 0, slider_size_scaled, slider_size_scaled)
-        self.slider_rect.center = (slider_x, slider_y)
 
     @staticmethod
     def _validate_draw_params(screen: pygame.Surface):
@@ -1,6 +1,8 @@
 import pygame
 
 from config import config
+from ui.font_cache import FontCache
+from ui.scale_context import ScaleContext
 
 class TextInputField:
     def __init__(self,
@@ -36,32 +38,52 @@ class TextInputField:
 
         self.text = text
         self.text_size = text_size
-        self.font = pygame.font.SysFont(None, int(text_size))
         self.text_color = text_color
         self.max_length = max_length
         self.active = False
 
+        # Kontekst skali, dla którego policzono aktualną geometrię
+        self.scale_context = None
+
+        # Stan i obszar z ostatniego rysowania (dla renderowania brudnych prostokątów)
+        self.drawn_key = None
+        self.drawn_bounds = None
+
     def draw(self, screen: pygame.Surface):
         self._validate_draw_params(screen)
 
         self._update_size(screen)
 
-        txt_surface = self.font.render(self.text, True, self.text_color)
+        txt_surface = FontCache.render(self.text, self.text_size, self.text_color)
         text_rect = txt_surface.get_rect(center=self.rect.center)
         screen.blit(txt_surface, text_rect)
         pygame.draw.rect(screen, self.color, self.rect, 5)
 
-    def _update_size(self, screen: pygame.Surface):
-        screen_width, screen_height = screen.get_size()
+        self.drawn_key = self._get_render_key()
+        self.drawn_bounds = self.rect.union(text_rect)
+
+    """Sprawdza, czy wygląd pola tekstowego zmienił się od ostatniego rysowania."""
+    def is_dirty(self, screen: pygame.Surface) -> bool:
+        self._validate_draw_params(screen)
 
-        rect_width = int(self.width * (screen_width / config.SCREEN_WIDTH))
-        rect_height = int(self.height * (screen_height / config.SCREEN_HEIGHT))
-        rect_x = int(screen_width * (self.x / config.SCREEN_WIDTH))
-        rect_y = int(screen_height * (self.y / config.SCREEN_HEIGHT))
+        self._update_size(screen)
+        return self._get_render_key() != self.drawn_key
+
+    """Zwraca obszar zajmowany przez pole i jego tekst przy aktualnym rozmiarze okna."""
+    def get_bounds(self) -> pygame.Rect:
+        text_surface = FontCache.render(self.text, self.text_size, self.text_color)
+        return self.rect.union(text_surface.get_rect(center=self.rect.center))
 
-        self.rect = pygame.Rect(0, 0, rect_width, rect_height)
-        self.rect.center = (rect_x, rect_y)
-        self.font = pygame.font.SysFont(None, int(self.text_size))
+    def _update_size(self, screen: pygame.Surface):
+        # Geometria liczona jest tylko przy zmianie kontekstu skali (rozmiaru okna)
+        context = ScaleContext.get(screen.get_size())
+        if context is not self.scale_context:
+            self.apply_scale(context)
+
+    """Przelicza prostokąt pola dla podanego kontekstu skali."""
+    def apply_scale(self, context: ScaleContext):
+        self.scale_context = context
+        self.rect = context.rect(self.x, self.y, self.width, self.height)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -80,6 +102,9 @@ class TextInputField:
             elif len(self.text) < self.max_length and event.unicode.isalnum():
                 self.text += event.unicode
 
+    def _get_render_key(self) -> tuple:
+        return tuple(self.rect), self.text, self.color
+
     @staticmethod
     def _validate_draw_params(screen: pygame.Surface):
         if not isinstance(screen, pygame.Surface):
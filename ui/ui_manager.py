@@ -13,8 +13,11 @@ from ui.button import Button
 from ui.text_input_field import TextInputField
 from ui.checkbox import Checkbox
 from ui.progress_bar import ProgressBar
+from ui.scale_context import ScaleContext
 
 class UIManager:
+    DIRTY_RENDER_STATES = (WindowState.MENU, WindowState.SELECT, WindowState.SAVE_PROMPT, WindowState.LOAD_PROMPT, WindowState.LEVEL_COMPLETE)
+
     def __init__(self):
         self.window = None
 
@@ -101,6 +104,15 @@ class UIManager:
         self.level_complete_back_button = None
         self.level_complete_retry_button = None
 
+        # [FROZEN FRAME]
+        # Zrzut zamrożonej sceny z przyciemnieniem dla PAUSE i EDIT_CONFIRM
+        self.frozen_frame = None
+        self.last_window_state = None
+
+        # [DIRTY RECTS]
+        # Ekran (stan, rozmiar okna, widżety) narysowany ostatnio w trybie brudnych prostokątów
+        self.dirty_screen_key = None
+
         self.screen_width = config.SCREEN_WIDTH
         self.screen_height = config.SCREEN_HEIGHT
 
@@ -108,7 +120,10 @@ class UIManager:
 
         self.levels = levels
 
-        self.window = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+        # W trybie logicznego płótna powierzchnia okna ma zawsze rozmiar SCREEN_WIDTH x SCREEN_HEIGHT,
+        # a skalowanie do rzeczywistego okna wykonuje SDL jednym przebiegiem
+        flags = pygame.RESIZABLE | pygame.SCALED if config.LOGICAL_CANVAS else pygame.RESIZABLE
+        self.window = pygame.display.set_mode((self.screen_width, self.screen_height), flags)
 
         self.menu_view_init()
         self.pause_view_init()
@@ -396,78 +411,134 @@ class UIManager:
         for component in self.game_components:
             component.draw(self.window)
 
-    def render(self, window_state: WindowState, player: Player, floor: Floor, level_editor: LevelEditor, engine: Engine):
-        assert isinstance(window_state, WindowState), "window_state musi być obiektem instancji WindowState"
-        assert isinstance(player, Player), "player musi być instancją klasy Player"
-        assert isinstance(floor, Floor), "floor musi być instancją klasy Floor"
-        assert isinstance(level_editor, LevelEditor), "level_editor musi być instancją klasy LevelEditor"
+    """Przekazuje kontekst skali wszystkim zarejestrowanym widżetom."""
+    def apply_scale(self, context: ScaleContext):
+        for component in self.get_all_components():
+            component.apply_scale(context)
 
+    """Zwraca wszystkie widżety ze wszystkich ekranów."""
+    def get_all_components(self) -> list:
+        components = (self.menu_components + self.pause_components + self.game_components +
+                      self.select_components + self.edit_components + self.save_components +
+                      self.load_components + self.level_complete_components +
+                      [self.coordinate_x_label, self.coordinate_y_label, self.floor_y_label, self.level_button] +
+                      [level_button for level_button, level in self.level_info_buttons])
+
+        return [component for component in components if component is not None]
+
+    """Zwraca widżety rysowane na ekranie danego stanu, w kolejności rysowania."""
+    def get_screen_components(self, window_state: WindowState) -> list:
         if window_state == WindowState.MENU:
-            self.window.fill(config.BACKGROUND_COLOR)
+            return self.menu_components
+        if window_state == WindowState.SELECT:
+            return self.select_components + [self.level_button]
+        if window_state == WindowState.SAVE_PROMPT:
+            return self.save_components
+        if window_state == WindowState.LOAD_PROMPT:
+            return self.load_components + [level_button for level_button, level in self.level_info_buttons]
+        if window_state == WindowState.LEVEL_COMPLETE:
+            return self.level_complete_components
+
+        return []
+
+    """Przerysowuje tylko obszary widżetów, których wygląd się zmienił; zwraca prostokąty do pygame.display.update."""
+    def dirty_render(self, window_state: WindowState, components: list, background_color: tuple) -> list:
+        # Nowy ekran, zmiana rozmiaru okna lub inny zestaw widżetów - pełne przerysowanie
+        screen_key = (window_state, self.window.get_size(), tuple(id(component) for component in components))
+        if screen_key != self.dirty_screen_key:
+            self.dirty_screen_key = screen_key
 
-            for component in self.menu_components:
+            self.window.fill(background_color)
+            for component in components:
                 component.draw(self.window)
 
-        if window_state == WindowState.GAME:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+            return [self.window.get_rect()]
 
-            self.game_components_render(player, floor, level_editor, engine)
+        dirty_rects = []
+        for component in components:
+            if component.is_dirty(self.window):
+                dirty_rect = component.get_bounds()
+                if component.drawn_bounds is not None:
+                    dirty_rect = dirty_rect.union(component.drawn_bounds)
+                dirty_rects.append(dirty_rect)
 
-        if window_state == WindowState.PAUSE:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+        # Obszar czyszczony jest tłem, a wszystkie nachodzące na niego widżety rysowane w pierwotnej kolejności
+        for dirty_rect in dirty_rects:
+            self.window.set_clip(dirty_rect)
+            self.window.fill(background_color)
 
-            self.game_components_render(player, floor, level_editor, engine)
+            for component in components:
+                if component.get_bounds().colliderect(dirty_rect):
+                    component.draw(self.window)
+
+        self.window.set_clip(None)
+
+        return dirty_rects
+
+    """Rysuje zamrożoną scenę pod nakładką; scena jest składana tylko po wejściu w stan lub zmianie rozmiaru okna."""
+    def frozen_frame_render(self, window_state: WindowState, player: Player, floor: Floor, level_editor: LevelEditor, engine: Engine):
+        if (self.frozen_frame is None
+                or window_state != self.last_window_state
+                or self.frozen_frame.get_size() != self.window.get_size()):
+
+            if window_state == WindowState.PAUSE:
+                self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+                self.game_components_render(player, floor, level_editor, engine)
+            else:
+                self.window.fill(tuple(int(c * 1.2) for c in config.BACKGROUND_COLOR))
+                level_editor.render()
 
             transparent_surface = pygame.Surface(self.window.get_size(), pygame.SRCALPHA)
             transparent_surface.fill(config.BACKGROUND_PAUSE_COLOR)
             self.window.blit(transparent_surface, (0, 0))
 
-            for component in self.pause_components:
-                component.draw(self.window)
+            self.frozen_frame = self.window.copy()
+            return
 
-        if window_state == WindowState.SELECT:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+        self.window.blit(self.frozen_frame, (0, 0))
 
-            for component in self.select_components:
-                component.draw(self.window)
+    def render(self, window_state: WindowState, player: Player, floor: Floor, level_editor: LevelEditor, engine: Engine):
+        assert isinstance(window_state, WindowState), "window_state musi być obiektem instancji WindowState"
+        assert isinstance(player, Player), "player musi być instancją klasy Player"
+        assert isinstance(floor, Floor), "floor musi być instancją klasy Floor"
+        assert isinstance(level_editor, LevelEditor), "level_editor musi być instancją klasy LevelEditor"
 
-            self.level_button.draw(self.window)
+        # Ekrany menu i okien dialogowych rysują tylko zmienione widżety
+        if window_state in self.DIRTY_RENDER_STATES:
+            components = self.get_screen_components(window_state)
+            background_color = config.BACKGROUND_COLOR if window_state == WindowState.MENU else tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR)
 
-        if window_state == WindowState.EDIT:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
-            level_editor.render()
+            self.frozen_frame = None
+            self.last_window_state = window_state
 
-        if window_state == WindowState.EDIT_CONFIRM:
-            self.window.fill(tuple(int(c * 1.2) for c in config.BACKGROUND_COLOR))
-            level_editor.render()
+            return self.dirty_render(window_state, components, background_color)
 
-            transparent_surface = pygame.Surface(self.window.get_size(), pygame.SRCALPHA)
-            transparent_surface.fill(config.BACKGROUND_PAUSE_COLOR)
+        self.dirty_screen_key = None
 
-            self.window.blit(transparent_surface, (0, 0))
+        if window_state == WindowState.GAME:
+            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
 
-            for component in self.edit_components:
-                component.draw(self.window)
+            self.game_components_render(player, floor, level_editor, engine)
 
-        if window_state == WindowState.SAVE_PROMPT:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+        if window_state == WindowState.PAUSE:
+            self.frozen_frame_render(window_state, player, floor, level_editor, engine)
 
-            for component in self.save_components:
+            for component in self.pause_components:
                 component.draw(self.window)
 
-        if window_state == WindowState.LOAD_PROMPT:
+        if window_state == WindowState.EDIT:
             self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
+            level_editor.render()
 
-            for component in self.load_components:
+        if window_state == WindowState.EDIT_CONFIRM:
+            self.frozen_frame_render(window_state, player, floor, level_editor, engine)
+
+            for component in self.edit_components:
                 component.draw(self.window)
 
-            for level_button, level in self.level_info_buttons:
-                level_button.draw(self.window)
+        if window_state not in (WindowState.PAUSE, WindowState.EDIT_CONFIRM):
+            self.frozen_frame = None
 
-        if window_state == WindowState.LEVEL_COMPLETE:
-            self.window.fill(tuple(int(c * 0.8) for c in config.BACKGROUND_COLOR))
-
-            for component in self.level_complete_components:
-                component.draw(self.window)
+        self.last_window_state = window_state
 
-        pygame.display.update()
\ No newline at end of file
+        return [self.window.get_rect()]